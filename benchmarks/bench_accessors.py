@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+"""
+Compare the time to get the values of a 10,000 row by 10 column table when
+every cell's field spec is parsed again (as get_model_field used to do) with
+using the column accessors that BrowseView.get_column_accessors() compiles
+once.
+
+The objects are made in memory, so no database time is included.
+
+Run from the top of the repository:
+
+    python benchmarks/bench_accessors.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from django import setup  # noqa: E402
+
+import runtests  # noqa: E402,F401 (configures settings)
+
+setup()
+
+from bread.bread import BrowseView  # noqa: E402
+from tests.models import (  # noqa: E402
+    BreadLabelValueTestModel,
+    BreadTestModel,
+    BreadTestModel2,
+)
+
+SPECS = [
+    "id",
+    "name",
+    "age",
+    "get_name",
+    "__str__",
+    "other__id",
+    "other__text",
+    "other__get_text",
+    "other__label_model__name",
+    "other__label_model__name_reversed",
+]
+
+
+class BenchBrowseView(BrowseView):
+    columns = [(spec, spec) for spec in SPECS]
+
+
+def parse_every_time(model_instance, spec):
+    # get_model_field as it was before the accessors
+    if spec.startswith("__") and spec.endswith("__"):
+        name_parts = [spec]
+    else:
+        name_parts = spec.split("__", 1)
+    value = getattr(model_instance, name_parts[0])
+    if callable(value):
+        value = value()
+    if len(name_parts) > 1 and value is not None:
+        return parse_every_time(value, name_parts[1])
+    return value
+
+
+def main(rows=10000):
+    objects = []
+    for i in range(rows):
+        label_model = BreadLabelValueTestModel(id=i, name="label%d" % i)
+        other = BreadTestModel2(id=i, text="text%d" % i, label_model=label_model)
+        objects.append(BreadTestModel(id=i, name="name%d" % i, age=i, other=other))
+
+    def uncompiled():
+        return [[parse_every_time(obj, spec) for spec in SPECS] for obj in objects]
+
+    def compiled():
+        accessors = BenchBrowseView.get_column_accessors(BreadTestModel)
+        return [[accessor(obj) for accessor in accessors] for obj in objects]
+
+    assert uncompiled() == compiled()
+    for name, func in [("parsed per cell", uncompiled), ("compiled", compiled)]:
+        seconds = min(timeit.repeat(func, number=1, repeat=5))
+        print("%-20s %8.1f ms per table" % (name, seconds * 1e3))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""
+Compare the time to render the cells of a 200 row by 10 column browse table
+when each cell is looked up in the template with the ``getter`` filter (as the
+browse template used to do) with rendering the ``rows`` that BrowseView puts
+in the context, whose cells are worked out in Python.
+
+The objects are made in memory, so no database time is included.
+
+Run from the top of the repository:
+
+    python benchmarks/bench_browse_rows.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from django import setup  # noqa: E402
+
+import runtests  # noqa: E402,F401 (configures settings)
+
+setup()
+
+from django.template import Context, Template  # noqa: E402
+
+from bread.bread import BrowseRow, BrowseView  # noqa: E402
+from tests.models import (  # noqa: E402
+    BreadLabelValueTestModel,
+    BreadTestModel,
+    BreadTestModel2,
+)
+
+SPECS = [
+    "id",
+    "name",
+    "age",
+    "get_name",
+    "__str__",
+    "other__id",
+    "other__text",
+    "other__get_text",
+    "other__label_model__name",
+    "other__label_model__name_reversed",
+]
+
+GETTER_TEMPLATE = Template(
+    "{% load bread_tags %}"
+    "{% for object in object_list %}<tr>"
+    "{% for col in columns %}<td>{{ object|getter:col.1 }}</td>{% endfor %}"
+    "</tr>{% endfor %}"
+)
+
+ROWS_TEMPLATE = Template(
+    "{% for row in rows %}<tr>"
+    "{% for value in row.cells %}<td>{{ value }}</td>{% endfor %}"
+    "</tr>{% endfor %}"
+)
+
+
+class BenchBrowseView(BrowseView):
+    columns = [(spec, spec) for spec in SPECS]
+
+
+def main(rows=200, number=20):
+    objects = []
+    for i in range(rows):
+        label_model = BreadLabelValueTestModel(id=i, name="label%d" % i)
+        other = BreadTestModel2(id=i, text="text%d" % i, label_model=label_model)
+        objects.append(BreadTestModel(id=i, name="name%d" % i, age=i, other=other))
+
+    def getter_cells():
+        context = Context({"object_list": objects, "columns": BenchBrowseView.columns})
+        return GETTER_TEMPLATE.render(context)
+
+    def rows_cells():
+        accessors = BenchBrowseView.get_column_accessors(BreadTestModel)
+        rows = [BrowseRow(None, obj, accessors) for obj in objects]
+        return ROWS_TEMPLATE.render(Context({"rows": rows}))
+
+    assert getter_cells() == rows_cells()
+    for name, func in [("getter filter", getter_cells), ("rows", rows_cells)]:
+        seconds = min(timeit.repeat(func, number=number, repeat=3))
+        print("%-20s %8.2f ms per page" % (name, seconds / number * 1e3))
+
+
+if __name__ == "__main__":
+    main()
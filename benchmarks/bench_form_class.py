@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+"""
+Compare the time to make the default form for a read view when the form
+class is made for every request (as Bread used to do) with reusing the form
+class that BreadViewMixin.get_default_form_class() caches.
+
+Run from the top of the repository:
+
+    python benchmarks/bench_form_class.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from django import setup  # noqa: E402
+
+import runtests  # noqa: E402,F401 (configures settings)
+
+setup()
+
+from django.forms.models import modelform_factory  # noqa: E402
+
+from bread.bread import Bread, ReadView  # noqa: E402
+from tests.models import BreadTestModel  # noqa: E402
+
+
+class BenchBread(Bread):
+    model = BreadTestModel
+
+
+def main(number=10000):
+    bread = BenchBread()
+    view = ReadView(bread=bread, model=BreadTestModel)
+
+    def uncached():
+        form_class = modelform_factory(BreadTestModel, fields="__all__")
+        return form_class()
+
+    def cached():
+        return view.get_form()
+
+    for name, func in [("modelform_factory per request", uncached), ("cached", cached)]:
+        seconds = min(timeit.repeat(func, number=number, repeat=3))
+        print("%-30s %8.1f us per form" % (name, seconds / number * 1e6))
+
+
+if __name__ == "__main__":
+    main()
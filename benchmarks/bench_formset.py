@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+"""
+Compare adding records by posting each one to the add view with adding them
+all at once with the add view's formset mode: the number of requests, and
+the time and number of queries per record, for a model with unique fields.
+
+Uses an in-memory SQLite database. Django's DATA_UPLOAD_MAX_NUMBER_FIELDS
+setting limits a request to 1000 fields, so at most 333 rows of this model's
+three fields. Run from the top of the repository:
+
+    python benchmarks/bench_formset.py [rows]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from django import setup  # noqa: E402
+
+import runtests  # noqa: E402,F401 (configures settings)
+
+setup()
+
+from django.contrib.auth import get_user_model  # noqa: E402
+from django.core.management import call_command  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test import RequestFactory  # noqa: E402
+from django.urls import set_urlconf  # noqa: E402
+
+from bread.bread import AddView, Bread  # noqa: E402
+from tests.models import BreadUniqueTestModel  # noqa: E402
+
+
+class FormsetAddView(AddView):
+    formset = True
+    formset_max_num = 1000
+
+
+class UniqueBread(Bread):
+    model = BreadUniqueTestModel
+
+
+class FormsetBread(UniqueBread):
+    add_view = FormsetAddView
+
+
+class URLConf(object):
+    urlpatterns = []
+
+
+def make_row(i):
+    return {"code": "c%d" % i, "name": "n%d" % i, "year": 2000 + i % 100}
+
+
+def run(label, view, requests, rows):
+    queries = []
+    with connection.execute_wrapper(
+        lambda execute, *args: queries.append(None) or execute(*args)
+    ):
+        start = time.perf_counter()
+        for request in requests:
+            assert view(request).status_code == 302
+        seconds = time.perf_counter() - start
+    assert BreadUniqueTestModel.objects.count() == rows
+    print(
+        "%-12s %6d rows %6d requests %8.1f us/row %6.2f queries/row"
+        % (label, rows, len(requests), seconds / rows * 1e6, len(queries) / rows)
+    )
+
+
+def main(rows=100):
+    call_command("migrate", run_syncdb=True, verbosity=0)
+    user = get_user_model().objects.create_superuser("bench", "", "bench")
+    factory = RequestFactory()
+
+    def post(data):
+        request = factory.post("/", data)
+        request.user = user
+        return request
+
+    bread = UniqueBread()
+    URLConf.urlpatterns = bread.get_urls()
+    set_urlconf(URLConf)
+    run(
+        "add view",
+        bread.get_add_view(),
+        [post(make_row(i)) for i in range(rows)],
+        rows,
+    )
+
+    BreadUniqueTestModel.objects.all().delete()
+    data = {"form-TOTAL_FORMS": rows, "form-INITIAL_FORMS": 0}
+    for i in range(rows):
+        for name, value in make_row(i).items():
+            data["form-%d-%s" % (i, name)] = value
+    bread = FormsetBread()
+    run("formset mode", bread.get_add_view(), [post(data)], rows)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
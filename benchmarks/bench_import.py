@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""
+Compare adding records by posting each one to the add view with importing
+them all from a CSV file with the import view: the time and number of queries
+per record, and for the import, the peak memory Python allocated, which
+shouldn't grow with the size of the file.
+
+Uses an in-memory SQLite database. Pass the number of rows to import to
+try bigger files, e.g. 1000000.
+
+Run from the top of the repository:
+
+    python benchmarks/bench_import.py [rows]
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from django import setup  # noqa: E402
+
+import runtests  # noqa: E402,F401 (configures settings)
+
+setup()
+
+from django.contrib.auth import get_user_model  # noqa: E402
+from django.core.files.uploadedfile import TemporaryUploadedFile  # noqa: E402
+from django.core.management import call_command  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test import RequestFactory  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+from django.urls import set_urlconf  # noqa: E402
+
+from bread.bread import Bread  # noqa: E402
+from tests.models import BreadTestModel  # noqa: E402
+
+
+class BenchBread(Bread):
+    model = BreadTestModel
+    views = "BREADI"
+
+
+class URLConf(object):
+    urlpatterns = []
+
+
+def make_upload(rows):
+    upload = TemporaryUploadedFile("data.csv", "text/csv", 0, "utf-8")
+    upload.write(b"name,age\r\n")
+    for i in range(rows):
+        upload.write(b"name%d,%d\r\n" % (i, i % 100))
+    upload.seek(0)
+    return upload
+
+
+def main(import_rows=100000, add_rows=1000):
+    call_command("migrate", run_syncdb=True, verbosity=0)
+    user = get_user_model().objects.create_superuser("bench", "", "bench")
+    bread = BenchBread()
+    URLConf.urlpatterns = bread.get_urls()
+    set_urlconf(URLConf)
+    factory = RequestFactory()
+
+    add_view = bread.get_add_view()
+    with CaptureQueriesContext(connection) as queries:
+        start = time.perf_counter()
+        for i in range(add_rows):
+            request = factory.post("/", {"name": "name%d" % i, "age": i % 100})
+            request.user = user
+            assert add_view(request).status_code == 302
+        seconds = time.perf_counter() - start
+    print(
+        "add view    %8d rows %8.1f us/row %6.2f queries/row"
+        % (add_rows, seconds / add_rows * 1e6, len(queries) / add_rows)
+    )
+
+    import_view = bread.get_import_view()
+    for rows in (import_rows // 10, import_rows):
+        BreadTestModel.objects.all().delete()
+        upload = make_upload(rows)
+        request = factory.post("/")
+        request._files = {"file": upload}
+        request.user = user
+        # Only count the queries: logging their SQL would use memory too
+        queries = []
+        tracemalloc.start()
+        with connection.execute_wrapper(
+            lambda execute, *args: queries.append(None) or execute(*args)
+        ):
+            start = time.perf_counter()
+            response = import_view(request)
+            seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        upload.close()
+        assert response.context_data["imported"] == rows
+        assert BreadTestModel.objects.count() == rows
+        print(
+            "import view %8d rows %8.1f us/row %6.4f queries/row %6.1f MB peak"
+            % (rows, seconds / rows * 1e6, len(queries) / rows, peak / 1e6)
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+"""
+Compare the time to render the browse table of 200 rows by 10 columns with
+Bread's Django templates and with its Jinja2 templates, from the same data.
+
+The objects are made in memory, so no database time is included.
+Jinja2 must be installed.
+
+Run from the top of the repository:
+
+    python benchmarks/bench_template_engines.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from django import setup  # noqa: E402
+
+import runtests  # noqa: E402,F401 (configures settings)
+
+setup()
+
+from django.template import engines  # noqa: E402
+from django.template.backends.jinja2 import Jinja2  # noqa: E402
+from django.urls import set_urlconf  # noqa: E402
+
+from bread.bread import Bread, BrowseRow, BrowseView  # noqa: E402
+from tests.models import (  # noqa: E402
+    BreadLabelValueTestModel,
+    BreadTestModel,
+    BreadTestModel2,
+)
+
+SPECS = [
+    "id",
+    "name",
+    "age",
+    "get_name",
+    "other__label_model__banana",
+    "other__id",
+    "other__text",
+    "other__get_text",
+    "other__label_model__name",
+    "other__label_model__name_reversed",
+]
+
+
+class BenchBrowseView(BrowseView):
+    columns = [(spec, spec) for spec in SPECS]
+
+
+class BenchBread(Bread):
+    model = BreadTestModel
+    browse_view = BenchBrowseView
+
+
+class URLConf(object):
+    urlpatterns = []
+
+
+def main(rows=200, number=20):
+    bread = BenchBread()
+    URLConf.urlpatterns = bread.get_urls()
+    set_urlconf(URLConf)
+
+    objects = []
+    for i in range(rows):
+        label_model = BreadLabelValueTestModel(id=i, name="label%d" % i)
+        other = BreadTestModel2(id=i, text="text%d" % i, label_model=label_model)
+        objects.append(BreadTestModel(id=i, name="name%d" % i, age=i, other=other))
+    accessors = BenchBrowseView.get_column_accessors(BreadTestModel)
+
+    def get_context():
+        return {
+            "bread": bread,
+            "columns": BenchBrowseView.columns,
+            "rows": [BrowseRow(bread, obj, accessors) for obj in objects],
+            "may_read": True,
+            "may_edit": True,
+            "may_add": True,
+            "valid_sorting_columns_json": "[]",
+        }
+
+    jinja2_engine = Jinja2(
+        {
+            "NAME": "jinja2",
+            "DIRS": [],
+            "APP_DIRS": True,
+            "OPTIONS": {"environment": "bread.jinja.environment"},
+        }
+    )
+    for name, engine in [("django", engines["django"]), ("jinja2", jinja2_engine)]:
+        template = engine.get_template("bread/includes/browse.html")
+
+        def render():
+            return template.render(get_context())
+
+        seconds = min(timeit.repeat(render, number=number, repeat=3))
+        print("%-10s %8.2f ms per page" % (name, seconds / number * 1e3))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,98 @@
+import csv
+import hashlib
+import io
 import json
-from functools import reduce
-from operator import or_
-from urllib.parse import urlencode
+from calendar import timegm
+from urllib.parse import quote, urlencode
 
+import django
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.contrib.auth import REDIRECT_FIELD_NAME
 from django.contrib.auth.models import Permission
 from django.contrib.auth.views import redirect_to_login
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import caches
 from django.core.exceptions import (
+    NON_FIELD_ERRORS,
     EmptyResultSet,
     FieldError,
     ImproperlyConfigured,
     PermissionDenied,
+    ValidationError,
+)
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.signals import setting_changed
+from django.db import IntegrityError, connections, router, transaction
+from django.db.models import Count, Max, Model, ProtectedError, QuerySet
+from django.db.models.signals import post_migrate
+from django.forms.models import modelform_factory, modelformset_factory
+from django.forms.utils import ErrorDict, ErrorList
+from django.http import Http404
+from django.http.response import (
+    HttpResponseBadRequest,
+    HttpResponseRedirect,
+    JsonResponse,
+    StreamingHttpResponse,
+)
+from django.template.response import TemplateResponse
+from django.urls import (
+    NoReverseMatch,
+    get_script_prefix,
+    get_urlconf,
+    path,
+    reverse,
+    reverse_lazy,
+)
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.functional import (
+    LazyObject,
+    SimpleLazyObject,
+    cached_property,
+    empty,
 )
-from django.db.models import Model, Q
-from django.forms.models import modelform_factory
-from django.http.response import HttpResponseBadRequest
-from django.urls import path, reverse_lazy
 from django.utils.html import escape
-from vanilla import CreateView, DeleteView, DetailView, ListView, UpdateView
+from django.utils.http import RFC3986_SUBDELIMS, http_date, quote_etag
+from django.utils.translation import get_language, gettext_lazy
+from vanilla import (
+    CreateView,
+    DeleteView,
+    DetailView,
+    GenericModelView,
+    ListView,
+    UpdateView,
+)
 
-from .utils import get_verbose_name, validate_fieldspec
+from .cache import (
+    RowFragmentCache,
+    bump_model_version,
+    get_model_versions,
+    watch_models,
+)
+from .deletion import DeletionJob, count_cascade, delete_in_batches
+from .formsets import BulkModelFormMixin, BulkModelFormSet
+from .pagination import (
+    CachedCountPaginator,
+    EstimatedCountPaginator,
+    InvalidCursor,
+    KeysetPage,
+    KnownCountPaginator,
+    UncountedPaginator,
+    decode_cursor,
+    get_keyset_ordering,
+)
+from .permissions import PermissionResolver
+from .search import IContainsSearchBackend
+from .templatetags.bread_tags import getter
+from .utils import (
+    get_accessor,
+    get_only_fields,
+    get_related_lookups,
+    get_related_models,
+    get_verbose_name,
+    is_value_fieldspec,
+    validate_fieldspec,
+)
 
 
 class Http400(Exception):
@@ -36,6 +107,7 @@ You can provide a Django setting named BREAD as a dictionary.
 Here are the settings, all currently optional:
 
 DEFAULT_BASE_TEMPLATE: Default value for Bread's base_template argument
+TEMPLATE_ENGINE: Default value for Bread's template_engine argument
 """
 
 
@@ -45,6 +117,56 @@ def setting(name, default=None):
     return BREAD.get(name, default)
 
 
+# The permissions that BreadViewMixin.check_permission_exists() has found, as
+# (model label, codename) tuples, so that each is only looked up once.
+# Cleared after migrations are run, since they can remove permissions.
+_existing_permissions = set()
+
+
+def clear_permission_cache(**kwargs):
+    _existing_permissions.clear()
+
+
+post_migrate.connect(
+    clear_permission_cache, dispatch_uid="bread_clear_permission_cache"
+)
+
+# The form classes made by BreadViewMixin.get_default_form_class(), keyed by
+# (Bread class, view class, model, excluded field names). Cleared when settings
+# change, since they can affect how form fields are made.
+_form_classes = {}
+
+
+def clear_form_class_cache(**kwargs):
+    _form_classes.clear()
+
+
+setting_changed.connect(
+    clear_form_class_cache, dispatch_uid="bread_clear_form_class_cache"
+)
+
+
+# For each view: the name of its 'may_<name>' context variable, its letter
+# in Bread.views and the short name of the permission it needs
+VIEW_PERMS = [
+    ("browse", "B", "browse"),
+    ("read", "R", "read"),
+    ("edit", "E", "change"),
+    ("add", "A", "add"),
+    ("delete", "D", "delete"),
+    ("import", "I", "add"),
+]
+
+
+def _http_validators(etag, last_modified):
+    """Return an ETag quoted for a header, and a datetime as a timestamp"""
+    if etag is not None:
+        etag = quote_etag(etag)
+    if last_modified is not None:
+        last_modified = timegm(last_modified.utctimetuple())
+    return etag, last_modified
+
+
 class BreadViewMixin(object):
     """We mix this into all the views for some common features"""
 
@@ -52,6 +174,7 @@ class BreadViewMixin(object):
 
     exclude = None
     form_class = None
+    format_kwarg = "format"  # Query parm to ask for "json" instead of HTML
 
     # Make this view require the appropriate permission
     @property
@@ -67,22 +190,35 @@ class BreadViewMixin(object):
             perm_name=short_name,
         )
 
-    def __init__(self, *args, **kwargs):
-        # Make sure the permission needed to use this view exists.
-        super(BreadViewMixin, self).__init__(*args, **kwargs)
-        perm_name = "%s_%s" % (
-            self.perm_name,
-            self.bread.model._meta.object_name.lower(),
-        )
-        perm = Permission.objects.filter(
-            content_type=ContentType.objects.get_for_model(self.bread.model),
+    def check_permission_exists(self):
+        """
+        Make sure the permission needed to use this view exists, or raise
+        ImproperlyConfigured. Only queries the database the first time
+        for each permission.
+        """
+        key = self.get_permission_key()
+        if key in _existing_permissions:
+            return
+        model = self.bread.model
+        perm_name = key[1]
+        perm_exists = Permission.objects.filter(
+            content_type=ContentType.objects.get_for_model(model),
             codename=perm_name,
-        ).first()
-        if not perm:
+        ).exists()
+        if not perm_exists:
             raise ImproperlyConfigured(
                 "The view %r requires permission %s but there's no such permission"
                 % (self, perm_name)
             )
+        _existing_permissions.add(key)
+
+    def get_permission_key(self):
+        """Return (model label, codename) for the permission this view needs"""
+        model = self.bread.model
+        return (
+            model._meta.label_lower,
+            "%s_%s" % (self.perm_name, model._meta.object_name.lower()),
+        )
 
     # Override dispatch to get our own custom version of the braces
     # PermissionRequired mixin.  Here's how ours behaves:
@@ -98,6 +234,7 @@ class BreadViewMixin(object):
                 "'BreadViewMixin' requires "
                 "'permission_required' attribute to be set."
             )
+        self.check_permission_exists()
 
         # Check if the user is logged in
         if not request.user.is_authenticated:
@@ -106,15 +243,19 @@ class BreadViewMixin(object):
             )
 
         # Check to see if the request's user has the required permission.
-        has_permission = request.user.has_perm(self.permission_required)
+        resolver = self.get_permission_resolver(request)
+        has_permission = resolver.has_perm(self.permission_required)
 
         if not has_permission:  # If the user lacks the permission
             raise PermissionDenied  # return a forbidden response.
 
         try:
-            return super(BreadViewMixin, self).dispatch(request, *args, **kwargs)
+            response = super(BreadViewMixin, self).dispatch(request, *args, **kwargs)
         except Http400 as e:
             return HttpResponseBadRequest(content=escape(e.msg).encode("utf-8"))
+        # The response may be HTML or JSON, depending on the Accept header
+        patch_vary_headers(response, ["Accept"])
+        return response
 
     def get_template_names(self):
         """Return Django Vanilla templates (app-specific), then
@@ -137,6 +278,61 @@ class BreadViewMixin(object):
             return vanilla_templates + [custom_template] + [default_template]
         return vanilla_templates + [default_template]
 
+    def wants_json(self):
+        """
+        Return True if the response should be JSON rather than HTML: if the
+        `format_kwarg` query parm is 'json', or if there's no such parm and
+        the request's Accept header accepts JSON but not HTML.
+        """
+        requested_format = self.request.GET.get(self.format_kwarg)
+        if requested_format is not None:
+            return requested_format == "json"
+        return self.request.accepts("application/json") and not (
+            self.request.accepts("text/html")
+        )
+
+    def get_json_data(self, context):
+        """
+        Return the data for a JSON response, given the template context
+        that would have been used for HTML. By default, that's the object's
+        primary key, if there's an object, and the names, labels and values
+        of the form's fields and its errors, if there's a form.
+        """
+        data = {}
+        if getattr(self, "object", None) is not None:
+            data["pk"] = self.object.pk
+        form = context.get("form")
+        if form is not None:
+            data.update(self.get_form_json_data(form))
+        return data
+
+    def get_form_json_data(self, form):
+        """Return the names, labels and values of the form's fields, and its
+        errors if it's bound, for a JSON response"""
+        data = {
+            "fields": [
+                {"name": field.name, "label": str(field.label), "value": field.value()}
+                for field in form
+            ]
+        }
+        if form.is_bound:
+            data["errors"] = form.errors.get_json_data()
+        return data
+
+    def render_to_json_response(self, data, status=200):
+        return JsonResponse(data, encoder=BreadJSONEncoder, status=status)
+
+    def render_to_response(self, context):
+        if self.wants_json():
+            # No templates needed
+            return self.render_to_json_response(self.get_json_data(context))
+        return TemplateResponse(
+            request=self.request,
+            template=self.get_template_names(),
+            context=context,
+            using=self.bread.template_engine,
+        )
+
     def _get_new_url(self, **query_parms):
         """Return a new URL consisting of this request's URL, with any specified
         query parms updated or added"""
@@ -152,32 +348,112 @@ class BreadViewMixin(object):
 
         # Add 'may_<viewname>' to the context for each view, so the templates can
         # tell if the current user may use the named view.
-        data["may_browse"] = "B" in self.bread.views and self.request.user.has_perm(
-            self.get_full_perm_name("browse")
-        )
-        data["may_read"] = "R" in self.bread.views and self.request.user.has_perm(
-            self.get_full_perm_name("read")
-        )
-        data["may_edit"] = "E" in self.bread.views and self.request.user.has_perm(
-            self.get_full_perm_name("change")
-        )
-        data["may_add"] = "A" in self.bread.views and self.request.user.has_perm(
-            self.get_full_perm_name("add")
-        )
-        data["may_delete"] = "D" in self.bread.views and self.request.user.has_perm(
-            self.get_full_perm_name("delete")
+        resolver = self.get_permission_resolver(self.request)
+        perms = resolver.has_perms(
+            [self.get_full_perm_name(short_name) for __, __, short_name in VIEW_PERMS]
         )
+        for view_name, letter, short_name in VIEW_PERMS:
+            data["may_%s" % view_name] = (
+                letter in self.bread.views
+                and perms[self.get_full_perm_name(short_name)]
+            )
         return data
 
+    def get_etag(self, version):
+        """
+        Return an ETag for a response showing data that's at `version`.
+        It changes with the user and language too, since what's shown
+        depends on them.
+        """
+        data = "|".join(
+            [
+                self.bread.model._meta.label_lower,
+                type(self).__name__,
+                str(version),
+                str(self.request.user.pk),
+                get_language() or "",
+                "json" if self.wants_json() else "html",
+            ]
+        )
+        return hashlib.md5(data.encode("utf-8")).hexdigest()
+
+    def get_conditional_response(self, request, etag, last_modified, get_response):
+        """
+        If the request's conditional headers show the client already has the
+        current version, identified by `etag` and `last_modified` (a datetime),
+        return a 304 Not Modified (or 412 Precondition Failed) response without
+        calling `get_response`. Otherwise return `get_response()` with ETag and
+        Last-Modified headers.
+        """
+        response = self.get_not_modified_response(request, etag, last_modified)
+        if response is None:
+            response = self.add_validator_headers(
+                request, get_response(), etag, last_modified
+            )
+        return response
+
+    def get_not_modified_response(self, request, etag, last_modified):
+        """
+        Return the 304 (or 412) response for a request whose conditional
+        headers match `etag` and `last_modified`, or None if they don't.
+        """
+        etag, last_modified = _http_validators(etag, last_modified)
+        return get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+    def add_validator_headers(self, request, response, etag, last_modified):
+        """Add ETag and Last-Modified headers to a successful GET response"""
+        etag, last_modified = _http_validators(etag, last_modified)
+        if request.method in ("GET", "HEAD") and response.status_code == 200:
+            if etag is not None and not response.has_header("ETag"):
+                response.headers["ETag"] = etag
+            if last_modified is not None and not response.has_header("Last-Modified"):
+                response.headers["Last-Modified"] = http_date(last_modified)
+        return response
+
+    def get_permission_resolver(self, request):
+        """Return the PermissionResolver for this request, shared by all
+        the views it uses"""
+        return self.bread.permission_resolver_class.for_request(request)
+
+    def get_context_perm_names(self):
+        """Return the full names of the permissions the context shows
+        whether the user has"""
+        return [
+            self.get_full_perm_name(short_name) for __, __, short_name in VIEW_PERMS
+        ]
+
     def get_form(self, data=None, files=None, **kwargs):
         form_class = self.form_class or self.bread.form_class
         if not form_class:
-            form_class = modelform_factory(
+            form_class = self.get_default_form_class()
+        return form_class(data=data, files=files, **kwargs)
+
+    def get_default_form_class(self):
+        """
+        Return a model form class with all the model's fields except those
+        excluded, for when no form class is configured. It's only made the
+        first time it's needed for each Bread class, view class and exclusions.
+        """
+        exclude = self.get_exclude()
+        key = (
+            type(self.bread),
+            type(self),
+            self.bread.model,
+            tuple(exclude) if exclude else None,
+        )
+        form_class = _form_classes.get(key)
+        if form_class is None:
+            form_class = _form_classes[key] = modelform_factory(
                 self.bread.model,
                 fields="__all__",
-                exclude=self.exclude or self.bread.exclude,
+                exclude=exclude,
             )
-        return form_class(data=data, files=files, **kwargs)
+        return form_class
+
+    def get_exclude(self):
+        """Return the names of the fields to leave out of the form class Bread
+        makes when no form class is configured"""
+        return self.exclude or self.bread.exclude
 
     @property
     def success_url(self):
@@ -186,18 +462,75 @@ class BreadViewMixin(object):
 
 # The individual view classes we'll use and customize in the
 # omnibus class below:
+class BrowseRow(object):
+    """
+    One row of the browse table, for `object`. The values of its cells and
+    its URLs are only worked out the first time they're used, so rows whose
+    HTML is cached cost next to nothing.
+    """
+
+    def __init__(self, bread, obj, accessors):
+        self.bread = bread
+        self.object = obj
+        self.pk = obj.pk
+        self.accessors = accessors
+
+    @cached_property
+    def cells(self):
+        """The values of the columns, in order"""
+        return [getter(self.object, accessor) for accessor in self.accessors]
+
+    @cached_property
+    def read_url(self):
+        return self.bread.read_url(self.pk)
+
+    @cached_property
+    def edit_url(self):
+        return self.bread.edit_url(self.pk)
+
+
+# The bulk actions BrowseView can offer: their labels and the permission they need
+BULK_ACTIONS = {
+    "update": (gettext_lazy("Update selected"), "change"),
+    "delete": (gettext_lazy("Delete selected"), "delete"),
+}
+
+
 class BrowseView(BreadViewMixin, ListView):
     # Include in any colspec to allow Django ORM annotations.
     # Will skip init-time validation for that column.
     is_annotation = object()
 
     # Configurable:
+    auto_related = True  # Use select/prefetch_related for relations in columns
+    bulk_actions = []  # "update" and/or "delete", to act on many records at once
+    bulk_delete_batch_size = 500  # Records deleted per batch by bulk "delete"
+    bulk_update_fields = []  # Fields that bulk "update" may set
+    cache_results = False  # Cache which records are on each page, and the count
+    cache_rows = False  # Cache the rendered HTML of each row of the table
+    column_fields = {}  # Field specs that columns depend on, for only_columns
     columns = []
+    count_cache_timeout = 60  # Seconds, for count_strategy "cached"
+    count_strategy = "exact"  # Or "cached", "estimated" or "none"
+    cursor_kwarg = "cursor"  # Query parm for the position in keyset pagination
     filterset = None  # Class
+    keyset_pagination = False  # Page with a cursor instead of page numbers
+    last_modified_field = None  # Timestamp field, for the ETag of conditional GETs
+    only_columns = False  # Only load the fields that columns need
     paginate_by = None
     perm_name = "browse"  # Not a default Django permission
+    results_cache_alias = "default"
+    results_cache_models = []  # Other models the results depend on, for cache_results
+    results_cache_timeout = 300  # Seconds, for cache_results
+    row_cache_alias = "default"
+    row_cache_timeout = 300  # Seconds, for cache_rows
+    row_version_field = (
+        None  # Field that changes whenever a record does, for cache_rows
+    )
+    search_backend = IContainsSearchBackend()
     search_fields = []
     search_terms = None
+    search_use_exists = False  # Search multi-valued relations without DISTINCT
     template_name_suffix = "_browse"
 
     _valid_sorting_columns = []  # indices of columns that are valid in ordering parms
@@ -206,36 +539,306 @@ class BrowseView(BreadViewMixin, ListView):
         super(BrowseView, self).__init__(*args, **kwargs)
         # Internal use
         self.filter = None
+        self._valid_sorting_columns = self.get_valid_sorting_columns(self.model)
+
+    def get(self, request, *args, **kwargs):
+        if not self.last_modified_field:
+            return super(BrowseView, self).get(request, *args, **kwargs)
+        queryset = self.get_queryset()
+        summary = queryset.aggregate(
+            count=Count("pk"), last_modified=Max(self.last_modified_field)
+        )
+        version = self.get_results_version(
+            summary, get_model_versions(self.get_column_models())
+        )
+        return self.get_conditional_response(
+            request,
+            self.get_etag(version),
+            None,
+            lambda: self.get_response(queryset),
+        )
 
-        # See which columns we can sort on
-        self._valid_sorting_columns = []
-        for i in range(len(self.columns)):
-            fieldspec = self.get_sort_field_name_for_column(i)
-            if fieldspec:
-                try:
-                    # In Django 3.1.13+, order_by args are validated here
-                    queryset = (
-                        super(BrowseView, self).get_queryset().order_by(fieldspec)
+    def get_response(self, queryset):
+        """ListView.get(), for the results `queryset` that's already made"""
+        paginate_by = self.get_paginate_by()
+        if not self.allow_empty and not queryset.exists():
+            raise Http404
+        page = None
+        if paginate_by is None:
+            self.object_list = queryset
+        else:
+            page = self.paginate_queryset(queryset, paginate_by)
+            self.object_list = page.object_list
+        context = self.get_context_data(
+            page_obj=page,
+            is_paginated=page is not None and page.has_other_pages(),
+            paginator=page and page.paginator,
+        )
+        return self.render_to_response(context)
+
+    def get_column_models(self):
+        """Return the other models the columns show data from"""
+        return self.get_row_cache_models(self.model)[1:]
+
+    def get_results_version(self, summary, model_versions):
+        """
+        Return a string for the ETag, that changes whenever the page might:
+        the results can only have changed if how many there are, or the last
+        time any of them was modified (from `summary`), has changed, and what
+        the columns show from other models only if their versions (see
+        `bread.cache`) have.
+        """
+        return "%s|%s|%s|%s" % (
+            summary["count"],
+            summary["last_modified"],
+            ",".join(str(version) for version in model_versions),
+            self.request.get_full_path(),
+        )
+
+    def post(self, request, *args, **kwargs):
+        """
+        Apply one of the `bulk_actions` to the records selected with "pk"
+        parms, or to all the results if the "select_all" parm is set. The
+        "action" parm says which, and needs the same permission as the
+        view that would change those records one at a time.
+        """
+        if not self.bulk_actions:
+            return self.http_method_not_allowed(request, *args, **kwargs)
+        action = request.POST.get("action")
+        if action not in self.bulk_actions:
+            raise Http400(
+                "%r is not a valid bulk action. The valid actions are %r"
+                % (action, self.bulk_actions)
+            )
+        resolver = self.get_permission_resolver(request)
+        if not resolver.has_perm(self.get_full_perm_name(BULK_ACTIONS[action][1])):
+            raise PermissionDenied
+
+        if action == "update":
+            form = self.get_bulk_update_form(request.POST)
+            if not form.is_valid():
+                if self.wants_json():
+                    return self.render_to_json_response(
+                        {"errors": form.errors.get_json_data()}, status=400
+                    )
+                raise Http400(form.errors.as_text())
+            count = self.bulk_update(self.get_bulk_queryset(), form.cleaned_data)
+        else:
+            try:
+                count = self.bulk_delete(self.get_bulk_queryset())
+            except ProtectedError as e:
+                message = e.args[0]
+                if self.wants_json():
+                    return self.render_to_json_response(
+                        {
+                            "errors": {
+                                NON_FIELD_ERRORS: [
+                                    {"message": message, "code": "protected"}
+                                ]
+                            }
+                        },
+                        status=400,
+                    )
+                raise Http400(message)
+
+        if self.wants_json():
+            return self.render_to_json_response({"action": action, "count": count})
+        # Back to the same page of results
+        return HttpResponseRedirect(request.get_full_path())
+
+    def get_bulk_queryset(self):
+        """
+        Return a queryset of the records a bulk action should apply to,
+        selected by primary key from the results of the current search and
+        filters, so only records the view shows can be changed. With
+        "select_all", that's all the results, and none of them are fetched.
+        """
+        queryset = self.get_queryset()
+        if not self.request.POST.get("select_all"):
+            pks = self.request.POST.getlist("pk")
+            if not pks:
+                raise Http400("No records were selected")
+            try:
+                queryset = queryset.filter(pk__in=pks)
+            except (ValueError, ValidationError):
+                raise Http400("Invalid primary keys: %r" % (pks,))
+        # update() and delete() can't be used on all the querysets that
+        # get_queryset() can make (e.g. distinct ones), so use a subquery
+        return queryset.model._base_manager.filter(pk__in=queryset.values("pk"))
+
+    def get_bulk_update_form(self, data=None):
+        """
+        Return a model form for the `bulk_update_fields`. If `data` is given,
+        the form only has the fields named by its "field" parms, which are
+        the fields to set.
+        """
+        field_names = list(self.bulk_update_fields)
+        if data is not None:
+            field_names = data.getlist("field")
+            if not field_names:
+                raise Http400("No fields were chosen to update")
+            for name in field_names:
+                if name not in self.bulk_update_fields:
+                    raise Http400(
+                        "%r is not a field that can be updated. The valid fields "
+                        "are %r" % (name, self.bulk_update_fields)
                     )
-                    # Force Django < 3.1.13 to build the query here so it will validate the order_by args
-                    str(queryset.query)
-                except FieldError:
-                    pass
-                else:
-                    self._valid_sorting_columns.append(i)
+        form_class = self.get_compiled(
+            ("bulk_update_form", tuple(field_names)),
+            self.bread.model,
+            lambda model: modelform_factory(model, fields=field_names),
+        )
+        return form_class(data, use_required_attribute=False)
+
+    def bulk_update(self, queryset, values):
+        """
+        Set the fields in the dictionary `values` on every record in
+        `queryset` with one UPDATE query, and return how many there were.
+        Like `QuerySet.update()`, no signals are sent and `save()` isn't called,
+        but fields with `auto_now` are set, and the model's version is bumped
+        (see `bread.cache`), so cached results and rows, and ETags, notice.
+        """
+        values = dict(values)
+        model = queryset.model
+        for field in model._meta.concrete_fields:
+            if getattr(field, "auto_now", False) and field.name not in values:
+                # The current time, in the right form for the field
+                values[field.name] = field.pre_save(model(), add=False)
+        count = queryset.update(**values)
+        bump_model_version(model)
+        return count
+
+    def bulk_delete(self, queryset):
+        """
+        Delete the records in `queryset`, and what they cascade to,
+        `bulk_delete_batch_size` at a time, each batch in its own transaction
+        so locks aren't held for long, and return how many were deleted (not
+        counting cascades).
+        """
+        __, deleted = delete_in_batches(queryset, self.bulk_delete_batch_size)
+        return deleted.get(queryset.model._meta.label, 0)
+
+    @classmethod
+    def get_compiled(cls, name, model, compile):
+        """
+        Return the result of calling `compile(model)`, computing it only once
+        per view class and model, since it depends only on the class's
+        configuration and the model's metadata.
+        """
+        compiled = cls.__dict__.get("_compiled")
+        if compiled is None:
+            compiled = cls._compiled = {}
+        key = (name, model)
+        if key not in compiled:
+            compiled[key] = compile(model)
+        return compiled[key]
+
+    @classmethod
+    def get_column_accessors(cls, model):
+        """Return the compiled Accessor for each column, in order."""
+        return cls.get_compiled(
+            "column_accessors",
+            model,
+            lambda model: [get_accessor(colspec[1], model) for colspec in cls.columns],
+        )
+
+    @classmethod
+    def get_column_fieldspecs(cls):
+        """Return the field specs of the columns that aren't annotations."""
+        return [
+            colspec[1] for colspec in cls.columns if cls.is_annotation not in colspec
+        ]
+
+    def get_related_lookups(self, model):
+        """
+        Return a 2-tuple of lists of lookups, (select_related, prefetch_related),
+        to apply to the queryset so that displaying the columns doesn't run
+        extra queries for every row.
+
+        By default these are worked out from `columns`, once per view class.
+        Override to adjust them.
+        """
+        return self.get_compiled(
+            "related_lookups",
+            model,
+            lambda model: get_related_lookups(model, self.get_column_fieldspecs()),
+        )
+
+    def get_only_fields(self, model):
+        """
+        Return a list of the lookups to pass to `QuerySet.only()` so that only
+        the fields needed to display the columns are loaded, or None to load
+        every field.
+
+        By default these are worked out from `columns` and `column_fields`,
+        once per view class. Override to adjust them.
+        """
+
+        def compile(model):
+            if not self.columns:
+                # The default template displays the objects themselves
+                return None
+            specs = []
+            for spec in self.get_column_fieldspecs():
+                specs.extend(self.column_fields.get(spec, [spec]))
+            return get_only_fields(model, specs)
+
+        return self.get_compiled("only_fields", model, compile)
 
-    def get_sort_field_name_for_column(self, column_number):
+    @classmethod
+    def get_sort_field_name_for_column(cls, column_number):
         """
         Returns the name to use in an `order_by` call on a queryset
         to sort by the 'column_number'-th column.
         """
-        column = self.columns[column_number]
+        column = cls.columns[column_number]
         sortspec = column[-1]
         return sortspec() if callable(sortspec) else sortspec
 
+    @classmethod
+    def get_valid_sorting_columns(cls, model):
+        """
+        Return a list of the indices of the columns that can be sorted on.
+        Worked out once per view class, when the Bread is created.
+        """
+
+        def compile(model):
+            if cls.queryset is not None:
+                base_queryset = cls.queryset.all()
+            else:
+                base_queryset = model._default_manager.all()
+            valid_sorting_columns = []
+            for i in range(len(cls.columns)):
+                fieldspec = cls.get_sort_field_name_for_column(i)
+                if fieldspec:
+                    try:
+                        # In Django 3.1.13+, order_by args are validated here
+                        queryset = base_queryset.order_by(fieldspec)
+                        # Force Django < 3.1.13 to build the query here so it will validate the order_by args
+                        str(queryset.query)
+                    except FieldError:
+                        pass
+                    else:
+                        valid_sorting_columns.append(i)
+            return valid_sorting_columns
+
+        return cls.get_compiled("valid_sorting_columns", model, compile)
+
     def get_queryset(self):
         qset = super(BrowseView, self).get_queryset()
 
+        if self.auto_related:
+            select_related, prefetch_related = self.get_related_lookups(qset.model)
+            if select_related:
+                qset = qset.select_related(*select_related)
+            if prefetch_related:
+                qset = qset.prefetch_related(*prefetch_related)
+
+        if self.only_columns:
+            only_fields = self.get_only_fields(qset.model)
+            if only_fields is not None:
+                qset = qset.only(*only_fields)
+
         # Make a copy of the query parms. We need to remove the
         # sorting and search parms from this as we process them,
         # so the filter won't try to use them. That also means we
@@ -299,7 +902,9 @@ class BrowseView(BreadViewMixin, ListView):
 
         # Now filter
         if self.filterset is not None:
-            self.filter = self.filterset(query_parms, queryset=qset, request=self.request)
+            self.filter = self.filterset(
+                query_parms, queryset=qset, request=self.request
+            )
             qset = self.filter.qs
 
         return qset
@@ -317,13 +922,43 @@ class BrowseView(BreadViewMixin, ListView):
         else:
             data["search_terms"] = ""
         data["filter"] = self.filter
-        if data.get("is_paginated", False):
+        data["rows"] = self.get_rows(data["object_list"])
+        data["bulk_actions"] = bulk_actions = self.get_permitted_bulk_actions()
+        if "update" in dict(bulk_actions):
+            data["bulk_update_form"] = self.get_bulk_update_form()
+        if self.cache_rows and not self.wants_json():
+            data["row_cache"] = self.get_row_cache(data)
+        if "X" in self.bread.views:
+            # Export the same results as we're browsing
+            query_parms = self.request.GET.copy()
+            query_parms.pop(self.page_kwarg, None)
+            query_parms.pop(self.cursor_kwarg, None)
+            data["export_url"] = reverse(self.bread.export_url_name())
+            if query_parms:
+                data["export_url"] += "?" + query_parms.urlencode()
+        if data.get("is_paginated", False) and isinstance(data["page_obj"], KeysetPage):
+            page = data["page_obj"]
+            if page.has_next():
+                data["next_url"] = self._get_cursor_url(page.next_cursor)
+            if page.has_previous():
+                data["first_url"] = self._get_cursor_url(None)
+                if page.previous_cursor:
+                    data["previous_url"] = self._get_cursor_url(page.previous_cursor)
+        elif data.get("is_paginated", False):
             page = data["page_obj"]
             num_pages = data["paginator"].num_pages
+            # num_pages is None if the count strategy doesn't count, and may
+            # be too high or low if it's estimated.
+            data["count_is_estimate"] = count_is_estimate = getattr(
+                data["paginator"], "count_is_estimate", False
+            )
+            if num_pages is None or count_is_estimate:
+                num_pages = None
             if page.has_next():
                 if page.next_page_number() != num_pages:
                     data["next_url"] = self._get_new_url(page=page.next_page_number())
-                data["last_url"] = self._get_new_url(page=num_pages)
+                if num_pages is not None:
+                    data["last_url"] = self._get_new_url(page=num_pages)
             if page.has_previous():
                 data["first_url"] = self._get_new_url(page=1)
                 if page.previous_page_number() != 1:
@@ -332,53 +967,381 @@ class BrowseView(BreadViewMixin, ListView):
                     )
         return data
 
-    # The following is copied from the Django admin and tweaked
+    def get_context_perm_names(self):
+        names = super(BrowseView, self).get_context_perm_names()
+        return names + [
+            self.get_full_perm_name(BULK_ACTIONS[action][1])
+            for action in self.bulk_actions
+        ]
+
+    def get_permitted_bulk_actions(self):
+        """Return (action, label) for each of the `bulk_actions` the user may use"""
+        resolver = self.get_permission_resolver(self.request)
+        return [
+            (action, BULK_ACTIONS[action][0])
+            for action in self.bulk_actions
+            if resolver.has_perm(self.get_full_perm_name(BULK_ACTIONS[action][1]))
+        ]
+
+    def get_json_data(self, context):
+        """
+        Return the data for a JSON response: the column labels, the valid
+        sorting columns, the search and sort query parms, a row with the
+        primary key and column values of each object on the page, and
+        information about the page if the results are paginated.
+        """
+        if self.columns:
+            labels = [str(colspec[0]) for colspec in self.columns]
+        else:
+            labels = [str(self.bread.model._meta.verbose_name)]
+        data = {
+            "columns": labels,
+            "valid_sorting_columns": self._valid_sorting_columns,
+            "o": context["o"],
+            "q": context["q"],
+            "rows": self.get_json_rows(context["object_list"]),
+        }
+        page = context.get("page_obj")
+        if page is not None:
+            paginator = page.paginator
+            data["page"] = {
+                "number": page.number,
+                "num_pages": paginator.num_pages if paginator else None,
+                "count": paginator.count if paginator else None,
+                "count_is_estimate": context.get("count_is_estimate", False),
+            }
+            for name in ["first_url", "previous_url", "next_url", "last_url"]:
+                data["page"][name] = context.get(name)
+        return data
+
+    def get_json_rows(self, object_list):
+        """
+        Return a list of a {'pk': pk, 'cells': [values]} dictionary for each
+        object on the page. If all the columns are fields, the values are
+        fetched with `values_list()` instead of making model instances.
+        """
+        value_fields = self.get_column_value_fields(self.bread.model)
+        if value_fields is not None and isinstance(object_list, QuerySet):
+            values = object_list.prefetch_related(None).values_list("pk", *value_fields)
+            return [{"pk": row[0], "cells": list(row[1:])} for row in values]
+        if not self.columns:
+            return [{"pk": obj.pk, "cells": [str(obj)]} for obj in object_list]
+        accessors = self.get_column_accessors(self.bread.model)
+        return [
+            {"pk": obj.pk, "cells": [getter(obj, accessor) for accessor in accessors]}
+            for obj in object_list
+        ]
+
+    @classmethod
+    def get_column_value_fields(cls, model):
+        """
+        Return the field specs to get the columns' values with
+        `values_list()`, or None if any column needs the objects, e.g.
+        because it calls a method or shows a related object.
+        """
+
+        def compile(model):
+            if not cls.columns:
+                return None
+            for fieldspec in [colspec[1] for colspec in cls.columns]:
+                if not is_value_fieldspec(model, fieldspec):
+                    return None
+            return [colspec[1] for colspec in cls.columns]
+
+        return cls.get_compiled("column_value_fields", model, compile)
+
+    def get_rows(self, object_list):
+        """
+        Return a list of a BrowseRow for each object on the page. Like the
+        object list, it's not evaluated until it's used.
+        """
+        accessors = self.get_column_accessors(self.bread.model)
+        return SimpleLazyObject(
+            lambda: [BrowseRow(self.bread, obj, accessors) for obj in object_list]
+        )
+
+    def get_paginator(self, queryset, page_size):
+        """
+        Return a paginator that counts the results according to count_strategy
+        """
+        if self.count_strategy == "exact":
+            return super(BrowseView, self).get_paginator(queryset, page_size)
+        elif self.count_strategy == "cached":
+            return CachedCountPaginator(
+                queryset, page_size, cache_timeout=self.count_cache_timeout
+            )
+        elif self.count_strategy == "estimated":
+            return EstimatedCountPaginator(queryset, page_size)
+        elif self.count_strategy == "none":
+            return UncountedPaginator(queryset, page_size)
+        raise ImproperlyConfigured(
+            "count_strategy must be 'exact', 'cached', 'estimated' or 'none', "
+            "not %r" % (self.count_strategy,)
+        )
+
+    def paginate_queryset(self, queryset, page_size):
+        if self.keyset_pagination:
+            return self.paginate_queryset_by_keyset(queryset, page_size)
+        if self.cache_results and self.count_strategy in ("exact", "cached"):
+            return self.paginate_queryset_with_cache(queryset, page_size)
+        return super(BrowseView, self).paginate_queryset(queryset, page_size)
+
+    def paginate_queryset_with_cache(self, queryset, page_size):
+        """
+        Like paginate_queryset, but the primary keys of the records on the page
+        and the count of all the results are cached, so that until any of
+        the models the results depend on changes, showing the page again only
+        needs to fetch those records.
+        """
+        cache = caches[self.results_cache_alias]
+        key = self.get_results_cache_key(queryset, page_size)
+        cached = cache.get(key)
+        if cached is not None:
+            paginator = KnownCountPaginator(queryset, page_size, cached["count"])
+            # Fetch the records again, so they're never out of date
+            objects = {obj.pk: obj for obj in queryset.filter(pk__in=cached["pks"])}
+            object_list = [objects[pk] for pk in cached["pks"] if pk in objects]
+            return paginator._get_page(object_list, cached["number"], paginator)
+
+        page = super(BrowseView, self).paginate_queryset(queryset, page_size)
+        cached = {
+            "pks": [obj.pk for obj in page.object_list],
+            "count": page.paginator.count,
+            "number": page.number,
+        }
+        cache.set(key, cached, self.results_cache_timeout)
+        return page
+
+    def get_row_cache(self, context):
+        """
+        Return a RowFragmentCache for the rows of the table, keyed by each
+        record's primary key and `row_version_field`, and by everything else
+        in `context` that the rows depend on.
+        """
+        model = self.bread.model
+        if self.row_version_field:
+            # Changes to the model's records change their row_version_field,
+            # so only changes to the records the columns refer to need to
+            # change every row's key.
+            models = self.get_row_cache_models(model)[1:]
+        else:
+            models = self.get_row_cache_models(model)
+        versions = get_model_versions(models, self.row_cache_alias)
+        row_data = "|".join(
+            [
+                "%s.%s" % (type(self).__module__, type(self).__qualname__),
+                repr(self.columns),
+                ",".join(str(version) for version in versions),
+                self.bread.get_url_name("read"),
+                self.bread.get_url_name("edit"),
+                self.bread.template_engine or "",
+                get_language() or "",
+                "%s,%s,%s,%s"
+                % (
+                    context["may_read"],
+                    context["may_edit"],
+                    context.get("debug"),
+                    bool(context.get("bulk_actions")),
+                ),
+            ]
+        )
+        prefix = "bread:row:%s:%s" % (
+            model._meta.label_lower,
+            hashlib.md5(row_data.encode("utf-8")).hexdigest(),
+        )
+        keys = {}
+        for obj in context["object_list"]:
+            version = None
+            if self.row_version_field:
+                version = getattr(obj, self.row_version_field)
+            data = "%r|%s" % (obj.pk, version)
+            keys[obj.pk] = "%s:%s" % (
+                prefix,
+                hashlib.md5(data.encode("utf-8")).hexdigest(),
+            )
+        return RowFragmentCache(keys, self.row_cache_alias, self.row_cache_timeout)
+
+    @classmethod
+    def get_row_cache_models(cls, model):
+        """
+        Return a list of the models whose changes should invalidate cached rows:
+        the browsed model and the models the columns refer to.
+        """
+        return cls.get_compiled(
+            "row_cache_models",
+            model,
+            lambda model: [model]
+            + get_related_models(model, cls.get_column_fieldspecs()),
+        )
+
+    @classmethod
+    def get_results_cache_models(cls, model):
+        """
+        Return a list of the models whose changes should invalidate the cached
+        results: the browsed model, the models the columns and search fields
+        refer to, and `results_cache_models`.
+        """
+
+        def compile(model):
+            specs = cls.get_column_fieldspecs()
+            specs += [str(field).lstrip("^=@") for field in cls.search_fields]
+            models = [model] + get_related_models(model, specs)
+            for other_model in cls.results_cache_models:
+                if other_model not in models:
+                    models.append(other_model)
+            return models
+
+        return cls.get_compiled("results_cache_models", model, compile)
+
+    def get_results_cache_key(self, queryset, page_size):
+        """
+        Return the cache key for the page of results the request is for.
+
+        It's made from the view class, the page size, the URL's query
+        parameters (except empty ones) and keyword arguments, and the
+        versions of the models from `get_results_cache_models`. Override to
+        add anything else the results depend on, e.g. the user if the view's
+        queryset depends on who's looking.
+        """
+        query_parms = self.request.GET.copy()
+        query_parms.pop(self.cursor_kwarg, None)
+        query_parms.pop(self.format_kwarg, None)
+        canonical_parms = [
+            (name, value)
+            for name in sorted(query_parms)
+            for value in query_parms.getlist(name)
+            if value
+        ]
+        versions = get_model_versions(
+            self.get_results_cache_models(queryset.model), self.results_cache_alias
+        )
+        key_data = "|".join(
+            [
+                "%s.%s" % (type(self).__module__, type(self).__qualname__),
+                str(page_size),
+                urlencode(canonical_parms),
+                urlencode(sorted(self.kwargs.items())),
+                ",".join(str(version) for version in versions),
+            ]
+        )
+        digest = hashlib.md5(key_data.encode("utf-8")).hexdigest()
+        return "bread:results:%s:%s" % (queryset.model._meta.label_lower, digest)
+
+    def paginate_queryset_by_keyset(self, queryset, page_size):
+        """
+        Return a KeysetPage with the page of results after (or before) the
+        position given by the cursor query parm, in the queryset's ordering
+        with the primary key as a final tiebreaker.
+        """
+        keys = get_keyset_ordering(queryset)
+        values, reverse = None, False
+        cursor = self.request.GET.get(self.cursor_kwarg)
+        if cursor:
+            try:
+                values, reverse = decode_cursor(cursor, keys)
+            except InvalidCursor as e:
+                raise Http400(str(e))
+        return KeysetPage(queryset, keys, page_size, values, reverse)
+
+    def _get_cursor_url(self, cursor):
+        """Return this request's URL, with the cursor query parm set to `cursor`
+        (or removed, if `cursor` is None)"""
+        query_parms = self.request.GET.copy()
+        query_parms.pop(self.page_kwarg, None)
+        query_parms.pop(self.cursor_kwarg, None)
+        if cursor:
+            query_parms[self.cursor_kwarg] = cursor
+        return self.request.path + "?" + urlencode(query_parms, doseq=True)
+
     def get_search_results(self, request, queryset, search_term):
         """
         Returns a tuple containing a queryset to implement the search,
         and a boolean indicating if the results may contain duplicates.
+
+        The search itself is done by `search_backend`.
         """
+        return self.search_backend.search(self, queryset, search_term)
 
-        # Apply keyword searches.
-        def construct_search(field_name):
-            if field_name.startswith("^"):
-                return "%s__istartswith" % field_name[1:]
-            elif field_name.startswith("="):
-                return "%s__iexact" % field_name[1:]
-            elif field_name.startswith("@"):
-                return "%s__search" % field_name[1:]
-            else:
-                return "%s__icontains" % field_name
 
-        use_distinct = False
-        search_fields = self.search_fields
-        if search_fields and search_term:
-            orm_lookups = [
-                construct_search(str(search_field)) for search_field in search_fields
-            ]
-            for bit in search_term.split():
-                or_queries = [Q(**{orm_lookup: bit}) for orm_lookup in orm_lookups]
-                queryset = queryset.filter(reduce(or_, or_queries))
-            if not use_distinct:
-                opts = self.bread.model._meta
-                for search_spec in orm_lookups:
-                    # The function lookup_needs_distinct() was renamed
-                    # to lookup_spawns_duplicates() in Django 4.0
-                    # https://docs.djangoproject.com/en/4.2/releases/4.0/#:~:text=The%20undocumented%20django.contrib.admin.utils.lookup_needs_distinct()%20function%20is%20renamed%20to%20lookup_spawns_duplicates().
-                    try:
-                        from django.contrib.admin.utils import lookup_spawns_duplicates
+class BreadJSONEncoder(DjangoJSONEncoder):
+    """JSON encoder that falls back to str() for values it doesn't know"""
+
+    def default(self, o):
+        try:
+            return super(BreadJSONEncoder, self).default(o)
+        except TypeError:
+            return str(o)
+
+
+class _Echo(object):
+    """A file-like object that just returns what's written to it, so we
+    can get one line at a time from a csv.writer"""
+
+    def write(self, value):
+        return value
+
+
+class ExportView(object):
+    """
+    Streams all the results that the browse view would show for the same
+    query parms (search, sorting and filtering, but not pagination),
+    as CSV or JSON Lines, one row per object and one value per column.
+
+    The results are read from the database `chunk_size` at a time, so memory
+    use doesn't depend on how many there are.
+
+    This is mixed into the Bread's browse view class, so it uses the same
+    columns, queryset, search and filter configuration.
+    """
 
-                        if lookup_spawns_duplicates(opts, search_spec):
-                            use_distinct = True
-                            break
-                    except ImportError:
-                        from django.contrib.admin.utils import lookup_needs_distinct
+    chunk_size = 2000
+    format_kwarg = "format"  # Query parm to pick "csv" (the default) or "jsonl"
+    http_method_names = ["get", "head", "options"]  # No bulk actions
+
+    def get(self, request, *args, **kwargs):
+        export_format = request.GET.get(self.format_kwarg, "csv")
+        # Before responding, so bad query parms are a 400. Nothing is fetched
+        # until the content is streamed.
+        queryset = self.get_queryset()
+        if export_format == "csv":
+            content = self.iter_csv(queryset)
+            content_type = "text/csv; charset=utf-8"
+        elif export_format == "jsonl":
+            content = self.iter_jsonl(queryset)
+            content_type = "application/jsonl; charset=utf-8"
+        else:
+            raise Http400("%s is not a valid export format" % export_format)
+        response = StreamingHttpResponse(content, content_type=content_type)
+        response["Content-Disposition"] = 'attachment; filename="%s.%s"' % (
+            self.bread.plural_name,
+            export_format,
+        )
+        return response
+
+    def get_labels(self):
+        if self.columns:
+            return [str(column[0]) for column in self.columns]
+        return [str(self.bread.model._meta.verbose_name)]
+
+    def iter_rows(self, queryset):
+        """Yield a list of the column values for each object in `queryset`"""
+        accessors = self.get_column_accessors(self.model)
+        for obj in queryset.iterator(chunk_size=self.chunk_size):
+            if self.columns:
+                yield [getter(obj, accessor) for accessor in accessors]
+            else:
+                yield [obj]
 
-                        if lookup_needs_distinct(opts, search_spec):
-                            use_distinct = True
-                            break
+    def iter_csv(self, queryset):
+        writer = csv.writer(_Echo())
+        yield writer.writerow(self.get_labels())
+        for row in self.iter_rows(queryset):
+            yield writer.writerow(row)
 
-        return queryset, use_distinct
+    def iter_jsonl(self, queryset):
+        labels = self.get_labels()
+        for row in self.iter_rows(queryset):
+            yield json.dumps(dict(zip(labels, row)), cls=BreadJSONEncoder) + "\n"
 
 
 class ReadView(BreadViewMixin, DetailView):
@@ -389,9 +1352,27 @@ class ReadView(BreadViewMixin, DetailView):
     to make a custom template for this model.
     """
 
+    etag_field = None  # Field that changes whenever the object does
+    last_modified_field = None  # Timestamp field
     perm_name = "view"  # Default Django permission
     template_name_suffix = "_read"
 
+    def get(self, request, *args, **kwargs):
+        if not (self.etag_field or self.last_modified_field):
+            return super(ReadView, self).get(request, *args, **kwargs)
+        self.object = self.get_object()
+        etag = last_modified = None
+        if self.etag_field:
+            etag = self.get_etag(getattr(self.object, self.etag_field))
+        if self.last_modified_field:
+            last_modified = getattr(self.object, self.last_modified_field)
+        return self.get_conditional_response(
+            request,
+            etag,
+            last_modified,
+            lambda: self.render_to_response(self.get_context_data()),
+        )
+
     def get_context_data(self, **kwargs):
         data = super(ReadView, self).get_context_data(**kwargs)
         data["form"] = self.get_form(instance=self.object)
@@ -445,6 +1426,15 @@ class LabelValueReadView(ReadView):
 
         return context_data
 
+    def get_json_data(self, context):
+        return {
+            "pk": self.object.pk,
+            "fields": [
+                {"label": str(label), "value": value}
+                for label, value in context["read_fields"]
+            ],
+        }
+
     def get_field_label_value(self, label, evaluator, context_data):
         """Given a 2-tuple from fields, return the corresponding (label, value) tuple.
 
@@ -454,9 +1444,8 @@ class LabelValueReadView(ReadView):
         if isinstance(evaluator, str):
             if hasattr(self.object, evaluator):
                 # This is an instance attr or method
-                attr = getattr(self.object, evaluator)
                 # Modes #1 and #2.
-                value = attr() if callable(attr) else attr
+                value = get_accessor(evaluator, type(self.object))(self.object)
                 if label is None:
                     # evaluator refers to a model field (we hope).
                     label = get_verbose_name(self.object, evaluator)
@@ -474,8 +1463,44 @@ class LabelValueReadView(ReadView):
 
 
 class EditView(BreadViewMixin, UpdateView):
+    """
+    Saves only the fields whose values changed, because the form changed them
+    or because they're different from when the object was loaded (e.g. set by
+    the form's `clean()` or `save()`), with `save(update_fields=...)`, so other
+    columns aren't written and nothing is written if nothing changed. Set
+    `save_changed_fields_only` to False to save them all, e.g. if the model's
+    `save()` sets some fields itself.
+
+    If `version_field` is set, to an integer field, the form is posted with
+    the version of the object it was made from, in `version_kwarg`, and the
+    changes are saved with one `UPDATE ... WHERE version = <that version>`,
+    which also increments it. If someone else saved the object in the
+    meantime, nothing is saved, and the response is a 409 Conflict. Like
+    `QuerySet.update()`, `save()` isn't called and no signals are sent, but
+    the model's version is bumped (see `bread.cache`).
+    """
+
+    conflict_message = gettext_lazy(
+        "Someone else changed this record after you started editing it. "
+        "Reload it to see their changes."
+    )
     perm_name = "change"  # Default Django permission
+    save_changed_fields_only = True  # Only write the fields whose values changed
     template_name_suffix = "_edit"
+    version_field = None  # Integer field incremented by each save, to detect conflicts
+    version_kwarg = "version"  # POST parm with the version the form was made from
+
+    def form_valid(self, form):
+        try:
+            self.object = self.save_form(form)
+        except ValidationError as e:
+            form.add_error(None, e)
+            rsp = super(EditView, self).form_invalid(form)
+            rsp.status_code = 409
+            return rsp
+        if not self.wants_json():
+            return HttpResponseRedirect(self.get_success_url())
+        return self.render_to_json_response({"pk": self.object.pk})
 
     def form_invalid(self, form):
         # Return a 400 if the form isn't valid
@@ -483,22 +1508,666 @@ class EditView(BreadViewMixin, UpdateView):
         rsp.status_code = 400
         return rsp
 
+    def get_context_data(self, **kwargs):
+        data = super(EditView, self).get_context_data(**kwargs)
+        if self.version_field:
+            # The version the user started from, even if the form is shown
+            # again because it wasn't valid
+            data["version_kwarg"] = self.version_kwarg
+            data["version"] = self.request.POST.get(
+                self.version_kwarg, getattr(self.object, self.version_field)
+            )
+        return data
+
+    def get_json_data(self, context):
+        data = super(EditView, self).get_json_data(context)
+        if "version" in context:
+            data["version"] = context["version"]
+        return data
+
+    def get_exclude(self):
+        exclude = super(EditView, self).get_exclude()
+        if self.version_field:
+            # Only saving changes the version
+            exclude = list(exclude or []) + [self.version_field]
+        return exclude
+
+    def get_object(self):
+        obj = super(EditView, self).get_object()
+        # To tell which fields change, however they're changed
+        self.loaded_values = self.get_field_values(obj)
+        return obj
+
+    def get_saved_fields(self):
+        """Return the model fields that saving could write"""
+        return [
+            field
+            for field in self.bread.model._meta.concrete_fields
+            if not field.primary_key and field.name != self.version_field
+        ]
+
+    def get_field_values(self, obj):
+        return {
+            field.name: getattr(obj, field.attname) for field in self.get_saved_fields()
+        }
+
+    def get_update_fields(self, form):
+        """
+        Return the names of the model fields to save: those the form changed
+        or whose values aren't what they were when the object was loaded, and
+        those with `auto_now`, unless nothing changed. If
+        `save_changed_fields_only` is False, all of them.
+        """
+        fields = {field.name: field for field in self.get_saved_fields()}
+        if not self.save_changed_fields_only:
+            return list(fields)
+        values = self.get_field_values(form.instance)
+        update_fields = [
+            name
+            for name in fields
+            if name in form.changed_data or values[name] != self.loaded_values[name]
+        ]
+        if update_fields:
+            update_fields += [
+                name
+                for name, field in fields.items()
+                if getattr(field, "auto_now", False) and name not in update_fields
+            ]
+        return update_fields
+
+    def get_expected_version(self):
+        """Return the version of the object the form was made from"""
+        try:
+            return int(self.request.POST[self.version_kwarg])
+        except (KeyError, ValueError):
+            raise Http400("Missing or invalid %s" % self.version_kwarg)
+
+    def save_form(self, form):
+        """
+        Save the fields of the object that the form changed, and its
+        many-to-many data, and return the object. With `version_field`, raise
+        ValidationError if the object isn't at the expected version anymore.
+        """
+        obj = form.save(commit=False)
+        update_fields = self.get_update_fields(form)
+        if not self.version_field:
+            if self.save_changed_fields_only:
+                obj.save(update_fields=update_fields)
+            else:
+                obj.save()
+        elif update_fields:
+            self.save_version(obj, update_fields, self.get_expected_version())
+        form.save_m2m()
+        return obj
+
+    def save_version(self, obj, update_fields, expected_version):
+        """
+        Save `update_fields` of `obj` with one UPDATE query, incrementing its
+        `version_field`, if the record's version is still `expected_version`.
+        Otherwise raise ValidationError, without changing anything.
+        """
+        values = {}
+        for name in update_fields:
+            field = obj._meta.get_field(name)
+            # e.g. sets auto_now fields to the current time
+            values[field.attname] = field.pre_save(obj, False)
+        values[self.version_field] = expected_version + 1
+        updated = (
+            obj._meta.base_manager.filter(
+                pk=obj.pk, **{self.version_field: expected_version}
+            )
+            .using(router.db_for_write(type(obj), instance=obj))
+            .update(**values)
+        )
+        if not updated:
+            raise ValidationError(self.conflict_message, code="conflict")
+        setattr(obj, self.version_field, expected_version + 1)
+        # No post_save signal, so let caches know
+        bump_model_version(type(obj))
+
 
 class AddView(BreadViewMixin, CreateView):
+    """
+    Adds a record with the form. If `formset` is True, adds several at once
+    instead, with a formset of the form class, which must be a model form.
+    All the forms are validated, checking unique fields with one query per
+    unique check for all of them (see `bread.formsets`), and the new records
+    are saved with one `bulk_create()`. Like `bulk_create()`, `save()` isn't
+    called and no signals are sent, but the model's version is bumped (see
+    `bread.cache`). If the primary keys of the new records are needed, for
+    JSON or many-to-many fields, and the database can't return them from a
+    bulk insert (e.g. MySQL), they're saved one at a time instead.
+    """
+
+    formset = False  # Add several records at once, with a formset
+    formset_extra = 3  # Blank forms in the formset
+    formset_max_num = 100  # Most records to add at once
     perm_name = "add"  # Default Django permission
     template_name_suffix = "_edit"  # Yes 'edit' not 'add'
 
+    def get(self, request, *args, **kwargs):
+        if not self.formset:
+            return super(AddView, self).get(request, *args, **kwargs)
+        return self.render_to_response(
+            self.get_context_data(formset=self.get_formset())
+        )
+
+    def post(self, request, *args, **kwargs):
+        if not self.formset:
+            return super(AddView, self).post(request, *args, **kwargs)
+        formset = self.get_formset(data=request.POST, files=request.FILES)
+        if formset.is_valid():
+            return self.formset_valid(formset)
+        return self.formset_invalid(formset)
+
+    def form_valid(self, form):
+        if not self.wants_json():
+            return super(AddView, self).form_valid(form)
+        self.object = form.save()
+        return self.render_to_json_response({"pk": self.object.pk}, status=201)
+
     def form_invalid(self, form):
         # Return a 400 if the form isn't valid
         rsp = super(AddView, self).form_invalid(form)
         rsp.status_code = 400
         return rsp
 
+    def get_formset_class(self):
+        """
+        Return a BulkModelFormSet class for the form class `get_form()` uses.
+        It's only made the first time it's needed for each Bread class, view
+        class and form class.
+        """
+        form_class = (
+            self.form_class or self.bread.form_class or self.get_default_form_class()
+        )
+        key = (type(self.bread), type(self), form_class, "formset")
+        formset_class = _form_classes.get(key)
+        if formset_class is None:
+            formset_class = _form_classes[key] = modelformset_factory(
+                self.bread.model,
+                form=type(form_class.__name__, (BulkModelFormMixin, form_class), {}),
+                formset=BulkModelFormSet,
+                extra=self.formset_extra,
+                max_num=self.formset_max_num,
+                absolute_max=self.formset_max_num,
+                validate_max=True,
+            )
+        return formset_class
+
+    def get_formset(self, data=None, files=None, **kwargs):
+        # Only new records, so don't query for existing ones
+        kwargs.setdefault("queryset", self.bread.model._default_manager.none())
+        return self.get_formset_class()(data=data, files=files, **kwargs)
+
+    def formset_valid(self, formset):
+        model = self.bread.model
+        objs = formset.save(commit=False)
+        using = router.db_for_write(model)
+        # The response and the many-to-many fields need the new primary keys,
+        # which not every database can return from a bulk insert
+        needs_pks = self.wants_json() or model._meta.many_to_many
+        with transaction.atomic(using=using):
+            if needs_pks and not (
+                connections[using].features.can_return_rows_from_bulk_insert
+            ):
+                for obj in objs:
+                    obj.save(using=using)
+            else:
+                self.bulk_create(objs)
+            formset.save_m2m()
+        # No post_save signals from bulk_create(), so let caches know
+        bump_model_version(model)
+        if self.wants_json():
+            return self.render_to_json_response(
+                {"pks": [obj.pk for obj in objs]}, status=201
+            )
+        return HttpResponseRedirect(self.get_success_url())
+
+    def formset_invalid(self, formset):
+        rsp = self.render_to_response(self.get_context_data(formset=formset))
+        rsp.status_code = 400
+        return rsp
+
+    def get_json_data(self, context):
+        formset = context.get("formset")
+        if formset is None:
+            return super(AddView, self).get_json_data(context)
+        data = {"forms": [self.get_form_json_data(form) for form in formset]}
+        if formset.is_bound:
+            data["errors"] = formset.non_form_errors().get_json_data()
+        return data
+
+    def bulk_create(self, objs):
+        """Save the new model instances from the formset"""
+        self.bread.model._default_manager.bulk_create(objs)
+
 
 class DeleteView(BreadViewMixin, DeleteView):
+    delete_batch_size = 500  # Records per batch, for delete_in_background
+    delete_executor = None  # Executor for delete_in_background; None for a thread pool
+    delete_in_background = False  # Delete the object and its cascade in batches
+    deletion_cache_alias = "default"  # Where the progress of deletions is kept
+    job_kwarg = "job"  # Query parm with the id of a background deletion
     perm_name = "delete"  # Default Django permission
     template_name_suffix = "_delete"
 
+    def get(self, request, *args, **kwargs):
+        job_id = request.GET.get(self.job_kwarg)
+        if not (self.delete_in_background and job_id):
+            return super(DeleteView, self).get(request, *args, **kwargs)
+        # The object may be gone, so just show how the deletion is going
+        progress = DeletionJob.get_progress(job_id, self.deletion_cache_alias)
+        if progress is None:
+            raise Http404("No such deletion")
+        self.object = None
+        return self.render_to_response(self.get_context_data(deletion=progress))
+
+    def get_context_data(self, **kwargs):
+        data = super(DeleteView, self).get_context_data(**kwargs)
+        if self.delete_in_background and self.object is not None:
+            data["cascade_counts"] = [
+                (model._meta.verbose_name_plural, count)
+                for model, count in count_cascade(self.get_deletion_queryset())
+            ]
+        return data
+
+    def get_json_data(self, context):
+        if "deletion" in context:
+            return context["deletion"]
+        return super(DeleteView, self).get_json_data(context)
+
+    def get_deletion_queryset(self):
+        """Return a queryset of just the object, to delete in the background"""
+        return self.bread.model._base_manager.filter(pk=self.object.pk)
+
+    def post(self, request, *args, **kwargs):
+        if self.delete_in_background:
+            return self.start_deletion()
+        if not self.wants_json():
+            return super(DeleteView, self).post(request, *args, **kwargs)
+        self.object = self.get_object()
+        pk = self.object.pk
+        self.object.delete()
+        return self.render_to_json_response({"pk": pk})
+
+    def start_deletion(self):
+        """
+        Start deleting the object in the background, and redirect to this
+        view with the job's id, to show its progress. For JSON, respond with
+        the id and the URL to poll for progress instead.
+        """
+        self.object = self.get_object()
+        job = DeletionJob(
+            self.get_deletion_queryset(),
+            self.delete_batch_size,
+            self.deletion_cache_alias,
+        )
+        job.start(self.delete_executor)
+        progress_url = self._get_new_url(**{self.job_kwarg: job.id})
+        if self.wants_json():
+            return self.render_to_json_response(
+                {"pk": self.object.pk, "job": job.id, "progress_url": progress_url},
+                status=202,
+            )
+        return HttpResponseRedirect(progress_url)
+
+
+class ImportView(BreadViewMixin, GenericModelView):
+    """
+    Adds records from an uploaded CSV file, whose first row has the names
+    of the form's fields. Each row is validated with the form the Bread's add
+    view uses, unless this view has its own `form_class` or `exclude`, and
+    the valid ones are saved with `bulk_create()`,
+    `chunk_size` at a time, each chunk in its own transaction.
+
+    The file is read one row at a time, and at most `max_errors` invalid rows
+    are reported, so memory use doesn't depend on how big it is. Like
+    `bulk_create()`, `save()` isn't called, no signals are sent, and
+    many-to-many fields aren't saved, but the model's version is bumped after
+    each chunk (see `bread.cache`).
+    """
+
+    chunk_size = 1000  # Records per bulk_create()
+    file_field_name = "file"  # Name of the file upload in the form
+    integrity_error_message = gettext_lazy(
+        "This row conflicts with data in the database or earlier in the file."
+    )
+    max_errors = 100  # Invalid rows to report
+    perm_name = "add"  # Default Django permission
+    template_name_suffix = "_import"
+
+    def get(self, request, *args, **kwargs):
+        return self.render_to_response(self.get_context_data())
+
+    def post(self, request, *args, **kwargs):
+        upload = request.FILES.get(self.file_field_name)
+        if upload is None:
+            raise Http400("No file was uploaded")
+        try:
+            result = self.import_rows(self.iter_rows(upload))
+        except (csv.Error, UnicodeDecodeError) as e:
+            raise Http400("The file is not valid CSV: %s" % e)
+        return self.render_to_response(self.get_context_data(**result))
+
+    def get_context_data(self, **kwargs):
+        data = super(ImportView, self).get_context_data(**kwargs)
+        data["file_field_name"] = self.file_field_name
+        data["field_names"] = list(self.get_form().fields)
+        return data
+
+    def get_form(self, data=None, files=None, **kwargs):
+        if self.form_class or self.exclude:
+            return super(ImportView, self).get_form(data=data, files=files, **kwargs)
+        # The same form as adding records one at a time
+        add_view = self.bread.add_view(
+            bread=self.bread, model=self.model, request=self.request
+        )
+        return add_view.get_form(data=data, files=files, **kwargs)
+
+    def get_json_data(self, context):
+        return {
+            "imported": context.get("imported"),
+            "error_count": context.get("error_count"),
+            "errors": context.get("import_errors"),
+        }
+
+    def iter_rows(self, upload):
+        """Yield (line number, dictionary of the row's values) for each row
+        of the uploaded CSV file"""
+        text = io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline="")
+        reader = csv.DictReader(text)
+        for row in reader:
+            yield reader.line_num, row
+
+    def import_rows(self, rows):
+        """
+        Validate and save the rows from `iter_rows()`, and return a dictionary
+        with how many were `imported`, the `error_count` and a list of
+        `import_errors` (at most `max_errors`), each with the `line` and the
+        form's `errors`.
+        """
+        imported = error_count = 0
+        errors = []
+        chunk = []  # (line, model instance)
+        using = router.db_for_write(self.model)
+
+        def add_error(line, form_errors):
+            nonlocal error_count
+            error_count += 1
+            if len(errors) < self.max_errors:
+                errors.append({"line": line, "errors": form_errors})
+
+        def save_chunk():
+            nonlocal imported
+            try:
+                with transaction.atomic(using=using):
+                    self.bulk_create([obj for __, obj in chunk])
+            except IntegrityError:
+                # e.g. the same unique value twice in the chunk. Find the
+                # rows at fault by saving them one at a time.
+                with transaction.atomic(using=using):
+                    for line, obj in chunk:
+                        try:
+                            with transaction.atomic(using=using):
+                                self.bulk_create([obj])
+                        except IntegrityError:
+                            add_error(line, self.get_integrity_errors(obj))
+                        else:
+                            imported += 1
+            else:
+                imported += len(chunk)
+            chunk.clear()
+            # No post_save signals, so let caches know, once it's committed
+            bump_model_version(self.model)
+
+        for line, row in rows:
+            form = self.get_form(data=row)
+            if not form.is_valid():
+                add_error(line, form.errors.get_json_data())
+                continue
+            chunk.append((line, form.save(commit=False)))
+            if len(chunk) >= self.chunk_size:
+                save_chunk()
+        if chunk:
+            save_chunk()
+        return {
+            "imported": imported,
+            "error_count": error_count,
+            "import_errors": errors,
+        }
+
+    def bulk_create(self, objs):
+        """Save a chunk of new model instances"""
+        self.model._default_manager.bulk_create(objs)
+
+    def get_integrity_errors(self, obj):
+        """
+        Return the errors, like a form's, for a new model instance that
+        couldn't be saved because of an IntegrityError: the unique checks
+        it fails now that the rows before it are saved, if any.
+        """
+        try:
+            obj.validate_unique()
+        except ValidationError as e:
+            return ErrorDict(
+                (field, ErrorList(field_errors))
+                for field, field_errors in e.error_dict.items()
+            ).get_json_data()
+        return {
+            NON_FIELD_ERRORS: [
+                {"message": str(self.integrity_error_message), "code": "integrity"}
+            ]
+        }
+
+
+class AsyncBreadViewMixin(object):
+    """
+    Mix this in before a Bread view class to handle GET requests with a
+    coroutine, checking permissions and querying with Django's async ORM
+    methods, so under ASGI a request doesn't take up a thread while it waits
+    for the database. Bread makes async views this way when its
+    `async_views` is True.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        # The same checks as BreadViewMixin.dispatch, without blocking
+        if self.get_permission_key() not in _existing_permissions:
+            await sync_to_async(self.check_permission_exists)()
+
+        user = request.user
+        if isinstance(user, LazyObject) and user._wrapped is empty:
+            # Loading the user from the session queries the database
+            await sync_to_async(user._setup)()
+        if not user.is_authenticated:
+            return redirect_to_login(
+                request.get_full_path(), settings.LOGIN_URL, REDIRECT_FIELD_NAME
+            )
+
+        # Look up the permissions the context needs now too, since the
+        # backends may query the database
+        resolver = self.get_permission_resolver(request)
+        perms = await resolver.ahas_perms(
+            [self.permission_required] + self.get_context_perm_names()
+        )
+        if not perms[self.permission_required]:
+            raise PermissionDenied
+
+        try:
+            response = await super(BreadViewMixin, self).dispatch(
+                request, *args, **kwargs
+            )
+        except Http400 as e:
+            return HttpResponseBadRequest(content=escape(e.msg).encode("utf-8"))
+        patch_vary_headers(response, ["Accept"])
+        return response
+
+    async def aget_conditional_response(
+        self, request, etag, last_modified, get_response
+    ):
+        """Like `get_conditional_response`, but `get_response` is a coroutine
+        function"""
+        response = self.get_not_modified_response(request, etag, last_modified)
+        if response is None:
+            response = self.add_validator_headers(
+                request, await get_response(), etag, last_modified
+            )
+        return response
+
+
+class AsyncBrowseViewMixin(AsyncBreadViewMixin):
+    """
+    An async version of BrowseView's GET handler. The results are counted
+    with `acount()` and fetched by iterating asynchronously. Filtering,
+    and pagination that isn't a plain exact count, have to query the
+    database in a thread instead.
+    """
+
+    known_count = None  # The count of the results, once it's been made
+
+    async def get(self, request, *args, **kwargs):
+        if not self.last_modified_field:
+            return await self.aget_response()
+        queryset = await self.aget_queryset()
+        summary = await queryset.aaggregate(
+            count=Count("pk"), last_modified=Max(self.last_modified_field)
+        )
+        models = self.get_column_models()
+        model_versions = []
+        if models:
+            model_versions = await sync_to_async(get_model_versions)(models)
+        version = self.get_results_version(summary, model_versions)
+        return await self.aget_conditional_response(
+            request,
+            self.get_etag(version),
+            None,
+            lambda: self.aget_response(queryset),
+        )
+
+    async def aget_response(self, queryset=None):
+        """The async version of ListView.get(), for the results `queryset`
+        if it's already made"""
+        if queryset is None:
+            queryset = await self.aget_queryset()
+        paginate_by = self.get_paginate_by()
+
+        if not self.allow_empty and not await queryset.aexists():
+            raise Http404
+
+        page = None
+        if paginate_by is None:
+            self.object_list = queryset
+        else:
+            page = await self.apaginate_queryset(queryset, paginate_by)
+            self.object_list = page.object_list
+
+        # The JSON rows may be fetched from the queryset with values_list()
+        wants_json = self.wants_json()
+        if not wants_json and isinstance(self.object_list, QuerySet):
+            self.object_list = [obj async for obj in self.object_list]
+            if page is not None:
+                page.object_list = self.object_list
+        context = self.get_context_data(
+            page_obj=page,
+            is_paginated=page is not None and page.has_other_pages(),
+            paginator=page and page.paginator,
+        )
+        if wants_json:
+            return await sync_to_async(self.render_to_response)(context)
+        return self.render_to_response(context)
+
+    async def post(self, request, *args, **kwargs):
+        """Bulk actions run in a thread"""
+        return await sync_to_async(super(AsyncBrowseViewMixin, self).post)(
+            request, *args, **kwargs
+        )
+
+    async def aget_queryset(self):
+        """Return `get_queryset()`, made in a thread if a filterset might
+        query the database to validate the filters"""
+        if self.filterset is not None:
+            return await sync_to_async(self.get_queryset)()
+        return self.get_queryset()
+
+    async def apaginate_queryset(self, queryset, page_size):
+        """
+        Return `paginate_queryset()`. If the results are counted exactly,
+        the count is made with `acount()` and the page isn't fetched yet.
+        """
+        if (
+            self.keyset_pagination
+            or self.cache_results
+            or self.count_strategy != "exact"
+        ):
+            return await sync_to_async(self.paginate_queryset)(queryset, page_size)
+        self.known_count = await queryset.acount()
+        return self.paginate_queryset(queryset, page_size)
+
+    def get_paginator(self, queryset, page_size):
+        if self.known_count is not None:
+            return KnownCountPaginator(queryset, page_size, self.known_count)
+        return super(AsyncBrowseViewMixin, self).get_paginator(queryset, page_size)
+
+
+class AsyncReadViewMixin(AsyncBreadViewMixin):
+    """
+    An async version of ReadView's GET handler, which fetches the object
+    with `aget()`.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        self.object = await self.aget_object()
+        if not (self.etag_field or self.last_modified_field):
+            return await self.aget_response()
+        etag = last_modified = None
+        if self.etag_field:
+            etag = self.get_etag(getattr(self.object, self.etag_field))
+        if self.last_modified_field:
+            last_modified = getattr(self.object, self.last_modified_field)
+        return await self.aget_conditional_response(
+            request, etag, last_modified, self.aget_response
+        )
+
+    async def aget_object(self):
+        """The async version of `get_object()`"""
+        queryset = self.get_queryset()
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            lookup = {self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        except KeyError:
+            raise ImproperlyConfigured(
+                "Lookup field '%s' was not provided in view kwargs to '%s'"
+                % (lookup_url_kwarg, type(self).__name__)
+            )
+        try:
+            return await queryset.aget(**lookup)
+        except queryset.model.DoesNotExist:
+            raise Http404(
+                "No %s matches the given query." % queryset.model._meta.object_name
+            )
+
+    async def aget_response(self):
+        if self.context_data_may_query():
+            context = await sync_to_async(self.get_context_data)()
+        else:
+            context = self.get_context_data()
+        return self.render_to_response(context)
+
+    def context_data_may_query(self):
+        """
+        Return True if making the context may query the database, so it has
+        to be done in a thread: the form looks up the values of many-to-many
+        fields, and LabelValueReadView's fields can be anything. Override
+        if your view's context needs more.
+        """
+        return bool(self.bread.model._meta.many_to_many) or isinstance(
+            self, LabelValueReadView
+        )
+
+
+def _escape_braces(s):
+    return s.replace("{", "{{").replace("}", "}}")
+
 
 class Bread(object):
     """
@@ -550,18 +2219,28 @@ class Bread(object):
     edit_view = EditView
     add_view = AddView
     delete_view = DeleteView
+    export_view = ExportView
+    import_view = ImportView
 
     exclude = []  # Names of fields not to show
     views = "BREAD"
     base_template = setting("DEFAULT_BASE_TEMPLATE", "base.html")
+    template_engine = setting("TEMPLATE_ENGINE")
     namespace = ""
     template_name_pattern = None
     plural_name = None
     form_class = None
+    permission_resolver_class = PermissionResolver
+    async_views = False  # Use async browse and read views
+
+    # Put in the place of the primary key when working out URL templates
+    url_pk_placeholder = 918273645
 
     def __init__(self):
         self.name = self.model._meta.object_name.lower()
         self.views = self.views.upper()
+        # Maps (urlconf, view name) to the view's URL template
+        self._url_templates = {}
 
         if not self.plural_name:
             self.plural_name = self.name + "s"
@@ -581,6 +2260,27 @@ class Bread(object):
                 column = colspec[1]
                 validate_fieldspec(self.model, column)
 
+        # Work out what the browse view needs to know about its columns and
+        # search fields now, rather than on the first request
+        self.browse_view.get_valid_sorting_columns(self.model)
+        if self.browse_view.search_fields:
+            self.browse_view.search_backend.prepare(self.browse_view, self.model)
+        if self.browse_view.cache_rows:
+            watch_models(
+                self.browse_view.get_row_cache_models(self.model),
+                self.browse_view.row_cache_alias,
+            )
+        if self.browse_view.last_modified_field:
+            # The ETags include the versions of the models the columns show
+            watch_models(self.browse_view.get_row_cache_models(self.model)[1:])
+        if self.browse_view.cache_results:
+            # Start watching for changes now, so any made before the first
+            # request will invalidate the results cached by other processes
+            watch_models(
+                self.browse_view.get_results_cache_models(self.model),
+                self.browse_view.results_cache_alias,
+            )
+
         if hasattr(self, "paginate_by") or hasattr(self, "columns"):
             raise ValueError(
                 "The 'paginate_by' and 'columns' settings have been moved "
@@ -623,7 +2323,7 @@ class Bread(object):
     def get_browse_view(self):
         """Return a view method for browsing."""
 
-        return self.browse_view.as_view(
+        return self.get_view_class(self.browse_view, AsyncBrowseViewMixin).as_view(
             bread=self,
             model=self.model,
         )
@@ -634,8 +2334,11 @@ class Bread(object):
     def read_url_name(self, include_namespace=True):
         return self.get_url_name("read", include_namespace)
 
+    def read_url(self, pk):
+        return self.get_url("read", pk)
+
     def get_read_view(self):
-        return self.read_view.as_view(
+        return self.get_view_class(self.read_view, AsyncReadViewMixin).as_view(
             bread=self,
             model=self.model,
         )
@@ -646,6 +2349,9 @@ class Bread(object):
     def edit_url_name(self, include_namespace=True):
         return self.get_url_name("edit", include_namespace)
 
+    def edit_url(self, pk):
+        return self.get_url("edit", pk)
+
     def get_edit_view(self):
         return self.edit_view.as_view(
             bread=self,
@@ -670,25 +2376,117 @@ class Bread(object):
     def delete_url_name(self, include_namespace=True):
         return self.get_url_name("delete", include_namespace)
 
+    def delete_url(self, pk):
+        return self.get_url("delete", pk)
+
     def get_delete_view(self):
         return self.delete_view.as_view(
             bread=self,
             model=self.model,
         )
 
+    ##########
+    # Export #
+    ##########
+    def export_url_name(self, include_namespace=True):
+        return self.get_url_name("export", include_namespace)
+
+    def get_export_view(self):
+        view_class = type(
+            "Export%s" % self.browse_view.__name__,
+            (self.export_view, self.browse_view),
+            {},
+        )
+        return view_class.as_view(
+            bread=self,
+            model=self.model,
+        )
+
+    ##########
+    # Import #
+    ##########
+    def import_url_name(self, include_namespace=True):
+        return self.get_url_name("import", include_namespace)
+
+    def get_import_view(self):
+        return self.import_view.as_view(
+            bread=self,
+            model=self.model,
+        )
+
     ##########
     # Common #
     ##########
+    def get_view_class(self, view_class, async_mixin):
+        """
+        Return `view_class`, or if `async_views` is True, a subclass of it
+        with `async_mixin` mixed in (unless it already has it).
+        """
+        if not self.async_views or issubclass(view_class, async_mixin):
+            return view_class
+        if django.VERSION < (4, 1):
+            # No async queries (aget(), acount(), ...) before that
+            raise ImproperlyConfigured("async_views requires Django 4.1 or later")
+        return type("Async%s" % view_class.__name__, (async_mixin, view_class), {})
+
     def get_url_name(self, view_name, include_namespace=True):
         if include_namespace:
             url_namespace = self.namespace + ":" if self.namespace else ""
         else:
             url_namespace = ""
-        if view_name == "browse":
+        if view_name in ("browse", "export", "import"):
             return "%s%s_%s" % (url_namespace, view_name, self.plural_name)
         else:
             return "%s%s_%s" % (url_namespace, view_name, self.name)
 
+    def get_url(self, view_name, pk=None):
+        """
+        Return the URL of one of this Bread's views ('browse', 'read', etc.),
+        for the object with primary key `pk` if the view needs one.
+
+        This gives the same result as `reverse()` with the view's URL name,
+        but only uses the URL resolver the first time for each view (and
+        language, for `i18n_patterns()`), so it's much faster when making URLs
+        for many objects. If the view's URL doesn't take an integer `pk`, like
+        `<uuid:pk>`, it uses `reverse()` every time.
+        """
+        urlconf = get_urlconf() or getattr(settings, "ROOT_URLCONF", None)
+        key = (urlconf, get_language(), view_name)
+        template = self._url_templates.get(key)
+        if template is None:
+            try:
+                template = self.get_url_template(view_name)
+            except NoReverseMatch:
+                if pk is None:
+                    raise
+                # The placeholder doesn't fit the URL pattern
+                template = False
+            self._url_templates[key] = template
+        if template is False:
+            return reverse(self.get_url_name(view_name), kwargs={"pk": pk})
+        if pk is not None:
+            template = template.format(
+                pk=quote(str(pk), safe=RFC3986_SUBDELIMS + "~:@")
+            )
+        return get_script_prefix() + template
+
+    def get_url_template(self, view_name):
+        """
+        Return a template for the URL of one of this Bread's views, without
+        the script prefix, to make URLs from with `format(pk=pk)`.
+        """
+        url_name = self.get_url_name(view_name)
+        if view_name in ("read", "edit", "delete"):
+            url = reverse(url_name, kwargs={"pk": self.url_pk_placeholder})
+        else:
+            url = reverse(url_name)
+        prefix_length = len(get_script_prefix())
+        url = url[prefix_length:]
+        if view_name in ("read", "edit", "delete"):
+            before, __, after = url.rpartition(str(self.url_pk_placeholder))
+            return "%s{pk}%s" % (_escape_braces(before), _escape_braces(after))
+        return url
+
     def get_urls(self, prefix=True):
         """
         Return urlpatterns to add for this model's BREAD interface.
@@ -702,13 +2500,16 @@ class Bread(object):
            Edit         edit_<name>            <plural_name>/<pk>/edit/
            Add          add_<name>             <plural_name>/add/
            Delete       delete_<name>          <plural_name>/<pk>/delete/
+           Export       export_<plural_name>   <plural_name>/export/
+           Import       import_<plural_name>   <plural_name>/import/
 
         Example usage:
 
             urlpatterns += my_bread.get_urls()
 
         If a restricted set of views is passed in the 'views' parameter, then
-        only URLs for those views will be included.
+        only URLs for those views will be included. The export and import
+        views are only included if 'views' contains 'X' or 'I'.
 
         If prefix is False, ``<plural_name>/`` will not be included on
         the front of the URLs.
@@ -762,4 +2563,22 @@ class Bread(object):
                     name=self.delete_url_name(include_namespace=False),
                 )
             )
+
+        if "X" in self.views:
+            urlpatterns.append(
+                path(
+                    "%sexport/" % prefix,
+                    self.get_export_view(),
+                    name=self.export_url_name(include_namespace=False),
+                )
+            )
+
+        if "I" in self.views:
+            urlpatterns.append(
+                path(
+                    "%simport/" % prefix,
+                    self.get_import_view(),
+                    name=self.import_url_name(include_namespace=False),
+                )
+            )
         return urlpatterns
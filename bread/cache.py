@@ -0,0 +1,164 @@
+"""
+Version numbers for models, to build cache keys that change whenever the
+model's data changes.
+
+Each watched model has a version number kept in a Django cache, which is
+increased every time one of its records is saved or deleted, or one of its
+many-to-many relations changes. A cache key that includes the versions of
+all the models some cached data came from will never return that data again
+once any of them has changed.
+
+Changes that don't send signals, like `QuerySet.update()`, don't change the
+version. Call `bump_model_version` yourself after making them.
+
+The signal receivers are only connected for the watched models (deleting
+records of a model with `post_delete` receivers can't skip fetching them),
+and only in processes that watch them: Bread does that when it's created,
+with `cache_results` or `cache_rows`. Processes that change the records
+without creating the Bread, like management commands or task workers, must
+call `watch_models` themselves (e.g. in `AppConfig.ready()`), or their
+changes won't change the versions.
+
+This module also has RowFragmentCache, which caches the HTML of the rows
+of the browse table.
+"""
+import time
+from functools import partial
+
+from django.apps import apps
+from django.core.cache import caches
+from django.db import router, transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+# Maps each watched model to the set of the aliases of the caches
+# its version is kept in
+_watched_models = {}
+
+
+def get_version_key(model):
+    return "bread:version:%s" % model._meta.label_lower
+
+
+def _new_version():
+    # Start from the time, so that if a version is evicted from the cache,
+    # it doesn't start again from a number that's been used before.
+    return int(time.time() * 1000000)
+
+
+def watch_models(models, cache_alias="default"):
+    """Start keeping version numbers for `models` in the cache `cache_alias`"""
+    for model in models:
+        model = model._meta.concrete_model
+        if model not in _watched_models:
+            _watched_models[model] = set()
+            connect_receivers(model)
+        _watched_models[model].add(cache_alias)
+
+
+def connect_receivers(model):
+    """
+    Connect the signal receivers that bump the version of `model`: for
+    saving and deleting its records (and those of its proxies and
+    subclasses), and changing its many-to-many relations.
+    """
+    for sender in apps.get_models():
+        opts = sender._meta
+        if opts.concrete_model is model or model in opts.get_parent_list():
+            post_save.connect(
+                model_changed, sender=sender, dispatch_uid="bread_model_saved"
+            )
+            post_delete.connect(
+                model_changed, sender=sender, dispatch_uid="bread_model_deleted"
+            )
+    for field in model._meta.get_fields():
+        if field.many_to_many:
+            through = field.remote_field.through if field.concrete else field.through
+            m2m_changed.connect(
+                m2m_relation_changed, sender=through, dispatch_uid="bread_m2m_changed"
+            )
+
+
+def get_model_versions(models, cache_alias="default"):
+    """
+    Return a list of the current version numbers of `models`, in the
+    cache `cache_alias`, starting any that aren't there yet.
+    """
+    watch_models(models, cache_alias)
+    cache = caches[cache_alias]
+    keys = [get_version_key(model._meta.concrete_model) for model in models]
+    versions = cache.get_many(keys)
+    missing = [key for key in keys if key not in versions]
+    if missing:
+        for key in missing:
+            cache.add(key, _new_version(), None)
+        # Another process may have added them first
+        versions.update(cache.get_many(missing))
+    return [versions.get(key, 0) for key in keys]
+
+
+def bump_model_version(model, using=None):
+    """
+    Change the version number of `model`, in every cache it's kept in.
+
+    If that's done in a transaction on the database `using` (by default,
+    the one the model is written to), it's changed again when the
+    transaction is committed, so that anything cached by other requests
+    in the meantime, from the data before the commit, isn't used.
+    """
+    models = [model._meta.concrete_model] + model._meta.get_parent_list()
+    if not any(model in _watched_models for model in models):
+        return
+    _bump_versions(models)
+    if using is None:
+        using = router.db_for_write(model)
+    if transaction.get_connection(using).in_atomic_block:
+        transaction.on_commit(partial(_bump_versions, models), using=using)
+
+
+def _bump_versions(models):
+    for model in models:
+        key = get_version_key(model)
+        for cache_alias in _watched_models.get(model, ()):
+            cache = caches[cache_alias]
+            try:
+                cache.incr(key)
+            except ValueError:
+                # Not in the cache (any more)
+                cache.set(key, _new_version(), None)
+
+
+def model_changed(sender, using=None, **kwargs):
+    bump_model_version(sender, using)
+
+
+def m2m_relation_changed(sender, instance, action, model, using=None, **kwargs):
+    if action.startswith("post_"):
+        bump_model_version(sender, using)
+        bump_model_version(type(instance), using)
+        bump_model_version(model, using)
+
+
+class RowFragmentCache(object):
+    """
+    The cached HTML of the rows of a page of the browse table, which the
+    `browse_row` template tag uses instead of rendering them again.
+
+    `keys` maps the primary key of each record on the page to the cache key
+    for its row. The rows that are already cached are all fetched at once.
+    """
+
+    def __init__(self, keys, cache_alias="default", timeout=300):
+        self.keys = keys
+        self.cache = caches[cache_alias]
+        self.timeout = timeout
+        self.fragments = self.cache.get_many(list(keys.values())) if keys else {}
+
+    def get(self, obj):
+        """Return the cached HTML of the row for `obj`, or None"""
+        return self.fragments.get(self.keys.get(obj.pk))
+
+    def set(self, obj, fragment):
+        """Cache the HTML of the row for `obj`"""
+        key = self.keys.get(obj.pk)
+        if key is not None:
+            self.cache.set(key, fragment, self.timeout)
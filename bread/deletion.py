@@ -0,0 +1,238 @@
+"""
+Deleting records with big cascades in small batches, optionally in the
+background.
+
+`QuerySet.delete()` collects everything that a deletion cascades to, then
+deletes it all in one transaction. With hundreds of thousands of related
+records, that uses a lot of memory and holds locks for a long time. Here,
+the cascade is followed one relation at a time with querysets (subqueries)
+instead, and the records are deleted from the bottom up, `batch_size` at a
+time, each batch in its own short transaction. Each batch is deleted with
+`QuerySet.delete()`, so signals are still sent and `SET_NULL` and similar
+relations are still handled.
+
+The deletion as a whole isn't atomic: if it fails partway through, the
+records already deleted stay deleted.
+
+A DeletionJob runs a deletion on an executor (by default, a shared thread
+pool) and keeps its progress in a cache, so any process can report it.
+"""
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.cache import caches
+from django.db import connections, transaction
+from django.db.models import PROTECT, RESTRICT
+from django.db.models.deletion import (
+    CASCADE,
+    Collector,
+    ProtectedError,
+    get_candidate_relations_to_delete,
+)
+
+# Beyond this many relations deep, leave the rest of the cascade to
+# QuerySet.delete(), rather than nesting subqueries any further
+MAX_DEPTH = 8
+
+
+def get_related_querysets(queryset, on_delete):
+    """
+    Return a queryset for each relation to the model of `queryset` whose
+    `on_delete` is one of `on_delete`, of the records related to the records
+    in `queryset`. They select them with subqueries, so nothing is fetched.
+    """
+    collector = Collector(using=queryset.db)
+    querysets = []
+    for related in get_candidate_relations_to_delete(queryset.model._meta):
+        if related.field.remote_field.on_delete in on_delete:
+            querysets.append(
+                collector.related_objects(
+                    related.related_model, [related.field], queryset
+                )
+            )
+    return querysets
+
+
+def get_cascaded_querysets(queryset, path=()):
+    """
+    Return querysets of the records that deleting the records in `queryset`
+    cascades to directly, except those in `path`, the querysets that the
+    cascade went through to get to `queryset`, so cycles don't go round and
+    round.
+    """
+    related_querysets = []
+    for related_queryset in get_related_querysets(queryset, [CASCADE]):
+        for earlier_queryset in [*path, queryset]:
+            if earlier_queryset.model is related_queryset.model:
+                related_queryset = related_queryset.exclude(
+                    pk__in=earlier_queryset.values("pk")
+                )
+        related_querysets.append(related_queryset)
+    return related_querysets
+
+
+def count_cascade(queryset, max_depth=MAX_DEPTH):
+    """
+    Return a list of (model, count) of the records that deleting the records
+    in `queryset` would also delete, because of relations with
+    `on_delete=CASCADE`. Each relation is counted with one aggregate query,
+    without fetching the records. A record may be counted more than once if
+    it can be reached through more than one relation.
+    """
+    counts = Counter()
+
+    def count(queryset, path):
+        for related_queryset in get_cascaded_querysets(queryset, path):
+            related_count = related_queryset.count()
+            if related_count:
+                counts[related_queryset.model] += related_count
+                if len(path) + 1 < max_depth:
+                    count(related_queryset, [*path, queryset])
+
+    count(queryset, [])
+    return list(counts.items())
+
+
+def check_protected(queryset, max_depth=MAX_DEPTH):
+    """
+    Raise ProtectedError if any of the records in `queryset`, or the records
+    their deletion would cascade to, are referred to by relations with
+    `on_delete=PROTECT` or `RESTRICT`, before anything has been deleted.
+    """
+
+    def check(queryset, path):
+        for related_queryset in get_related_querysets(queryset, [PROTECT, RESTRICT]):
+            protected = list(related_queryset[:1])
+            if protected:
+                raise ProtectedError(
+                    "Cannot delete some instances of model %r because they are "
+                    "referenced through protected foreign keys"
+                    % queryset.model.__name__,
+                    set(protected),
+                )
+        if len(path) + 1 < max_depth:
+            for related_queryset in get_cascaded_querysets(queryset, path):
+                if related_queryset.exists():
+                    check(related_queryset, [*path, queryset])
+
+    check(queryset, [])
+
+
+def delete_in_batches(queryset, batch_size=500, progress=None, max_depth=MAX_DEPTH):
+    """
+    Delete the records in `queryset` and those it cascades to, `batch_size`
+    at a time, starting with the most distantly related, each batch in its
+    own transaction. Call `progress(deleted)` with the total number deleted
+    so far after each batch.
+
+    First raise ProtectedError if `check_protected` does, since finding the
+    protected records partway through would be after deleting others.
+
+    Return the number of records deleted and a dictionary of the number
+    deleted for each model label, like `QuerySet.delete()`.
+    """
+    check_protected(queryset, max_depth)
+    deleted = Counter()
+
+    def delete(queryset, path):
+        if len(path) + 1 < max_depth:
+            for related_queryset in get_cascaded_querysets(queryset, path):
+                if related_queryset.exists():
+                    delete(related_queryset, [*path, queryset])
+        model = queryset.model
+        while True:
+            pks = list(queryset.values_list("pk", flat=True)[:batch_size])
+            if not pks:
+                break
+            with transaction.atomic(using=queryset.db):
+                __, batch_deleted = model._base_manager.filter(pk__in=pks).delete()
+            deleted.update(batch_deleted)
+            if progress is not None:
+                progress(sum(deleted.values()))
+            if len(pks) < batch_size or not batch_deleted.get(model._meta.label):
+                break
+
+    delete(queryset, [])
+    return sum(deleted.values()), dict(deleted)
+
+
+_default_executor = None
+
+
+def get_default_executor():
+    """Return the thread pool DeletionJobs use unless given another executor"""
+    global _default_executor
+    if _default_executor is None:
+        _default_executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="bread-deletion"
+        )
+    return _default_executor
+
+
+class DeletionJob(object):
+    """
+    Deletes the records in a queryset with `delete_in_batches`, on an
+    executor, keeping its progress in the cache `cache_alias` under its `id`.
+
+    The progress is a dictionary with the `status` ("pending", "running",
+    "done" or "failed"), the number of records `deleted` so far, the `total`
+    to delete (once it's been counted), and the `error` if it failed.
+    """
+
+    cache_timeout = 24 * 60 * 60  # Seconds to keep the progress for
+
+    def __init__(self, queryset, batch_size=500, cache_alias="default"):
+        self.id = uuid.uuid4().hex
+        self.queryset = queryset
+        self.batch_size = batch_size
+        self.cache_alias = cache_alias
+        self.progress = {"status": "pending", "deleted": 0, "total": None}
+
+    @staticmethod
+    def get_cache_key(job_id):
+        return "bread:deletion:%s" % job_id
+
+    @classmethod
+    def get_progress(cls, job_id, cache_alias="default"):
+        """Return the progress of the job with id `job_id`, or None if there's
+        no such job (or it finished too long ago)"""
+        return caches[cache_alias].get(cls.get_cache_key(job_id))
+
+    def update_progress(self, **progress):
+        self.progress.update(progress)
+        caches[self.cache_alias].set(
+            self.get_cache_key(self.id), self.progress, self.cache_timeout
+        )
+
+    def start(self, executor=None):
+        """Submit the job to `executor` (default: `get_default_executor()`), and
+        return the Future"""
+        self.update_progress()
+        return (executor or get_default_executor()).submit(self.run)
+
+    def run(self):
+        try:
+            total = self.queryset.count() + sum(
+                count for __, count in count_cascade(self.queryset)
+            )
+            self.update_progress(status="running", total=total)
+            delete_in_batches(
+                self.queryset,
+                self.batch_size,
+                progress=lambda deleted: self.update_progress(deleted=deleted),
+            )
+        except Exception as e:
+            self.update_progress(status="failed", error=str(e))
+            raise
+        else:
+            self.update_progress(status="done")
+        finally:
+            # Unlike a request's, a worker thread's connections aren't closed
+            # when it's done, but don't break a transaction if run inline
+            # (connections.all(initialized_only=True) needs Django 4.1)
+            for connection in connections.all():
+                if connection.connection is not None and not (
+                    connection.in_atomic_block
+                ):
+                    connection.close()
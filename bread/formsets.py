@@ -0,0 +1,103 @@
+"""
+Model formsets for adding many records at once.
+
+Validating a model form checks that its fields that must be unique (alone
+or together, with `unique` or `unique_together`) don't match an existing
+record, with a query for each check. In a formset of a hundred forms, that's
+hundreds of queries. Here the forms skip those checks, and the formset runs
+each of them once for all the forms, with a query that looks for any of
+their values.
+"""
+from django.core.exceptions import ValidationError
+from django.db import connections, router
+from django.db.models import Q
+from django.forms.models import BaseModelFormSet
+
+
+class BulkModelFormMixin(object):
+    """
+    Mix this into a model form used in a BulkModelFormSet, to leave its
+    unique checks to the formset. Checks of `unique_for_date` and similar
+    are still done by each form.
+    """
+
+    def validate_unique(self):
+        exclude = self._get_validation_exclusions()
+        __, date_checks = self.instance._get_unique_checks(exclude=exclude)
+        errors = self.instance._perform_date_checks(date_checks)
+        if errors:
+            self._update_errors(ValidationError(errors))
+
+
+class BulkModelFormSet(BaseModelFormSet):
+    """
+    A model formset for adding records, whose forms are BulkModelFormMixin
+    forms, and which checks that their unique values aren't in the database
+    yet with one query per unique check, as well as checking they're unique
+    among the forms.
+    """
+
+    def validate_unique(self):
+        self.validate_unique_in_database()
+        super(BulkModelFormSet, self).validate_unique()
+
+    def get_unique_values(self, form, model_class, unique_check):
+        """
+        Return a tuple of the values of the form's instance for the fields
+        in `unique_check`, or None if any of them have no value, in which
+        case there's nothing to check.
+        """
+        connection = connections[router.db_for_read(model_class)]
+        values = []
+        for field_name in unique_check:
+            field = model_class._meta.get_field(field_name)
+            value = getattr(form.instance, field.attname)
+            if value is None or (
+                value == "" and connection.features.interprets_empty_strings_as_nulls
+            ):
+                return None
+            values.append(value)
+        return tuple(values)
+
+    def validate_unique_in_database(self):
+        """
+        Add an error to each valid form with values that must be unique but
+        are already in the database.
+        """
+        # {(model class, field names): {values: [forms with those values]}}
+        checks = {}
+        for form in self.forms:
+            if not (form.is_valid() and form.has_changed()):
+                continue
+            unique_checks, __ = form.instance._get_unique_checks(
+                exclude=form._get_validation_exclusions()
+            )
+            for model_class, unique_check in unique_checks:
+                values = self.get_unique_values(form, model_class, unique_check)
+                if values is not None:
+                    checks.setdefault((model_class, unique_check), {}).setdefault(
+                        values, []
+                    ).append(form)
+
+        for (model_class, unique_check), forms in checks.items():
+            attnames = [
+                model_class._meta.get_field(field_name).attname
+                for field_name in unique_check
+            ]
+            if len(attnames) == 1:
+                condition = Q(
+                    **{"%s__in" % attnames[0]: [values[0] for values in forms]}
+                )
+            else:
+                condition = Q()
+                for values in forms:
+                    condition |= Q(**dict(zip(attnames, values)))
+            existing = model_class._default_manager.filter(condition).values_list(
+                *attnames
+            )
+            for values in set(existing):
+                for form in forms.get(values, []):
+                    form.add_error(
+                        unique_check[0] if len(unique_check) == 1 else None,
+                        form.instance.unique_error_message(model_class, unique_check),
+                    )
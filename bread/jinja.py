@@ -0,0 +1,79 @@
+"""
+Support for rendering Bread's views with Jinja2 instead of the Django
+template language.
+
+Bread ships Jinja2 versions of its templates in `bread/jinja2/`. To use them,
+add a Jinja2 engine that finds templates in apps' `jinja2` directories and
+uses this module's environment, then tell Bread to render with it, e.g.::
+
+    TEMPLATES = [
+        {
+            "BACKEND": "django.template.backends.django.DjangoTemplates",
+            ...
+        },
+        {
+            "BACKEND": "django.template.backends.jinja2.Jinja2",
+            "NAME": "jinja2",
+            "APP_DIRS": True,
+            "OPTIONS": {"environment": "bread.jinja.environment"},
+        },
+    ]
+    BREAD = {"TEMPLATE_ENGINE": "jinja2"}
+
+If your project has its own Jinja2 environment, call `add_bread_globals()`
+on it instead.
+
+Jinja2 must be installed.
+"""
+from django.templatetags.static import static
+from django.urls import reverse
+from django.utils.translation import gettext, ngettext
+from jinja2 import Environment
+from markupsafe import Markup
+
+from .templatetags.bread_tags import getter
+
+
+def url(view_name, *args, **kwargs):
+    """Return the URL of a view, like the ``url`` template tag"""
+    return reverse(view_name, args=args, kwargs=kwargs)
+
+
+def browse_row(row_cache, obj, caller):
+    """
+    Render the contents of a call block for a row of the browse table,
+    unless the HTML of the row is cached, e.g.::
+
+        {% call browse_row(row_cache, row.object) %}<tr>...</tr>{% endcall %}
+
+    The Jinja2 equivalent of the `browse_row` template tag.
+    """
+    if not row_cache:
+        return caller()
+    fragment = row_cache.get(obj)
+    if fragment is None:
+        fragment = caller()
+        row_cache.set(obj, fragment)
+    return Markup(fragment)
+
+
+def add_bread_globals(env):
+    """Add what Bread's Jinja2 templates use to the environment `env`"""
+    env.add_extension("jinja2.ext.i18n")
+    env.install_gettext_callables(gettext, ngettext, newstyle=True)
+    env.globals.update(
+        {
+            "browse_row": browse_row,
+            "getter": getter,
+            "static": static,
+            "url": url,
+        }
+    )
+    env.filters["getter"] = getter
+
+
+def environment(**options):
+    """Return a Jinja2 environment for rendering Bread's templates"""
+    env = Environment(**options)
+    add_bread_globals(env)
+    return env
@@ -0,0 +1,441 @@
+"""
+Pagination helpers for BrowseView.
+
+Keyset (or "seek") pagination pages through a sorted queryset by remembering
+the sort values of the last row shown, and asking the database for the rows
+that sort after it, instead of counting and skipping rows with OFFSET. That
+makes fetching a page cost the same no matter how far into the results it is.
+
+The sort values are passed between requests in an opaque "cursor" string.
+NULLs sort after all other values, whatever the database does by default,
+so the rows with NULL sort values can be reached from a cursor too.
+
+The paginators here are alternatives to Django's Paginator for when counting
+all the results to know how many pages there are is too slow.
+"""
+import base64
+import hashlib
+import json
+from functools import reduce
+from math import ceil
+from operator import or_
+
+from django.core.cache import caches
+from django.core.exceptions import (
+    EmptyResultSet,
+    FieldDoesNotExist,
+    ImproperlyConfigured,
+)
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import F, Model, Q
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+def get_keyset_ordering(queryset):
+    """
+    Return the ordering of a queryset as a list of (name, descending) 2-tuples,
+    with the primary key added as a final tiebreaker if it isn't already there.
+    """
+    query = queryset.query
+    if query.order_by:
+        ordering = list(query.order_by)
+    elif query.default_ordering:
+        ordering = list(queryset.model._meta.ordering)
+    else:
+        ordering = []
+
+    keys = []
+    for spec in ordering:
+        if not isinstance(spec, str) or spec == "?":
+            raise ImproperlyConfigured(
+                "Keyset pagination can only sort on field names, not %r" % (spec,)
+            )
+        keys.append((spec.lstrip("-"), spec.startswith("-")))
+
+    names = [name for name, descending in keys]
+    if "pk" not in names and queryset.model._meta.pk.name not in names:
+        keys.append(("pk", False))
+    return keys
+
+
+def get_keyset_values(obj, keys):
+    """Return a list of the values of `obj` for each of the keys"""
+    values = []
+    for name, descending in keys:
+        value = obj
+        for part in name.split("__"):
+            if value is None:
+                break
+            value = getattr(value, part)
+        if isinstance(value, Model):
+            value = value.pk
+        values.append(value)
+    return values
+
+
+def get_keyset_order_by(keys, reverse=False):
+    """
+    Return the expressions to order by for the keys, in reverse if `reverse`
+    is true, with NULLs after all other values (before them in reverse).
+    """
+    order_by = []
+    for name, descending in keys:
+        if descending != reverse:
+            order_by.append(F(name).desc(nulls_first=True))
+        else:
+            order_by.append(F(name).asc(nulls_last=True))
+    return order_by
+
+
+def get_nullable_keys(model, keys):
+    """
+    Return a set of the names of the keys whose values may be NULL, because
+    the field, or a relation on the way to it, is nullable
+    """
+    nullable = set()
+    for name, __ in keys:
+        current_model = model
+        for part in name.split("__"):
+            try:
+                if part == "pk":
+                    field = current_model._meta.pk
+                else:
+                    field = current_model._meta.get_field(part)
+            except FieldDoesNotExist:
+                # e.g. an annotation
+                nullable.add(name)
+                break
+            if field.null or not field.concrete or field.many_to_many:
+                nullable.add(name)
+                break
+            if field.is_relation:
+                current_model = field.related_model
+    return nullable
+
+
+def _get_equal_filter(name, value):
+    if value is None:
+        return Q(**{"%s__isnull" % name: True})
+    return Q(**{name: value})
+
+
+def _get_after_filter(name, value, greater, nullable):
+    """
+    Return a Q object that selects the rows whose `name` is greater than
+    `value`, or less than it if `greater` is false, with NULL greater than
+    everything else, or None if there can't be any such rows.
+    """
+    if greater:
+        if value is None:
+            return None
+        clause = Q(**{"%s__gt" % name: value})
+        if nullable:
+            clause |= Q(**{"%s__isnull" % name: True})
+        return clause
+    if value is None:
+        return Q(**{"%s__isnull" % name: False})
+    return Q(**{"%s__lt" % name: value})
+
+
+def get_keyset_filter(keys, values, reverse=False, nullable=None):
+    """
+    Return a Q object that selects the rows that sort after `values`, or before
+    them if `reverse` is true, in the order from `get_keyset_order_by`.
+    `nullable` is a set of the names of the keys that may be NULL, from
+    `get_nullable_keys`; if it's None, any of them may be.
+
+    E.g. for keys ``[("name", False), ("pk", False)]``, with "name" nullable,
+    that is::
+
+        Q(name__gt=name) | Q(name__isnull=True) | Q(name=name, pk__gt=pk)
+    """
+    clauses = []
+    for i, (name, descending) in enumerate(keys):
+        clause = _get_after_filter(
+            name,
+            values[i],
+            descending == reverse,
+            nullable is None or name in nullable,
+        )
+        if clause is None:
+            continue
+        for (equal_name, __), equal_value in zip(keys[:i], values[:i]):
+            clause &= _get_equal_filter(equal_name, equal_value)
+        clauses.append(clause)
+    if not clauses:
+        # Nothing sorts after the last row
+        return Q(pk__in=[])
+    return reduce(or_, clauses)
+
+
+def _get_cursor_ordering(keys):
+    return ["-" + name if descending else name for name, descending in keys]
+
+
+def encode_cursor(keys, values, reverse=False):
+    """
+    Return an opaque string identifying a position in a keyset-paginated list
+    """
+    data = json.dumps(
+        {"o": _get_cursor_ordering(keys), "v": values, "r": reverse},
+        cls=DjangoJSONEncoder,
+    )
+    return base64.urlsafe_b64encode(data.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor, keys):
+    """
+    Return a (values, reverse) 2-tuple from a string made by `encode_cursor`.
+
+    If the cursor was made for a different ordering than `keys`, e.g. because
+    the user has changed the sorting since, returns (None, False) so that
+    paging starts over from the beginning.
+
+    Raises InvalidCursor if the cursor can't be decoded.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        ordering, values, reverse = data["o"], data["v"], data["r"]
+    except (ValueError, TypeError, KeyError):
+        raise InvalidCursor("Invalid cursor %r" % cursor)
+    if ordering != _get_cursor_ordering(keys):
+        return None, False
+    if not isinstance(values, list) or len(values) != len(keys):
+        raise InvalidCursor("Invalid cursor %r" % cursor)
+    return values, bool(reverse)
+
+
+class KeysetPage(object):
+    """
+    A page of results from keyset pagination. Quacks enough like a Django
+    Page object for ListView, but it doesn't know its page number or how
+    many pages there are, so `number` and `paginator` are None.
+    """
+
+    number = None
+    paginator = None
+
+    def __init__(self, queryset, keys, page_size, values=None, reverse=False):
+        self.keys = keys
+        if values is not None:
+            nullable = get_nullable_keys(queryset.model, keys)
+            queryset = queryset.filter(
+                get_keyset_filter(keys, values, reverse, nullable)
+            )
+        # Fetch one extra row to find out if there are more
+        object_list = list(
+            queryset.order_by(*get_keyset_order_by(keys, reverse))[: page_size + 1]
+        )
+        has_more = len(object_list) > page_size
+        object_list = object_list[:page_size]
+        if reverse:
+            object_list.reverse()
+            self._has_next, self._has_previous = True, has_more
+        else:
+            self._has_next, self._has_previous = has_more, values is not None
+        if not object_list:
+            # Nothing to page from
+            self._has_next = False
+        self.object_list = object_list
+
+    def __repr__(self):
+        return "<KeysetPage of %d objects>" % len(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    @property
+    def next_cursor(self):
+        if not self.has_next():
+            return None
+        return encode_cursor(
+            self.keys, get_keyset_values(self.object_list[-1], self.keys)
+        )
+
+    @property
+    def previous_cursor(self):
+        if not self.has_previous() or not self.object_list:
+            return None
+        return encode_cursor(
+            self.keys,
+            get_keyset_values(self.object_list[0], self.keys),
+            reverse=True,
+        )
+
+
+class CachedCountPaginator(Paginator):
+    """
+    A Paginator that caches the count of the results for `cache_timeout`
+    seconds, keyed by the SQL of the query.
+    """
+
+    def __init__(self, *args, cache_alias="default", cache_timeout=60, **kwargs):
+        super(CachedCountPaginator, self).__init__(*args, **kwargs)
+        self.cache_alias = cache_alias
+        self.cache_timeout = cache_timeout
+
+    @cached_property
+    def count(self):
+        try:
+            key = get_count_cache_key(self.object_list)
+        except EmptyResultSet:
+            return 0
+        cache = caches[self.cache_alias]
+        count = cache.get(key)
+        if count is None:
+            count = super(CachedCountPaginator, self).count
+            cache.set(key, count, self.cache_timeout)
+        return count
+
+
+def get_count_cache_key(queryset):
+    """
+    Return a cache key for the count of a queryset. Querysets that would run
+    the same SQL get the same key.
+    """
+    sql, params = queryset.query.sql_with_params()
+    digest = hashlib.md5(
+        ("%s|%s|%r" % (queryset.db, sql, params)).encode("utf-8")
+    ).hexdigest()
+    return "bread:count:%s:%s" % (queryset.model._meta.label_lower, digest)
+
+
+class KnownCountPaginator(Paginator):
+    """A Paginator for results whose count is already known, e.g. from a cache"""
+
+    def __init__(self, object_list, per_page, count, **kwargs):
+        super(KnownCountPaginator, self).__init__(object_list, per_page, **kwargs)
+        self.count = count
+
+
+class UncountedPage(Page):
+    """A Page from an UncountedPaginator, which knows whether there's a next page
+    without knowing how many pages there are"""
+
+    def __init__(self, object_list, number, paginator, has_next):
+        super(UncountedPage, self).__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
+
+    def start_index(self):
+        if not self.object_list:
+            return 0
+        return self.paginator.per_page * (self.number - 1) + 1
+
+    def end_index(self):
+        return self.start_index() + len(self.object_list) - 1
+
+
+class UncountedPaginator(Paginator):
+    """
+    A Paginator that never counts the results. To find out if there's another
+    page, it fetches one more row than will be shown.
+
+    `count` and `num_pages` are None.
+    """
+
+    count = None
+    num_pages = None
+
+    def validate_number(self, number):
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(_("That page number is not an integer"))
+        if number < 1:
+            raise EmptyPage(_("That page number is less than 1"))
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page + 1
+        object_list = list(self.object_list[bottom:top])
+        has_next = len(object_list) > self.per_page
+        object_list = object_list[: self.per_page]
+        if not object_list and (number > 1 or not self.allow_empty_first_page):
+            raise EmptyPage(_("That page contains no results"))
+        return UncountedPage(object_list, number, self, has_next)
+
+
+class EstimatedCountPaginator(UncountedPaginator):
+    """
+    A Paginator that asks the database to estimate how many results there are,
+    rather than counting them. Whether there's a next page is found out the same
+    way as UncountedPaginator, so the estimate is only used for display.
+
+    If the database can't provide an estimate, counts the results instead, and
+    sets `count_is_estimate` to False.
+    """
+
+    count_is_estimate = True
+
+    @cached_property
+    def count(self):
+        count = estimate_count(self.object_list)
+        if count is None:
+            self.count_is_estimate = False
+            count = self.object_list.count()
+        return count
+
+    @cached_property
+    def num_pages(self):
+        if self.count == 0 and not self.allow_empty_first_page:
+            return 0
+        return ceil(max(1, self.count) / self.per_page)
+
+
+def estimate_count(queryset):
+    """
+    Return the database's estimate of the number of results of a queryset,
+    or None if it can't make one.
+
+    This only works on PostgreSQL. For a queryset with no filtering, it uses
+    the planner's statistics for the table; otherwise the row estimate from
+    EXPLAINing the query.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    query = queryset.query
+    with connection.cursor() as cursor:
+        if not query.where and not query.distinct:
+            cursor.execute(
+                "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+                [connection.ops.quote_name(queryset.model._meta.db_table)],
+            )
+            row = cursor.fetchone()
+            # reltuples is -1 (or 0 on PostgreSQL < 14) if never analyzed
+            if row and row[0] > 0:
+                return int(row[0])
+            return None
+        try:
+            sql, params = query.sql_with_params()
+        except EmptyResultSet:
+            return 0
+        cursor.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+        plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
@@ -0,0 +1,126 @@
+"""
+Looking up the current user's permissions for Bread views.
+
+Every Bread page checks the permission needed to use the view, then whether
+the user may use each of the other views, to decide which links and buttons
+to show. A PermissionResolver remembers the answers, and is kept on the
+request so every view and template rendered for that request shares it, and
+the authentication backends are only asked about each permission once.
+A BulkPermissionResolver goes further, and asks them for all of the user's
+permissions at once.
+"""
+from asgiref.sync import sync_to_async
+
+
+class PermissionResolver(object):
+    """
+    Answers whether a user has permissions, asking the authentication
+    backends about each permission with `user.has_perm()` the first time
+    it's needed (per object, for object-level permissions), and remembering
+    the answer.
+
+    `lookup_count` is the number of times the backends have been asked.
+    Override `lookup_perms` to get permissions some other way.
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self.lookup_count = 0
+        self._perms = {}
+
+    @classmethod
+    def for_request(cls, request):
+        """Return the resolver of this class for the request's user, creating it if needed"""
+        resolvers = request.__dict__.setdefault("_bread_permission_resolvers", {})
+        resolver = resolvers.get(cls)
+        if resolver is None or resolver.user is not request.user:
+            resolver = resolvers[cls] = cls(request.user)
+        return resolver
+
+    @staticmethod
+    def get_object_key(obj):
+        return None if obj is None else (type(obj), obj.pk)
+
+    def get_unknown_perms(self, perm_list, obj=None):
+        """Return the permissions in `perm_list` not looked up yet for `obj`"""
+        key = self.get_object_key(obj)
+        return [
+            perm for perm in dict.fromkeys(perm_list) if (perm, key) not in self._perms
+        ]
+
+    def lookup_perms(self, perm_list, obj=None):
+        """
+        Return a dictionary mapping each of the permissions in `perm_list`
+        to whether the user has it, for `obj` if it isn't None, asking the
+        backends.
+        """
+        perms = {}
+        for perm in perm_list:
+            self.lookup_count += 1
+            perms[perm] = self.user.has_perm(perm, obj)
+        return perms
+
+    def remember_perms(self, perm_list, obj=None):
+        """Look up the permissions in `perm_list` that aren't known yet"""
+        unknown = self.get_unknown_perms(perm_list, obj)
+        if unknown:
+            key = self.get_object_key(obj)
+            for perm, has_perm in self.lookup_perms(unknown, obj).items():
+                self._perms[perm, key] = has_perm
+
+    def has_perms(self, perm_list, obj=None):
+        """Return a dictionary mapping each of the permissions in `perm_list`
+        to whether the user has it"""
+        self.remember_perms(perm_list, obj)
+        key = self.get_object_key(obj)
+        return {perm: self._perms[perm, key] for perm in perm_list}
+
+    def has_perm(self, perm, obj=None):
+        return self.has_perms([perm], obj)[perm]
+
+    async def ahas_perms(self, perm_list, obj=None):
+        """Like `has_perms`, for async code, asking the backends in a thread"""
+        if self.get_unknown_perms(perm_list, obj):
+            await sync_to_async(self.remember_perms)(perm_list, obj)
+        return self.has_perms(perm_list, obj)
+
+    async def ahas_perm(self, perm, obj=None):
+        return (await self.ahas_perms([perm], obj))[perm]
+
+
+class BulkPermissionResolver(PermissionResolver):
+    """
+    A PermissionResolver that asks the authentication backends for all of
+    the user's permissions at once, with `user.get_all_permissions()`, the
+    first time any is needed (per object). Only use it if every backend's
+    `get_all_permissions()` returns all the permissions its `has_perm()`
+    would grant, like Django's ModelBackend. Backends that only implement
+    `has_perm()`, like django-rules', would deny everything.
+
+    Override `lookup_permissions` to get the permissions some other way,
+    e.g. from an object-level backend that can answer in bulk.
+    """
+
+    def __init__(self, user):
+        super(BulkPermissionResolver, self).__init__(user)
+        self._permissions = {}
+
+    def lookup_permissions(self, obj=None):
+        """
+        Return a set of the names of all the permissions the user has,
+        like 'app_label.codename', for `obj` if it isn't None.
+        """
+        return self.user.get_all_permissions(obj)
+
+    def get_unknown_perms(self, perm_list, obj=None):
+        if self.get_object_key(obj) in self._permissions:
+            return []
+        return list(perm_list)
+
+    def remember_perms(self, perm_list, obj=None):
+        key = self.get_object_key(obj)
+        if key not in self._permissions:
+            self.lookup_count += 1
+            self._permissions[key] = self.lookup_permissions(obj)
+        for perm in perm_list:
+            self._perms[perm, key] = perm in self._permissions[key]
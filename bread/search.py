@@ -0,0 +1,284 @@
+"""
+Search backends for BrowseView.
+
+A search backend turns the text a user typed into the search box into a
+filtered queryset. Set `search_backend` on a BrowseView subclass to an
+instance of one of these classes to choose how it searches, e.g.::
+
+    class MyBrowseView(BrowseView):
+        search_fields = ["name", "description"]
+        search_backend = PostgresSearchBackend(vector_field="search_vector")
+"""
+import re
+from functools import reduce
+from operator import or_
+
+from django.db import connections
+from django.db.models import Exists, F, OuterRef, Q, Subquery
+from django.db.models.expressions import RawSQL
+
+# The function lookup_needs_distinct() was renamed
+# to lookup_spawns_duplicates() in Django 4.0
+# https://docs.djangoproject.com/en/4.2/releases/4.0/#:~:text=The%20undocumented%20django.contrib.admin.utils.lookup_needs_distinct()%20function%20is%20renamed%20to%20lookup_spawns_duplicates().
+try:
+    from django.contrib.admin.utils import lookup_spawns_duplicates
+except ImportError:  # pragma: no cover
+    from django.contrib.admin.utils import (
+        lookup_needs_distinct as lookup_spawns_duplicates,
+    )
+
+
+def get_search_words(search_term):
+    """Return a list of the words in `search_term`, ignoring punctuation"""
+    return re.findall(r"\w+", search_term)
+
+
+class SearchBackend(object):
+    """Base class for search backends"""
+
+    def search(self, view, queryset, search_term):
+        """
+        Return a tuple containing a queryset to implement the search,
+        and a boolean indicating if the results may contain duplicates.
+
+        `view` is the BrowseView doing the search.
+        """
+        raise NotImplementedError
+
+    def prepare(self, view_class, model):
+        """
+        Return whatever `compile` works out from the view class's
+        `search_fields`, computing it only once per view class and model.
+        """
+        return view_class.get_compiled(
+            "search", model, lambda model: self.compile(view_class, model)
+        )
+
+    def compile(self, view_class, model):
+        """
+        Work out anything about searching `model` with `view_class` that
+        doesn't depend on the search term. Returns None by default.
+        """
+        return None
+
+
+class IContainsSearchBackend(SearchBackend):
+    """
+    The default search backend, which works the same as search in the Django
+    admin. Every word in the search term must be found in at least one of the
+    view's `search_fields`, not case sensitive.
+
+    Field names in `search_fields` may have a prefix to change how they're
+    searched: '^' to match the start of the field, '=' to match it exactly,
+    or '@' to use the database's full-text search (the `__search` lookup).
+
+    If the view's `search_use_exists` is true, lookups that span a
+    multi-valued relation (a reverse foreign key or many-to-many) are done in
+    an EXISTS subquery instead of a join, so the results never contain
+    duplicates and don't need DISTINCT.
+    """
+
+    def construct_search(self, field_name):
+        if field_name.startswith("^"):
+            return "%s__istartswith" % field_name[1:]
+        elif field_name.startswith("="):
+            return "%s__iexact" % field_name[1:]
+        elif field_name.startswith("@"):
+            return "%s__search" % field_name[1:]
+        else:
+            return "%s__icontains" % field_name
+
+    def compile(self, view_class, model):
+        """
+        Return a tuple of the ORM lookups for the view's `search_fields`,
+        a boolean indicating if any of them may return duplicates, and the
+        lookups split into those that may not and those that may.
+        """
+        opts = model._meta
+        orm_lookups = [
+            self.construct_search(str(search_field))
+            for search_field in view_class.search_fields
+        ]
+        single_lookups = []
+        multi_lookups = []
+        for orm_lookup in orm_lookups:
+            if lookup_spawns_duplicates(opts, orm_lookup):
+                multi_lookups.append(orm_lookup)
+            else:
+                single_lookups.append(orm_lookup)
+        return orm_lookups, bool(multi_lookups), single_lookups, multi_lookups
+
+    def search(self, view, queryset, search_term):
+        use_distinct = False
+        if view.search_fields and search_term:
+            orm_lookups, use_distinct, single_lookups, multi_lookups = self.prepare(
+                type(view), queryset.model
+            )
+            if view.search_use_exists:
+                return self.search_with_exists(
+                    queryset, single_lookups, multi_lookups, search_term
+                )
+            for bit in search_term.split():
+                or_queries = [Q(**{orm_lookup: bit}) for orm_lookup in orm_lookups]
+                queryset = queryset.filter(reduce(or_, or_queries))
+
+        return queryset, use_distinct
+
+    def search_with_exists(self, queryset, single_lookups, multi_lookups, search_term):
+        """
+        Like `search`, but with the lookups that could return duplicates done in
+        a correlated EXISTS subquery. Always returns False for use_distinct.
+        """
+        model = queryset.model
+        for bit in search_term.split():
+            or_queries = [Q(**{orm_lookup: bit}) for orm_lookup in single_lookups]
+            if multi_lookups:
+                subquery = model._base_manager.filter(pk=OuterRef("pk")).filter(
+                    reduce(or_, [Q(**{lookup: bit}) for lookup in multi_lookups])
+                )
+                or_queries.append(Q(Exists(subquery)))
+            queryset = queryset.filter(reduce(or_, or_queries))
+        return queryset, False
+
+
+class PostgresSearchBackend(SearchBackend):
+    """
+    Uses PostgreSQL's full-text search. Requires 'django.contrib.postgres'.
+
+    Every word in the search term must match. The results are sorted by how
+    well they match, unless the user has chosen a sort order.
+
+    Parameters:
+
+    vector_field
+        Name of a SearchVectorField on the model, kept up to date by you and
+        ideally indexed with a GIN index. If not set, a search vector is built
+        from the view's `search_fields` for every search, which can't use an
+        index.
+    config
+        The text search configuration to use, e.g. 'english'.
+    prefix
+        If true (the default), words match any word starting with them, so
+        results appear while the user is still typing.
+    rank
+        If true (the default), sort the results by rank, and annotate them
+        with it as `search_rank`.
+    limit
+        If set, only return this many of the best-ranked results.
+    """
+
+    def __init__(
+        self, vector_field=None, config=None, prefix=True, rank=True, limit=None
+    ):
+        self.vector_field = vector_field
+        self.config = config
+        self.prefix = prefix
+        self.rank = rank
+        self.limit = limit
+
+    def compile(self, view_class, model):
+        """
+        Return a tuple of the fields to build a search vector from, and
+        a boolean indicating if they may return duplicates.
+        """
+        fields = [str(field).lstrip("^=@") for field in view_class.search_fields]
+        opts = model._meta
+        return fields, any(lookup_spawns_duplicates(opts, f) for f in fields)
+
+    def search(self, view, queryset, search_term):
+        from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+
+        words = get_search_words(search_term)
+        if not words:
+            return queryset, False
+        suffix = ":*" if self.prefix else ""
+        query = SearchQuery(
+            " & ".join(word + suffix for word in words),
+            config=self.config,
+            search_type="raw",
+        )
+
+        use_distinct = False
+        if self.vector_field:
+            vector = F(self.vector_field)
+            queryset = queryset.filter(**{self.vector_field: query})
+        else:
+            fields, use_distinct = self.prepare(type(view), queryset.model)
+            vector = SearchVector(*fields, config=self.config)
+            queryset = queryset.annotate(search_vector=vector).filter(
+                search_vector=query
+            )
+
+        if self.rank:
+            queryset = queryset.annotate(search_rank=SearchRank(vector, query))
+            queryset = queryset.order_by("-search_rank")
+        if self.limit:
+            best = queryset.values("pk")[: self.limit]
+            queryset = queryset.filter(pk__in=Subquery(best))
+        return queryset, use_distinct
+
+
+class SQLiteFTS5SearchBackend(SearchBackend):
+    """
+    Uses an SQLite FTS5 virtual table. This is mostly useful for trying out
+    full-text search locally.
+
+    The table's rowids must be the primary keys of the model's records, and
+    you're responsible for keeping it up to date, e.g.::
+
+        CREATE VIRTUAL TABLE myapp_thing_fts USING fts5(name, description);
+        INSERT INTO myapp_thing_fts(rowid, name, description)
+            SELECT id, name, description FROM myapp_thing;
+
+    Every word in the search term must match. The results are sorted by how
+    well they match, unless the user has chosen a sort order.
+
+    Parameters:
+
+    table
+        The name of the FTS5 table.
+    prefix
+        If true (the default), words match any word starting with them.
+    rank
+        If true (the default), sort the results by rank, and annotate them
+        with it as `search_rank`. Lower ranks are better matches.
+    limit
+        If set, only return this many of the best-ranked results.
+    """
+
+    def __init__(self, table, prefix=True, rank=True, limit=None):
+        self.table = table
+        self.prefix = prefix
+        self.rank = rank
+        self.limit = limit
+
+    def search(self, view, queryset, search_term):
+        words = get_search_words(search_term)
+        if not words:
+            return queryset, False
+        suffix = "*" if self.prefix else ""
+        # Quote each word so nothing in it is taken as FTS5 query syntax
+        match = " ".join('"%s"%s' % (word, suffix) for word in words)
+
+        qn = connections[queryset.db].ops.quote_name
+        table = qn(self.table)
+        sql = "SELECT rowid FROM {table} WHERE {table} MATCH %s ORDER BY rank".format(
+            table=table
+        )
+        if self.limit:
+            sql += " LIMIT %d" % self.limit
+        queryset = queryset.filter(pk__in=RawSQL(sql, [match]))
+
+        if self.rank:
+            opts = queryset.model._meta
+            rank_sql = (
+                "SELECT rank FROM {table} WHERE {table} MATCH %s "
+                "AND rowid = {model_table}.{pk_column}"
+            ).format(
+                table=table,
+                model_table=qn(opts.db_table),
+                pk_column=qn(opts.pk.column),
+            )
+            queryset = queryset.annotate(search_rank=RawSQL(rank_sql, [match]))
+            queryset = queryset.order_by("search_rank")
+        return queryset, False
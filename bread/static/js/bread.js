@@ -51,7 +51,8 @@ $(function () {
         //else {
         // don't sort on this field anymore
         //}
-        return URI(window.location.href).setQuery('o', parts.join(',')).href();
+        // A keyset pagination cursor is only valid for the ordering it was made for
+        return URI(window.location.href).setQuery('o', parts.join(',')).removeQuery('cursor').href();
     }
 
     function update_th(column_number, link, attrs, classes) {
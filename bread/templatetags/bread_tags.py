@@ -3,7 +3,7 @@ import logging
 from django import template
 from django.core.exceptions import ObjectDoesNotExist
 
-from bread.utils import get_model_field
+from bread.utils import Accessor, get_accessor
 
 logger = logging.getLogger(__name__)
 register = template.Library()
@@ -16,10 +16,64 @@ def getter(value, arg):
     `arg` can contain `__` to drill down recursively into the values.
     If the final result is a callable, it is called and its return
     value used.
+
+    `arg` can also be an already compiled Accessor.
     """
     try:
-        return get_model_field(value, arg)
+        accessor = arg if isinstance(arg, Accessor) else get_accessor(arg)
+        return accessor(value)
     except ObjectDoesNotExist:
         pass
     except Exception:
         logger.exception("Something blew up: %s|getter:%s" % (value, arg))
+
+
+@register.simple_tag(takes_context=True)
+def bread_url(context, view_name, pk=None):
+    """
+    Return the URL of one of the views of the Bread in the context, e.g.::
+
+        {% bread_url "edit" object.pk %}
+
+    It's the same as using the ``url`` tag with the view's URL name, but
+    much faster when there are many URLs to make.
+    """
+    return context["bread"].get_url(view_name, pk)
+
+
+@register.tag(name="browse_row")
+def do_browse_row(parser, token):
+    """
+    Render the contents of the tag for a row of the browse table, unless
+    the HTML of the row is cached, e.g.::
+
+        {% browse_row object %}<tr>...</tr>{% endbrowse_row %}
+
+    The cache is the `row_cache` context variable, which BrowseView
+    sets when `cache_rows` is true.
+    """
+    bits = token.split_contents()
+    if len(bits) != 2:
+        raise template.TemplateSyntaxError(
+            "%r tag requires exactly one argument" % bits[0]
+        )
+    nodelist = parser.parse(("endbrowse_row",))
+    parser.delete_first_token()
+    return BrowseRowNode(nodelist, parser.compile_filter(bits[1]))
+
+
+class BrowseRowNode(template.Node):
+    def __init__(self, nodelist, obj):
+        self.nodelist = nodelist
+        self.obj = obj
+
+    def render(self, context):
+        row_cache = context.get("row_cache")
+        if row_cache is None:
+            return self.nodelist.render(context)
+        obj = self.obj.resolve(context)
+        fragment = row_cache.get(obj)
+        if fragment is None:
+            fragment = self.nodelist.render(context)
+            row_cache.set(obj, fragment)
+        return fragment
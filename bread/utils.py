@@ -10,7 +10,7 @@ a foreign key to another model with a "name" field, you
 can refer to that "name" field in a query as
 "link__name"
 
-The get_model_field method below allows you to do
+The get_model_field function below allows you to do
 the same thing in your own code -- you could get the
 value of that "name" field using
 
@@ -27,8 +27,12 @@ in queryset filters: if the object that the string eventually
 resolves to is a callable, it will be called to get its return
 value, similar to how references to context variables in templates
 work.
+
+To get the same field from many instances, use get_accessor() to
+compile the spec once.
 """
 import inspect
+from functools import lru_cache
 
 from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.db.models import Model
@@ -36,6 +40,14 @@ from django.db.models.fields.related import RelatedField
 from django.db.models.fields.reverse_related import OneToOneRel
 
 
+def is_traversable(field):
+    """
+    Return True if a field spec may refer through `field` to fields on
+    its related model.
+    """
+    return isinstance(field, RelatedField) or isinstance(field, OneToOneRel)
+
+
 def get_value_or_result(model_instance, attribute_name):
     attr = getattr(model_instance, attribute_name)
     if callable(attr):
@@ -51,19 +63,65 @@ def get_model_field(model_instance, spec):
             "%r should be an instance of a model but it is a %s"
             % (model_instance, type(model_instance))
         )
+    return get_accessor(spec)(model_instance)
 
-    if spec.startswith("__") and spec.endswith("__"):
-        # It's a dunder method; don't split it.
-        name_parts = [spec]
-    else:
-        name_parts = spec.split("__", 1)
 
-    value = getattr(model_instance, name_parts[0])
-    if callable(value):
-        value = value()
-    if len(name_parts) > 1 and value is not None:
-        return get_model_field(value, name_parts[1])
-    return value
+class Accessor(object):
+    """
+    A field spec compiled into the steps needed to get its value from an
+    object, the same way `get_model_field` does, so the spec only has to be
+    parsed once. Call it with the object. If the object, or any object along
+    the way, is None, returns None.
+
+    If the model is given, any steps that are model fields are known
+    not to need calling, so aren't checked.
+    """
+
+    __slots__ = ("spec", "steps")
+
+    def __init__(self, spec, model=None):
+        self.spec = spec
+        # (attribute name, whether it might be callable) 2-tuples
+        self.steps = []
+        while spec:
+            if spec.startswith("__") and spec.endswith("__"):
+                # It's a dunder method; don't split it.
+                name, spec = spec, None
+            else:
+                parts = spec.split("__", 1)
+                name = parts[0]
+                spec = parts[1] if len(parts) > 1 else None
+            field = None
+            if model is not None:
+                try:
+                    field = model._meta.get_field(name)
+                except FieldDoesNotExist:
+                    pass
+            if field is not None and field.concrete:
+                self.steps.append((name, False))
+                model = field.related_model
+            else:
+                self.steps.append((name, True))
+                model = None
+
+    def __repr__(self):
+        return "<Accessor %s>" % self.spec
+
+    def __call__(self, obj):
+        value = obj
+        for name, may_be_callable in self.steps:
+            if value is None:
+                return None
+            value = getattr(value, name)
+            if may_be_callable and callable(value):
+                value = value()
+        return value
+
+
+@lru_cache(maxsize=None)
+def get_accessor(spec, model=None):
+    """Return an Accessor for the spec (and model), making it only the first time"""
+    return Accessor(spec, model)
 
 
 def get_verbose_name(an_object, field_name, title_cap=True):
@@ -159,7 +217,7 @@ def validate_fieldspec(model, spec):
     else:
         # It's a field
         # Is it a key?
-        if isinstance(field, RelatedField) or isinstance(field, OneToOneRel):
+        if is_traversable(field):
             # Yes, refers to another model
             if rest_of_spec:
                 # Recurse!
@@ -174,3 +232,147 @@ def validate_fieldspec(model, spec):
                     "it to '%s'." % (model, parts[0], rest_of_spec)
                 )
             # Simple field, no more spec, looks good
+
+
+def walk_fieldspec(model, spec):
+    """
+    Given a model class and a field spec that `validate_fieldspec` accepts,
+    yield a (lookup, field) 2-tuple for each part of the spec that is a
+    field on its model, where `lookup` is the ORM lookup from `model` to
+    that field, e.g. ``("other", <ForeignKey>), ("other__text", <CharField>)``.
+
+    Stops at the first part that is not a field (e.g. a method).
+    """
+    path = []
+    while spec and not (spec.startswith("__") and spec.endswith("__")):
+        parts = spec.split("__", 1)
+        try:
+            field = model._meta.get_field(parts[0])
+        except FieldDoesNotExist:
+            return
+        path.append(parts[0])
+        yield "__".join(path), field
+        if not is_traversable(field):
+            return
+        model = field.related_model
+        spec = parts[1] if len(parts) > 1 else None
+
+
+def is_value_fieldspec(model, spec):
+    """
+    Given a model class and a field spec, return True if the spec refers
+    to a field whose value `QuerySet.values()` gives the same as the spec
+    does, i.e. a field that isn't a relation, on the model or on a model
+    related through forward foreign keys and one-to-one fields.
+    """
+    lookup = field = None
+    for lookup, field in walk_fieldspec(model, spec):
+        if not field.concrete or field.many_to_many:
+            return False
+    return lookup == spec and not field.is_relation
+
+
+def get_related_models(model, specs):
+    """
+    Given a model class and an iterable of field specs, return a list of the
+    other models whose records the specs refer to, in the order they're found.
+    """
+    related_models = []
+    for spec in specs:
+        for lookup, field in walk_fieldspec(model, spec):
+            if not is_traversable(field):
+                continue
+            related_model = field.related_model
+            if related_model is not model and related_model not in related_models:
+                related_models.append(related_model)
+    return related_models
+
+
+def get_related_lookups(model, specs):
+    """
+    Given a model class and an iterable of field specs, return a 2-tuple of
+    lists of lookups, (select_related, prefetch_related), that will load
+    every related object the specs refer to along with the model's records.
+
+    Forward foreign keys and one-to-one relations in either direction can be
+    followed with a join, so they go in select_related. Once a spec passes
+    through a relation that can return multiple objects (many-to-many or a
+    reverse foreign key), the rest of its path must be prefetched.
+    """
+    select_related = []
+    prefetch_related = []
+    for spec in specs:
+        lookup = None
+        # prefetch_related wants attribute names, which differ from the
+        # query names for reverse relations (e.g. 'thing_set' vs 'thing').
+        attributes = []
+        multi_valued = False
+        for path, field in walk_fieldspec(model, spec):
+            if not field.is_relation:
+                break
+            lookup = path
+            if field.auto_created and not field.concrete:
+                attributes.append(field.get_accessor_name())
+            else:
+                attributes.append(field.name)
+            if field.many_to_many or field.one_to_many or not is_traversable(field):
+                # e.g. a GenericForeignKey can't be joined either
+                multi_valued = True
+        if lookup is None:
+            continue
+        if multi_valued:
+            lookups, lookup = prefetch_related, "__".join(attributes)
+        else:
+            lookups = select_related
+        if lookup not in lookups:
+            lookups.append(lookup)
+    return select_related, prefetch_related
+
+
+def get_only_fields(model, specs):
+    """
+    Given a model class and an iterable of field specs, return a list of the
+    lookups to pass to `QuerySet.only()` so that only the fields needed to
+    evaluate the specs are loaded, including fields of related objects loaded
+    with `select_related`.
+
+    Returns None if that can't be worked out, because a spec refers to a
+    method or other attribute of the model itself, which might use any of
+    its fields.
+    """
+    fields = []
+
+    def add(lookup):
+        if lookup not in fields:
+            fields.append(lookup)
+
+    for spec in specs:
+        hops = []
+        for path, field in walk_fieldspec(model, spec):
+            if field.many_to_many or field.one_to_many:
+                # This and the rest of the spec are prefetched, which only
+                # needs our primary key, or the key of the first related
+                # object on the way there.
+                if hops and hops[0][1].concrete:
+                    add(hops[0][0])
+                break
+            if field.is_relation and not is_traversable(field):
+                # Something like a GenericForeignKey
+                return None
+            if isinstance(field, OneToOneRel):
+                # select_related needs the related model's key back to us
+                add("%s__%s" % (path, field.remote_field.name))
+            hops.append((path, field))
+        else:
+            if not hops:
+                # A method or attribute of the model itself
+                return None
+            path, field = hops[-1]
+            if field.is_relation:
+                # The spec refers to a related object, or a method or attribute
+                # of one, which might use any of its fields.
+                for related_field in field.related_model._meta.concrete_fields:
+                    add("%s__%s" % (path, related_field.name))
+            else:
+                add(path)
+    return fields
@@ -16,6 +16,9 @@ setup(
         "django-filter",
         "django-vanilla-views",
     ],
+    extras_require={
+        "jinja2": ["Jinja2"],
+    },
     long_description=open("README.rst").read(),
     classifiers=[
         "Development Status :: 5 - Production/Stable",
@@ -1,6 +1,11 @@
 import factory
 
-from .models import BreadLabelValueTestModel, BreadTestModel, BreadTestModel2
+from .models import (
+    BreadLabelValueTestModel,
+    BreadTestModel,
+    BreadTestModel2,
+    BreadVersionedTestModel,
+)
 
 
 class BreadTestModel2Factory(factory.django.DjangoModelFactory):
@@ -24,3 +29,10 @@ class BreadLabelValueTestModelFactory(factory.django.DjangoModelFactory):
         model = BreadLabelValueTestModel
 
     name = factory.Faker("name")
+
+
+class BreadVersionedTestModelFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = BreadVersionedTestModel
+
+    name = factory.Faker("first_name")
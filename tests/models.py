@@ -73,3 +73,38 @@ class BreadTestModel(models.Model):
     def method2(self, arg=None):
         # method that has an optional arg
         pass
+
+
+class BreadProtectedTestModel(models.Model):
+    """Model that keeps the BreadTestModel2 it refers to from being deleted"""
+
+    other = models.ForeignKey(BreadTestModel2, on_delete=models.PROTECT)
+
+
+class BreadVersionedTestModel(models.Model):
+    """Model with a version number and modification time"""
+
+    name = models.CharField(max_length=10)
+    version = models.IntegerField(default=1)
+    modified = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["name"]
+
+    def __str__(self):
+        return self.name
+
+
+class BreadUniqueTestModel(models.Model):
+    """Model with fields that must be unique, alone and together"""
+
+    code = models.CharField(max_length=10, unique=True)
+    name = models.CharField(max_length=10)
+    year = models.IntegerField()
+
+    class Meta:
+        ordering = ["code"]
+        unique_together = [("name", "year")]
+
+    def __str__(self):
+        return self.code
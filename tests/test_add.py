@@ -1,10 +1,16 @@
+import json
+from unittest.mock import patch
+
 from django import forms
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from bread.bread import AddView, Bread
+from bread.cache import get_model_versions
 
 from .base import BreadTestCase
-from .models import BreadTestModel
+from .models import BreadTestModel, BreadUniqueTestModel
 
 
 class BreadAddTest(BreadTestCase):
@@ -83,3 +89,134 @@ class BreadAddTest(BreadTestCase):
         # Call the  view function to invoke dispatch so we can get to the view itself
         view_function(None, None, None)
         self.assertEqual(DummyForm, glob["view_object"].form_class)
+
+
+class FormsetAddView(AddView):
+    formset = True
+    formset_max_num = 10
+
+
+class BreadFormsetAddTest(BreadTestCase):
+    def setUp(self):
+        super(BreadFormsetAddTest, self).setUp()
+        self.model = BreadUniqueTestModel
+        self.model_name = self.model._meta.model_name
+
+        class UniqueBread(Bread):
+            base_template = "bread/empty.html"
+            model = BreadUniqueTestModel
+            add_view = FormsetAddView
+
+        self.bread = UniqueBread()
+        self.set_urls(self.bread)
+        self.give_permission("add")
+        self.model.objects.create(code="a1", name="amy", year=2000)
+
+    def post(self, rows, **headers):
+        data = {"form-TOTAL_FORMS": len(rows), "form-INITIAL_FORMS": 0}
+        for i, row in enumerate(rows):
+            for name, value in row.items():
+                data["form-%d-%s" % (i, name)] = value
+        request = self.request_factory.post("", data, **headers)
+        request.user = self.user
+        return self.bread.get_add_view()(request)
+
+    def queries_on_model(self, rows):
+        """Post `rows`, and return the response and the SQL of the queries on
+        the test model"""
+        with CaptureQueriesContext(connection) as queries:
+            rsp = self.post(rows)
+        table = self.model._meta.db_table
+        return rsp, [q["sql"] for q in queries if table in q["sql"]]
+
+    def make_rows(self, count):
+        return [
+            {"code": "c%d" % i, "name": "name%d" % i, "year": 2000 + i}
+            for i in range(count)
+        ]
+
+    def test_get(self):
+        request = self.request_factory.get("")
+        request.user = self.user
+        with CaptureQueriesContext(connection) as queries:
+            rsp = self.bread.get_add_view()(request)
+            rsp.render()
+        body = rsp.content.decode("utf-8")
+        self.assertEqual(3, len(rsp.context_data["formset"].forms))
+        self.assertIn('name="form-TOTAL_FORMS"', body)
+        self.assertIn('name="form-2-code"', body)
+        # Only new records, so no query for existing ones
+        table = self.model._meta.db_table
+        self.assertFalse([q for q in queries if table in q["sql"]])
+
+    def test_add_many(self):
+        rsp, few = self.queries_on_model(self.make_rows(2))
+        self.assertEqual(302, rsp.status_code)
+        self.assertEqual(reverse(self.bread.browse_url_name()), rsp["Location"])
+        self.model.objects.exclude(code="a1").delete()
+        rsp, many = self.queries_on_model(self.make_rows(8))
+        self.assertEqual(302, rsp.status_code)
+        # One query for each of the two unique checks, and one INSERT
+        self.assertEqual(3, len(few))
+        self.assertEqual(3, len(many))
+        self.assertTrue(many[-1].startswith("INSERT"))
+        self.assertEqual(9, self.model.objects.count())
+
+    def test_blank_forms_ignored(self):
+        rows = self.make_rows(1) + [{"code": "", "name": "", "year": ""}]
+        rsp, __ = self.queries_on_model(rows)
+        self.assertEqual(302, rsp.status_code)
+        self.assertEqual(["a1", "c0"], [obj.code for obj in self.model.objects.all()])
+
+    def test_not_unique(self):
+        rows = self.make_rows(4)
+        rows[1]["code"] = "a1"  # Already in the database
+        rows[2].update(name="amy", year=2000)  # Together, already in the database
+        rows[3]["code"] = rows[0]["code"]  # Twice in the formset
+        rsp, queries = self.queries_on_model(rows)
+        self.assertEqual(400, rsp.status_code)
+        self.assertEqual(2, len(queries))
+        forms = rsp.context_data["formset"].forms
+        self.assertFalse(forms[0].errors)
+        self.assertEqual(["code"], list(forms[1].errors))
+        self.assertEqual(["__all__"], list(forms[2].errors))
+        self.assertEqual(["__all__"], list(forms[3].errors))
+        self.assertEqual(1, self.model.objects.count())
+
+    def test_invalid(self):
+        rows = self.make_rows(2)
+        rows[1]["year"] = "last"
+        rsp = self.post(rows, HTTP_ACCEPT="application/json")
+        self.assertEqual(400, rsp.status_code)
+        data = json.loads(rsp.content)
+        self.assertEqual({}, data["forms"][0]["errors"])
+        self.assertIn("year", data["forms"][1]["errors"])
+        self.assertEqual([], data["errors"])
+
+    def test_too_many(self):
+        rsp = self.post(self.make_rows(11), HTTP_ACCEPT="application/json")
+        self.assertEqual(400, rsp.status_code)
+        self.assertTrue(json.loads(rsp.content)["errors"])
+        self.assertEqual(1, self.model.objects.count())
+
+    def test_json(self):
+        rsp = self.post(self.make_rows(2), HTTP_ACCEPT="application/json")
+        self.assertEqual(201, rsp.status_code)
+        pks = json.loads(rsp.content)["pks"]
+        self.assertEqual(
+            ["c0", "c1"],
+            [self.model.objects.get(pk=pk).code for pk in pks],
+        )
+
+    def test_json_without_returning_pks(self):
+        # e.g. MySQL, or SQLite before Django 4.0
+        with patch.object(
+            type(connection.features), "can_return_rows_from_bulk_insert", False
+        ):
+            self.test_json()
+
+    def test_bumps_model_version(self):
+        # So cached browse results and rows show the new records
+        versions = get_model_versions([self.model])
+        self.post(self.make_rows(2))
+        self.assertNotEqual(versions, get_model_versions([self.model]))
@@ -0,0 +1,180 @@
+import json
+from asyncio import iscoroutinefunction
+from unittest import skipUnless
+
+import django
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.models import AnonymousUser
+from django.core.exceptions import ImproperlyConfigured, PermissionDenied
+from django.http import Http404
+from django.test import override_settings
+from django.urls import reverse
+from django.utils.functional import SimpleLazyObject
+
+from bread.bread import AsyncBrowseViewMixin, BrowseView, ReadView
+
+from .base import BreadTestCase
+from .factories import BreadTestModelFactory
+
+
+class QueryingBackend(ModelBackend):
+    """A backend that queries the database for every permission it's asked"""
+
+    def has_perm(self, user_obj, perm, obj=None):
+        app_label, codename = perm.split(".")
+        return user_obj.user_permissions.filter(
+            content_type__app_label=app_label, codename=codename
+        ).exists()
+
+
+@skipUnless(django.VERSION >= (4, 1), "async queries need Django 4.1")
+class AsyncBreadTest(BreadTestCase):
+    extra_bread_attributes = {"async_views": True}
+
+    def setUp(self):
+        super(AsyncBreadTest, self).setUp()
+        self.set_urls(self.bread)
+        self.items = [
+            BreadTestModelFactory(name=name, age=i, other__text=name.upper())
+            for i, name in enumerate(["amy", "bob", "cal"])
+        ]
+        self.give_permission("browse")
+        self.give_permission("view")
+
+    async def request(self, view_name, data=None, user=None, **kwargs):
+        url = reverse(self.bread.get_url_name(view_name), kwargs=kwargs)
+        request = self.request_factory.get(url, data or {})
+        pk = self.user.pk
+        # Like AuthenticationMiddleware, which loads the user when it's used
+        request.user = user or SimpleLazyObject(
+            lambda: get_user_model().objects.get(pk=pk)
+        )
+        view = getattr(self.bread, "get_%s_view" % view_name)()
+        self.assertTrue(iscoroutinefunction(view))
+        return await view(request, **kwargs)
+
+    async def get(self, view_name, **kwargs):
+        rsp = await self.request(view_name, **kwargs)
+        self.assertEqual(200, rsp.status_code)
+        self.assertIn("Accept", rsp["Vary"])
+        await sync_to_async(rsp.render)()
+        return rsp
+
+    def test_sync_by_default(self):
+        self.bread.async_views = False
+        self.assertFalse(iscoroutinefunction(self.bread.get_browse_view()))
+        self.assertFalse(iscoroutinefunction(self.bread.get_read_view()))
+
+    async def test_browse(self):
+        rsp = await self.get("browse", data={"o": "-0"})
+        self.assertIsInstance(rsp.context_data["view"], AsyncBrowseViewMixin)
+        self.assertEqual(
+            ["cal", "bob", "amy"],
+            [obj.name for obj in rsp.context_data["object_list"]],
+        )
+        self.assertIn("BOB", rsp.content.decode("utf-8"))
+
+    async def test_browse_paginated(self):
+        self.bread.browse_view.paginate_by = 2
+        rsp = await self.get("browse", data={"page": "last"})
+        self.assertEqual(2, rsp.context_data["page_obj"].number)
+        self.assertEqual(3, rsp.context_data["paginator"].count)
+        self.assertEqual(["cal"], [obj.name for obj in rsp.context_data["object_list"]])
+
+    async def test_browse_uncounted(self):
+        class UncountedBrowseView(BrowseView):
+            columns = [("Name", "name")]
+            count_strategy = "none"
+            paginate_by = 2
+
+        self.bread.browse_view = UncountedBrowseView
+        rsp = await self.get("browse")
+        self.assertTrue(rsp.context_data["is_paginated"])
+        self.assertEqual(
+            ["amy", "bob"], [obj.name for obj in rsp.context_data["object_list"]]
+        )
+
+    async def test_browse_json(self):
+        rsp = await self.request("browse", data={"format": "json"})
+        self.assertEqual("application/json", rsp["Content-Type"])
+        data = json.loads(rsp.content)
+        self.assertEqual(
+            {"pk": self.items[0].pk, "cells": ["amy", "AMY", None, "amy"]},
+            data["rows"][0],
+        )
+
+    async def test_browse_bad_sorting(self):
+        rsp = await self.request("browse", data={"o": "nine"})
+        self.assertEqual(400, rsp.status_code)
+
+    async def test_not_logged_in(self):
+        rsp = await self.request("browse", user=AnonymousUser())
+        self.assertEqual(302, rsp.status_code)
+
+    async def test_no_permission(self):
+        with self.assertRaises(PermissionDenied):
+            await self.request("read", pk=self.items[0].pk, user=await self.other())
+
+    async def other(self):
+        return await get_user_model().objects.acreate(username="ann")
+
+    async def test_read(self):
+        item = self.items[0]
+        rsp = await self.get("read", pk=item.pk)
+        self.assertEqual(item, rsp.context_data["object"])
+        self.assertIn("amy", rsp.content.decode("utf-8"))
+
+    async def test_read_no_such_item(self):
+        with self.assertRaises(Http404):
+            await self.request("read", pk=self.items[-1].pk + 1)
+
+    async def test_read_etag(self):
+        class EtagReadView(ReadView):
+            etag_field = "age"
+
+        self.bread.read_view = EtagReadView
+        pk = self.items[0].pk
+        etag = (await self.get("read", pk=pk))["ETag"]
+        url = reverse(self.bread.get_url_name("read"), kwargs={"pk": pk})
+        request = self.request_factory.get(url, HTTP_IF_NONE_MATCH=etag)
+        request.user = self.user
+        rsp = await self.bread.get_read_view()(request, pk=pk)
+        self.assertEqual(304, rsp.status_code)
+
+    async def test_bulk_action(self):
+        class BulkBrowseView(BrowseView):
+            bulk_actions = ["delete"]
+
+        self.bread.browse_view = BulkBrowseView
+        url = reverse(self.bread.browse_url_name())
+        request = self.request_factory.post(url, {"action": "delete", "pk": [1]})
+        request.user = self.user
+        with self.assertRaises(PermissionDenied):
+            await self.bread.get_browse_view()(request)
+
+    async def test_uncached_backend(self):
+        # The permissions the context shows are looked up without blocking
+        class BulkBrowseView(BrowseView):
+            bulk_actions = ["delete"]
+
+        self.bread.browse_view = BulkBrowseView
+        with override_settings(
+            AUTHENTICATION_BACKENDS=["tests.test_async.QueryingBackend"]
+        ):
+            rsp = await self.get("browse")
+            self.assertTrue(rsp.context_data["may_browse"])
+            self.assertFalse(rsp.context_data["may_edit"])
+            self.assertEqual([], rsp.context_data["bulk_actions"])
+            rsp = await self.get("read", pk=self.items[0].pk)
+            self.assertTrue(rsp.context_data["may_browse"])
+
+
+@skipUnless(django.VERSION < (4, 1), "async_views works with Django 4.1")
+class AsyncBreadOldDjangoTest(BreadTestCase):
+    extra_bread_attributes = {"async_views": True}
+
+    def test_improperly_configured(self):
+        with self.assertRaises(ImproperlyConfigured):
+            self.bread.get_browse_view()
@@ -1,14 +1,17 @@
 import json
+from datetime import timedelta
 from unittest.mock import patch
 
+from django.db import connection
 from django.db.models.functions import Upper
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
-from bread.bread import BrowseView
-from tests.models import BreadTestModel
+from bread.bread import Bread, BrowseView
+from tests.models import BreadTestModel, BreadVersionedTestModel
 
 from .base import BreadTestCase
-from .factories import BreadTestModelFactory
+from .factories import BreadTestModelFactory, BreadVersionedTestModelFactory
 
 
 class BreadBrowseTest(BreadTestCase):
@@ -298,6 +301,18 @@ class NotDisablingSortTest(BreadTestCase):
             [0], json.loads(rsp.context_data["valid_sorting_columns_json"])
         )
 
+    def test_sortable_columns_worked_out_once(self):
+        # Creating the Bread has already worked out which columns are sortable,
+        # so requests don't build any querysets to find out
+        self.give_permission("browse")
+        request = self.request_factory.get("")
+        request.user = self.user
+        with patch.object(self.BrowseClass, "get_sort_field_name_for_column") as m:
+            rsp = self.bread.get_browse_view()(request)
+        self.assertEqual(200, rsp.status_code)
+        m.assert_not_called()
+        self.assertEqual([0], rsp.context_data["view"]._valid_sorting_columns)
+
 
 class DisableSortTest(BreadTestCase):
     class BrowseClass(BrowseView):
@@ -377,3 +392,239 @@ class AnnotationsBrowseTest(BreadTestCase):
         )
         results = rsp.context_data["object_list"]
         self.assertListEqual([a, b, c, d, e], list(results), "results were not sorted")
+
+
+class RelatedLookupsBrowseTest(BreadTestCase):
+    def get_browse_query_count(self, num_items):
+        self.model.objects.all().delete()
+        for __ in range(num_items):
+            BreadTestModelFactory(other__model1=BreadTestModelFactory())
+        url = reverse(self.bread.get_url_name("browse"))
+        request = self.request_factory.get(url)
+        request.user = self.user
+        with CaptureQueriesContext(connection) as queries:
+            rsp = self.bread.get_browse_view()(request)
+            self.assertEqual(200, rsp.status_code)
+            rsp.render()
+        return len(queries)
+
+    def test_query_count_does_not_depend_on_rows(self):
+        self.set_urls(self.bread)
+        self.give_permission("browse")
+        # Warm up caches of content types and the user's permissions
+        self.get_browse_query_count(1)
+        self.assertEqual(self.get_browse_query_count(2), self.get_browse_query_count(6))
+
+    def test_related_lookups(self):
+        view = self.bread.browse_view(bread=self.bread, model=self.model)
+        self.assertEqual(
+            (["other", "model1"], []), view.get_related_lookups(self.model)
+        )
+
+    def test_opt_out(self):
+        self.set_urls(self.bread)
+        self.give_permission("browse")
+        self.bread.browse_view.auto_related = False
+        self.get_browse_query_count(1)
+        self.assertLess(self.get_browse_query_count(2), self.get_browse_query_count(6))
+
+
+class OnlyColumnsBrowseTest(BreadTestCase):
+    class BrowseClass(BrowseView):
+        columns = [
+            ("Name", "name"),
+            ("Text", "other__text"),
+            ("Roundabout Name", "get_name"),
+        ]
+        column_fields = {"get_name": ["name"]}
+        only_columns = True
+
+    extra_bread_attributes = {
+        "browse_view": BrowseClass,
+    }
+
+    def test_only_loads_needed_fields(self):
+        self.set_urls(self.bread)
+        self.give_permission("browse")
+        items = [BreadTestModelFactory() for __ in range(3)]
+        url = reverse(self.bread.get_url_name("browse"))
+        request = self.request_factory.get(url)
+        request.user = self.user
+        self.bread.get_browse_view()(request).render()  # warm up
+        with CaptureQueriesContext(connection) as queries:
+            rsp = self.bread.get_browse_view()(request)
+            self.assertEqual(200, rsp.status_code)
+            rsp.render()
+        browse_queries = [q for q in queries if "tests_breadtestmodel" in q["sql"]]
+        # Everything came from one query (no deferred fields were loaded later)
+        self.assertEqual(1, len(browse_queries))
+        sql = browse_queries[0]["sql"].split(" FROM ")[0]
+        self.assertNotIn('"tests_breadtestmodel"."age"', sql)
+        self.assertNotIn('"tests_breadtestmodel2"."label_model_id"', sql)
+        body = rsp.content.decode("utf-8")
+        for item in items:
+            self.assertIn(item.other.text, body)
+
+    def test_undeclared_method_loads_everything(self):
+        class BrowseClass(self.BrowseClass):
+            column_fields = {}
+
+        view = BrowseClass(bread=self.bread, model=self.model)
+        self.assertIsNone(view.get_only_fields(self.model))
+
+
+class RowsBrowseTest(BreadTestCase):
+    def setUp(self):
+        super(RowsBrowseTest, self).setUp()
+        self.set_urls(self.bread)
+        self.give_permission("browse")
+        self.give_permission("view")
+        self.give_permission("change")
+        self.bread.browse_view.paginate_by = 2
+        self.items = [
+            BreadTestModelFactory(name=name, other__text=name.upper())
+            for name in ["amy", "bob", "cal"]
+        ]
+
+    def get(self):
+        request = self.request_factory.get(reverse(self.bread.get_url_name("browse")))
+        request.user = self.user
+        rsp = self.bread.get_browse_view()(request)
+        self.assertEqual(200, rsp.status_code)
+        rsp.render()
+        return rsp
+
+    def test_rows(self):
+        rsp = self.get()
+        rows = rsp.context_data["rows"]
+        self.assertEqual([self.items[0], self.items[1]], [row.object for row in rows])
+        amy = self.items[0]
+        self.assertEqual(amy.pk, rows[0].pk)
+        self.assertEqual(["amy", "AMY", None, "amy"], rows[0].cells)
+        self.assertEqual(
+            reverse(self.bread.read_url_name(), args=[amy.pk]), rows[0].read_url
+        )
+        self.assertEqual(
+            reverse(self.bread.edit_url_name(), args=[amy.pk]), rows[0].edit_url
+        )
+
+    def test_only_rows_on_page_rendered(self):
+        body = self.get().content.decode("utf-8")
+        self.assertIn("AMY", body)
+        self.assertIn("BOB", body)
+        self.assertNotIn("CAL", body)
+        self.assertIn(
+            reverse(self.bread.edit_url_name(), args=[self.items[0].pk]), body
+        )
+
+
+class ConditionalBrowseView(BrowseView):
+    columns = [("Name", "name")]
+    last_modified_field = "modified"
+    search_fields = ["name"]
+
+
+class ConditionalBrowseTest(BreadTestCase):
+    def setUp(self):
+        super(ConditionalBrowseTest, self).setUp()
+        self.model = BreadVersionedTestModel
+        self.model_name = self.model._meta.model_name
+
+        class ConditionalBread(Bread):
+            base_template = "bread/empty.html"
+            browse_view = ConditionalBrowseView
+            model = BreadVersionedTestModel
+
+        self.bread = ConditionalBread()
+        self.set_urls(self.bread)
+        self.give_permission("browse")
+        self.items = [
+            BreadVersionedTestModelFactory(name=name) for name in ["amy", "bob"]
+        ]
+
+    def get(self, data=None, **extra):
+        request = self.request_factory.get("", data=data or {}, **extra)
+        request.user = self.user
+        rsp = self.bread.get_browse_view()(request)
+        if hasattr(rsp, "render"):
+            rsp.render()
+        return rsp
+
+    def test_not_modified(self):
+        etag = self.get().headers["ETag"]
+        with CaptureQueriesContext(connection) as queries:
+            with patch.object(BrowseView, "get_context_data") as mock_context:
+                rsp = self.get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(304, rsp.status_code)
+        mock_context.assert_not_called()
+        browse_queries = [
+            q for q in queries if "tests_breadversionedtestmodel" in q["sql"]
+        ]
+        self.assertEqual(1, len(browse_queries))
+        self.assertIn("MAX", browse_queries[0]["sql"])
+
+    def test_modified(self):
+        etag = self.get().headers["ETag"]
+        BreadVersionedTestModel.objects.filter(pk=self.items[0].pk).update(
+            modified=self.items[0].modified + timedelta(seconds=1)
+        )
+        self.assertEqual(200, self.get(HTTP_IF_NONE_MATCH=etag).status_code)
+
+    def test_deleted(self):
+        etag = self.get().headers["ETag"]
+        self.items[0].delete()
+        self.assertEqual(200, self.get(HTTP_IF_NONE_MATCH=etag).status_code)
+
+    def test_query_parms(self):
+        etag = self.get().headers["ETag"]
+        rsp = self.get({"q": "amy"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(200, rsp.status_code)
+        self.assertEqual(["amy"], [o.name for o in rsp.context_data["object_list"]])
+        self.assertEqual(
+            304, self.get({"q": "amy"}, HTTP_IF_NONE_MATCH=rsp["ETag"]).status_code
+        )
+
+    def test_no_last_modified_header(self):
+        # The latest modification time doesn't change when records are deleted
+        self.assertFalse(self.get().has_header("Last-Modified"))
+
+    def test_queryset_made_once(self):
+        with patch.object(
+            ConditionalBrowseView,
+            "get_queryset",
+            autospec=True,
+            side_effect=BrowseView.get_queryset,
+        ) as mock_get_queryset:
+            self.assertEqual(200, self.get().status_code)
+        self.assertEqual(1, mock_get_queryset.call_count)
+
+
+class RelatedConditionalBrowseTest(BreadTestCase):
+    class BrowseClass(BrowseView):
+        columns = [("Name", "name"), ("Text", "other__text")]
+        last_modified_field = "age"  # Anything Max() works on
+
+    extra_bread_attributes = {"browse_view": BrowseClass}
+
+    def setUp(self):
+        super(RelatedConditionalBrowseTest, self).setUp()
+        self.set_urls(self.bread)
+        self.give_permission("browse")
+        self.item = BreadTestModelFactory(name="amy", other__text="AMY")
+
+    def get(self, **extra):
+        request = self.request_factory.get("", **extra)
+        request.user = self.user
+        rsp = self.bread.get_browse_view()(request)
+        if hasattr(rsp, "render"):
+            rsp.render()
+        return rsp
+
+    def test_related_record_changed(self):
+        etag = self.get()["ETag"]
+        self.assertEqual(304, self.get(HTTP_IF_NONE_MATCH=etag).status_code)
+        self.item.other.text = "ANN"
+        self.item.other.save()
+        rsp = self.get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(200, rsp.status_code)
+        self.assertIn("ANN", rsp.content.decode("utf-8"))
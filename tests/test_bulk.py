@@ -0,0 +1,224 @@
+import json
+from datetime import timedelta
+
+from django.core.exceptions import PermissionDenied
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from bread.bread import Bread, BrowseView
+from bread.cache import get_model_versions
+
+from .base import BreadTestCase
+from .factories import (
+    BreadTestModel2Factory,
+    BreadTestModelFactory,
+    BreadVersionedTestModelFactory,
+)
+from .models import BreadProtectedTestModel, BreadVersionedTestModel
+
+
+class BulkBrowseView(BrowseView):
+    bulk_actions = ["update", "delete"]
+    bulk_delete_batch_size = 2
+    bulk_update_fields = ["age"]
+    columns = [("Name", "name"), ("Age", "age")]
+    search_fields = ["name"]
+
+
+class BreadBulkActionTest(BreadTestCase):
+    def setUp(self):
+        super(BreadBulkActionTest, self).setUp()
+        self.bread.browse_view = BulkBrowseView
+        self.set_urls(self.bread)
+        self.items = [
+            BreadTestModelFactory(name=name, age=1)
+            for name in ["amy", "ann", "bob", "cal", "dee"]
+        ]
+        self.give_permission("browse")
+
+    def post(self, data, query="", **headers):
+        url = reverse(self.bread.browse_url_name()) + query
+        request = self.request_factory.post(url, data, **headers)
+        request.user = self.user
+        return self.bread.get_browse_view()(request)
+
+    def queries_on_model(self, data, query=""):
+        """Post `data` and return the SQL of the queries on the test model"""
+        with CaptureQueriesContext(connection) as queries:
+            rsp = self.post(data, query)
+        self.assertEqual(302, rsp.status_code)
+        self.assertEqual(reverse(self.bread.browse_url_name()) + query, rsp.url)
+        return [q["sql"] for q in queries if "tests_breadtestmodel" in q["sql"]]
+
+    def ages(self):
+        return dict(self.model.objects.values_list("name", "age"))
+
+    def test_no_bulk_actions(self):
+        self.bread.browse_view = BrowseView
+        rsp = self.post({"action": "delete", "select_all": "1"})
+        self.assertEqual(405, rsp.status_code)
+        self.assertEqual(5, self.model.objects.count())
+
+    def test_update_selected(self):
+        self.give_permission("change")
+        data = {"action": "update", "field": "age", "age": 7}
+        few = self.queries_on_model(dict(data, pk=[self.items[0].pk]))
+        many = self.queries_on_model(
+            dict(data, pk=[item.pk for item in self.items[2:]])
+        )
+        # One UPDATE, however many records are selected
+        self.assertEqual(1, len(few))
+        self.assertEqual(1, len(many))
+        self.assertTrue(many[0].startswith("UPDATE"))
+        self.assertEqual(
+            {"amy": 7, "ann": 1, "bob": 7, "cal": 7, "dee": 7}, self.ages()
+        )
+
+    def test_update_all_search_results(self):
+        self.give_permission("change")
+        data = {"action": "update", "field": "age", "age": 3, "select_all": "1"}
+        queries = self.queries_on_model(data, "?q=a&o=-0")
+        self.assertEqual(1, len(queries))
+        self.assertEqual(
+            {"amy": 3, "ann": 3, "bob": 1, "cal": 3, "dee": 1}, self.ages()
+        )
+
+    def test_update_only_fields_allowed(self):
+        self.give_permission("change")
+        rsp = self.post({"action": "update", "field": "name", "name": "x", "pk": 1})
+        self.assertEqual(400, rsp.status_code)
+
+    def test_update_invalid(self):
+        self.give_permission("change")
+        rsp = self.post(
+            {"action": "update", "field": "age", "age": "old", "select_all": "1"},
+            HTTP_ACCEPT="application/json",
+        )
+        self.assertEqual(400, rsp.status_code)
+        self.assertIn("age", json.loads(rsp.content)["errors"])
+        self.assertEqual({1}, set(self.ages().values()))
+
+    def test_update_needs_change_permission(self):
+        self.give_permission("delete")
+        with self.assertRaises(PermissionDenied):
+            self.post({"action": "update", "field": "age", "age": 2, "pk": 1})
+
+    def test_delete_selected(self):
+        self.give_permission("delete")
+        rsp = self.post(
+            {"action": "delete", "pk": [self.items[0].pk, self.items[4].pk]},
+            HTTP_ACCEPT="application/json",
+        )
+        self.assertEqual({"action": "delete", "count": 2}, json.loads(rsp.content))
+        self.assertEqual(["ann", "bob", "cal"], sorted(self.ages()))
+
+    def test_delete_in_batches(self):
+        self.give_permission("delete")
+        queries = self.queries_on_model({"action": "delete", "select_all": "1"})
+        delete = 'DELETE FROM "tests_breadtestmodel" '
+        deletes = [sql for sql in queries if sql.startswith(delete)]
+        # 5 records, 2 at a time
+        self.assertEqual(3, len(deletes))
+        self.assertFalse(self.model.objects.exists())
+
+    def test_delete_protected(self):
+        self.give_permission("delete")
+        item = self.items[0]
+        # Deleting item cascades to child, and then to its records, but
+        # child is protected
+        child = BreadTestModel2Factory(model1=item)
+        BreadTestModelFactory.create_batch(3, other=child)
+        BreadProtectedTestModel.objects.create(other=child)
+        rsp = self.post(
+            {"action": "delete", "pk": [item.pk]}, HTTP_ACCEPT="application/json"
+        )
+        self.assertEqual(400, rsp.status_code)
+        errors = json.loads(rsp.content)["errors"]["__all__"]
+        self.assertEqual("protected", errors[0]["code"])
+        # Nothing deleted, not even the unprotected children
+        self.assertTrue(self.model.objects.filter(pk=item.pk).exists())
+        self.assertEqual(3, self.model.objects.filter(other=child).count())
+
+    def test_delete_needs_delete_permission(self):
+        self.give_permission("change")
+        with self.assertRaises(PermissionDenied):
+            self.post({"action": "delete", "select_all": "1"})
+
+    def test_invalid_action(self):
+        rsp = self.post({"action": "explode", "select_all": "1"})
+        self.assertEqual(400, rsp.status_code)
+
+    def test_nothing_selected(self):
+        self.give_permission("delete")
+        rsp = self.post({"action": "delete"})
+        self.assertEqual(400, rsp.status_code)
+
+    def test_browse_form(self):
+        self.give_permission("change")
+        request = self.request_factory.get(reverse(self.bread.browse_url_name()))
+        request.user = self.user
+        rsp = self.bread.get_browse_view()(request)
+        rsp.render()
+        body = rsp.content.decode("utf-8")
+        self.assertIn(
+            '<input type="checkbox" name="pk" value="%s">' % self.items[0].pk, body
+        )
+        self.assertIn('name="action" value="update"', body)
+        # No delete permission
+        self.assertNotIn('name="action" value="delete"', body)
+
+
+class VersionedBulkBrowseView(BrowseView):
+    bulk_actions = ["update"]
+    bulk_update_fields = ["name"]
+    columns = [("Name", "name")]
+    last_modified_field = "modified"
+
+
+class BreadVersionedBulkActionTest(BreadTestCase):
+    def setUp(self):
+        super(BreadVersionedBulkActionTest, self).setUp()
+        self.model = BreadVersionedTestModel
+        self.model_name = self.model._meta.model_name
+
+        class VersionedBread(Bread):
+            base_template = "bread/empty.html"
+            browse_view = VersionedBulkBrowseView
+            model = BreadVersionedTestModel
+
+        self.bread = VersionedBread()
+        self.set_urls(self.bread)
+        self.give_permission("browse")
+        self.give_permission("change")
+        self.item = BreadVersionedTestModelFactory(name="amy")
+        self.long_ago = timezone.now() - timedelta(days=1)
+        self.model.objects.update(modified=self.long_ago)
+
+    def request(self, method, data=None, **headers):
+        url = reverse(self.bread.browse_url_name())
+        request = getattr(self.request_factory, method)(url, data, **headers)
+        request.user = self.user
+        return self.bread.get_browse_view()(request)
+
+    def test_update_changes_etag(self):
+        etag = self.request("get")["ETag"]
+        rsp = self.request(
+            "post",
+            {"action": "update", "field": "name", "name": "ann", "pk": self.item.pk},
+        )
+        self.assertEqual(302, rsp.status_code)
+        self.item.refresh_from_db()
+        self.assertEqual("ann", self.item.name)
+        self.assertGreater(self.item.modified, self.long_ago)
+        rsp = self.request("get", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(200, rsp.status_code)
+
+    def test_update_bumps_model_version(self):
+        versions = get_model_versions([self.model])
+        self.request(
+            "post",
+            {"action": "update", "field": "name", "name": "ann", "pk": self.item.pk},
+        )
+        self.assertNotEqual(versions, get_model_versions([self.model]))
@@ -0,0 +1,236 @@
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from django.contrib.sessions.models import Session
+from django.core.cache import caches
+from django.db import connection
+from django.db.models.signals import post_delete
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from bread.bread import Bread, BrowseView
+from bread.cache import bump_model_version, get_model_versions
+from tests.models import BreadLabelValueTestModel, BreadTestModel, BreadTestModel2
+
+from .base import BreadTestCase
+from .factories import BreadTestModelFactory
+
+
+class CachedBrowseView(BrowseView):
+    cache_results = True
+    columns = [("Name", "name"), ("Text", "other__text")]
+    paginate_by = 2
+    search_fields = ["name"]
+
+
+class CachedBread(Bread):
+    base_template = "bread/empty.html"
+    browse_view = CachedBrowseView
+    model = BreadTestModel
+    views = "B"
+
+
+class ResultsCacheTestMixin(object):
+    def setUp(self):
+        super(ResultsCacheTestMixin, self).setUp()
+        caches["default"].clear()
+        self.bread = CachedBread()
+        self.give_permission("browse")
+        self.items = [
+            BreadTestModelFactory(name=name, other__text=name.upper())
+            for name in ["amy", "bob", "cal"]
+        ]
+
+    def get(self, data=None):
+        request = self.request_factory.get("", data=data or {})
+        request.user = self.user
+        with CaptureQueriesContext(connection) as queries:
+            rsp = self.bread.get_browse_view()(request)
+            self.assertEqual(200, rsp.status_code)
+            rsp.render()
+        self.queries = [
+            query["sql"] for query in queries if "tests_breadtestmodel" in query["sql"]
+        ]
+        return rsp
+
+    def get_names(self, data=None):
+        rsp = self.get(data)
+        return [obj.name for obj in rsp.context_data["object_list"]]
+
+    def test_cached(self):
+        rsp = self.get({"page": 2})
+        self.assertEqual(["cal"], [obj.name for obj in rsp.context_data["object_list"]])
+        self.assertEqual(2, len(self.queries))  # count and page
+
+        rsp = self.get({"page": 2})
+        self.assertEqual(["cal"], [obj.name for obj in rsp.context_data["object_list"]])
+        self.assertEqual(3, rsp.context_data["paginator"].count)
+        self.assertEqual(2, rsp.context_data["page_obj"].number)
+        self.assertEqual(1, len(self.queries))  # just the page's records
+        self.assertNotIn("COUNT", self.queries[0])
+
+    def test_query_parms_are_canonical(self):
+        self.get_names({"o": "0", "q": "a"})
+        self.get_names({"q": "a", "page": "", "o": "0"})
+        self.assertEqual(1, len(self.queries))
+        # But different values are different results
+        self.assertEqual(["cal"], self.get_names({"q": "c", "o": "0"}))
+
+    def test_saving_invalidates(self):
+        self.assertEqual(["amy", "bob"], self.get_names())
+        self.items[0].delete()
+        self.assertEqual(["bob", "cal"], self.get_names())
+        self.assertEqual(2, len(self.queries))
+
+    def test_saving_column_model_invalidates(self):
+        self.get_names({"o": "1"})
+        other = self.items[2].other
+        other.text = "AAA"
+        other.save()
+        self.assertEqual(["cal", "amy"], self.get_names({"o": "1"}))
+
+    def test_records_are_never_stale(self):
+        # Changes made without signals don't invalidate the cache, but the
+        # records are fetched again anyway
+        self.get_names()
+        BreadTestModel.objects.filter(pk=self.items[0].pk).update(name="ann")
+        self.assertEqual(["ann", "bob"], self.get_names())
+        self.assertEqual(1, len(self.queries))
+
+    def test_models(self):
+        self.assertEqual(
+            [BreadTestModel, BreadTestModel2],
+            CachedBrowseView.get_results_cache_models(BreadTestModel),
+        )
+
+    def test_model_versions(self):
+        models = [BreadTestModel, BreadLabelValueTestModel]
+        versions = get_model_versions(models)
+        self.assertEqual(versions, get_model_versions(models))
+        bump_model_version(BreadLabelValueTestModel)
+        new_versions = get_model_versions(models)
+        self.assertEqual(versions[0], new_versions[0])
+        self.assertNotEqual(versions[1], new_versions[1])
+
+    def test_only_watched_models_have_receivers(self):
+        # So other models' records can still be deleted without fetching them
+        self.assertFalse(post_delete.has_listeners(Session))
+        self.assertTrue(post_delete.has_listeners(BreadTestModel))
+
+    def test_bumped_again_on_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.items[0].save()
+        versions = get_model_versions([BreadTestModel])
+        self.assertEqual(1, len(callbacks))
+        callbacks[0]()
+        self.assertNotEqual(versions, get_model_versions([BreadTestModel]))
+
+    def test_evicted_version(self):
+        versions = get_model_versions([BreadTestModel])
+        caches["default"].clear()
+        self.assertNotEqual(versions, get_model_versions([BreadTestModel]))
+
+
+class FileBasedCacheTestMixin(object):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        settings_override = override_settings(
+            CACHES={
+                "default": {
+                    "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                    "LOCATION": self.cache_dir,
+                }
+            }
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        super(FileBasedCacheTestMixin, self).setUp()
+
+
+class LocMemResultsCacheTest(ResultsCacheTestMixin, BreadTestCase):
+    pass
+
+
+class FileBasedResultsCacheTest(
+    FileBasedCacheTestMixin, ResultsCacheTestMixin, BreadTestCase
+):
+    pass
+
+
+class RowCacheBrowseView(BrowseView):
+    cache_rows = True
+    columns = [("Name", "name"), ("Text", "other__text")]
+
+
+class RowVersionBrowseView(RowCacheBrowseView):
+    row_version_field = "age"
+
+
+class RowCacheTestMixin(object):
+    def setUp(self):
+        super(RowCacheTestMixin, self).setUp()
+        caches["default"].clear()
+        self.bread.browse_view = RowCacheBrowseView
+        self.set_urls(self.bread)
+        self.give_permission("browse")
+        self.item = BreadTestModelFactory(name="amy", age=1, other__text="AMY")
+
+    def get_body(self):
+        request = self.request_factory.get("")
+        request.user = self.user
+        rsp = self.bread.get_browse_view()(request)
+        self.assertEqual(200, rsp.status_code)
+        rsp.render()
+        return rsp.content.decode("utf-8")
+
+    def test_rows_cached(self):
+        self.assertIn("amy", self.get_body())
+        # Changes that don't send signals aren't noticed
+        BreadTestModel.objects.update(name="ann")
+        with patch("bread.templatetags.bread_tags.Accessor.__call__") as mock_get:
+            self.assertIn("amy", self.get_body())
+        mock_get.assert_not_called()
+
+    def test_saving_invalidates(self):
+        self.get_body()
+        self.item.name = "ann"
+        self.item.save()
+        self.assertIn("ann", self.get_body())
+
+    def test_saving_column_model_invalidates(self):
+        self.get_body()
+        self.item.other.text = "ANN"
+        self.item.other.save()
+        self.assertIn("ANN", self.get_body())
+
+    def test_permissions_in_key(self):
+        self.assertNotIn("Edit", self.get_body())
+        self.give_permission("change")
+        self.user = type(self.user).objects.get(pk=self.user.pk)
+        self.assertIn("Edit", self.get_body())
+
+    def test_row_version_field(self):
+        self.bread.browse_view = RowVersionBrowseView
+        other_item = BreadTestModelFactory(name="bob", age=1)
+        self.assertIn("amy", self.get_body())
+        # Saving one record doesn't invalidate the other rows...
+        other_item.name = "bea"
+        other_item.age = 2
+        other_item.save()
+        with patch("bread.templatetags.bread_tags.Accessor.__call__") as mock_get:
+            mock_get.return_value = "bea"
+            self.assertIn("bea", self.get_body())
+        self.assertEqual(2, mock_get.call_count)  # bea's cells
+        # ...and a record is rendered again when its version changes
+        BreadTestModel.objects.filter(pk=self.item.pk).update(name="ann", age=2)
+        self.assertIn("ann", self.get_body())
+
+
+class LocMemRowCacheTest(RowCacheTestMixin, BreadTestCase):
+    pass
+
+
+class FileBasedRowCacheTest(FileBasedCacheTestMixin, RowCacheTestMixin, BreadTestCase):
+    pass
@@ -1,7 +1,12 @@
+import json
+
 from django.http import Http404
 from django.urls import reverse
 
+from bread.bread import DeleteView
+
 from .base import BreadTestCase
+from .test_deletion import InlineExecutor
 
 
 class BreadDeleteTest(BreadTestCase):
@@ -49,3 +54,69 @@ class BreadDeleteTest(BreadTestCase):
         view = self.bread.get_delete_view()
         with self.assertRaises(Http404):
             view(request, pk=999)
+
+
+class BackgroundDeleteView(DeleteView):
+    delete_batch_size = 2
+    delete_executor = InlineExecutor()
+    delete_in_background = True
+
+
+class BreadBackgroundDeleteTest(BreadTestCase):
+    def setUp(self):
+        super(BreadBackgroundDeleteTest, self).setUp()
+        self.bread.delete_view = BackgroundDeleteView
+        self.set_urls(self.bread)
+        self.give_permission("delete")
+        # Deleting the item cascades to the BreadTestModel2 whose model1 it
+        # is, then to the BreadTestModels whose other that is
+        self.item = self.model_factory()
+        self.others = [self.model_factory(other=self.item.other) for i in range(3)]
+        self.item.other.model1 = self.item
+        self.item.other.save()
+        self.url = reverse(
+            self.bread.get_url_name("delete"), kwargs={"pk": self.item.pk}
+        )
+
+    def request(self, method, url, **headers):
+        request = getattr(self.request_factory, method)(url, **headers)
+        request.user = self.user
+        return self.bread.get_delete_view()(request, pk=self.item.pk)
+
+    def test_confirm_shows_cascade(self):
+        rsp = self.request("get", self.url)
+        rsp.render()
+        self.assertEqual(
+            [("bread test model2s", 1), ("bread test models", 3)],
+            rsp.context_data["cascade_counts"],
+        )
+        self.assertIn("<li>3 bread test models</li>", rsp.content.decode("utf-8"))
+
+    def test_delete(self):
+        rsp = self.request("post", self.url)
+        self.assertEqual(302, rsp.status_code)
+        self.assertIn("?job=", rsp.url)
+        self.assertFalse(self.model.objects.exists())
+
+        rsp = self.request("get", rsp.url)
+        rsp.render()
+        self.assertEqual(
+            {"status": "done", "deleted": 5, "total": 5},
+            rsp.context_data["deletion"],
+        )
+        self.assertIn("Deleted 5 records.", rsp.content.decode("utf-8"))
+
+    def test_delete_json(self):
+        rsp = self.request("post", self.url, HTTP_ACCEPT="application/json")
+        self.assertEqual(202, rsp.status_code)
+        data = json.loads(rsp.content)
+        self.assertEqual(self.item.pk, data["pk"])
+
+        rsp = self.request("get", data["progress_url"], HTTP_ACCEPT="application/json")
+        self.assertEqual(
+            {"status": "done", "deleted": 5, "total": 5}, json.loads(rsp.content)
+        )
+
+    def test_no_such_job(self):
+        with self.assertRaises(Http404):
+            self.request("get", self.url + "?job=nope")
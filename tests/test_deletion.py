@@ -0,0 +1,133 @@
+from concurrent.futures import Executor, Future
+
+from django.db import connection
+from django.db.models import ProtectedError
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+
+from bread.deletion import (
+    DeletionJob,
+    check_protected,
+    count_cascade,
+    delete_in_batches,
+)
+
+from .factories import (
+    BreadLabelValueTestModelFactory,
+    BreadTestModel2Factory,
+    BreadTestModelFactory,
+)
+from .models import (
+    BreadLabelValueTestModel,
+    BreadProtectedTestModel,
+    BreadTestModel,
+    BreadTestModel2,
+)
+
+
+class InlineExecutor(Executor):
+    """Runs what's submitted right away, for testing"""
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+class DeletionTestMixin(object):
+    def make_records(self):
+        # Deleting the label model cascades to a BreadTestModel2,
+        # which cascades to the BreadTestModels
+        self.label_model = BreadLabelValueTestModelFactory()
+        self.other = BreadTestModel2Factory(label_model=self.label_model)
+        for i in range(5):
+            BreadTestModelFactory(other=self.other)
+        self.queryset = BreadLabelValueTestModel.objects.filter(pk=self.label_model.pk)
+
+    def assertAllDeleted(self):
+        self.assertFalse(BreadLabelValueTestModel.objects.exists())
+        self.assertFalse(BreadTestModel2.objects.exists())
+        self.assertFalse(BreadTestModel.objects.exists())
+
+
+class DeletionTest(DeletionTestMixin, TestCase):
+    def setUp(self):
+        self.make_records()
+
+    def test_count_cascade(self):
+        with CaptureQueriesContext(connection) as queries:
+            counts = count_cascade(self.queryset)
+        self.assertEqual([(BreadTestModel2, 1), (BreadTestModel, 5)], counts)
+        # Only counted, one query per relation followed
+        self.assertEqual(3, len(queries))
+        for query in queries:
+            self.assertTrue(query["sql"].startswith("SELECT COUNT("), query["sql"])
+
+    def test_delete_in_batches(self):
+        progress = []
+        with CaptureQueriesContext(connection) as queries:
+            result = delete_in_batches(self.queryset, 2, progress=progress.append)
+        self.assertEqual(
+            (
+                7,
+                {
+                    "tests.BreadLabelValueTestModel": 1,
+                    "tests.BreadTestModel2": 1,
+                    "tests.BreadTestModel": 5,
+                },
+            ),
+            result,
+        )
+        self.assertEqual([2, 4, 5, 6, 7], progress)
+        deletes = [
+            q["sql"]
+            for q in queries
+            if q["sql"].startswith('DELETE FROM "tests_breadtestmodel" ')
+        ]
+        self.assertEqual(3, len(deletes))
+        self.assertAllDeleted()
+
+    def test_protected(self):
+        BreadProtectedTestModel.objects.create(other=self.other)
+        with self.assertRaises(ProtectedError):
+            check_protected(self.queryset)
+        check_protected(BreadTestModel.objects.all())
+
+    def test_delete_protected(self):
+        BreadProtectedTestModel.objects.create(other=self.other)
+        with self.assertRaises(ProtectedError):
+            delete_in_batches(self.queryset, 2)
+        # Checked first, so nothing was deleted, not even the children
+        self.assertEqual(5, BreadTestModel.objects.count())
+        self.assertTrue(self.queryset.exists())
+
+    def test_job(self):
+        job = DeletionJob(self.queryset, batch_size=2)
+        job.start(InlineExecutor()).result()
+        self.assertEqual(
+            {"status": "done", "deleted": 7, "total": 7},
+            DeletionJob.get_progress(job.id),
+        )
+        self.assertAllDeleted()
+
+    def test_job_failed(self):
+        BreadProtectedTestModel.objects.create(other=self.other)
+        job = DeletionJob(self.queryset)
+        future = job.start(InlineExecutor())
+        self.assertIsInstance(future.exception(), ProtectedError)
+        progress = DeletionJob.get_progress(job.id)
+        self.assertEqual("failed", progress["status"])
+        self.assertEqual(0, progress["deleted"])
+        self.assertTrue(BreadTestModel.objects.exists())
+
+
+class DeletionJobThreadTest(DeletionTestMixin, TransactionTestCase):
+    def test_default_executor(self):
+        self.make_records()
+        job = DeletionJob(self.queryset, batch_size=2)
+        job.start().result(timeout=30)
+        self.assertEqual("done", DeletionJob.get_progress(job.id)["status"])
+        self.assertAllDeleted()
@@ -1,10 +1,16 @@
+import json
+
 from django import forms
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from bread.bread import Bread, EditView
+from bread.cache import get_model_versions
 
 from .base import BreadTestCase
-from .models import BreadTestModel
+from .factories import BreadVersionedTestModelFactory
+from .models import BreadTestModel, BreadVersionedTestModel
 
 
 class BreadEditTest(BreadTestCase):
@@ -86,3 +92,169 @@ class BreadEditTest(BreadTestCase):
         # Call the view function to invoke dispatch so we can get to the view itself
         view_function(None, None, None)
         self.assertEqual(DummyForm, glob["view_object"].form_class)
+
+
+def columns_written(queries):
+    """Return the names of the columns set by the UPDATE queries among `queries`,
+    and their WHERE clauses"""
+    columns, wheres = [], []
+    for query in queries:
+        if query["sql"].startswith("UPDATE"):
+            assignments, where = query["sql"].split(" SET ", 1)[1].split(" WHERE ")
+            columns += [a.split(" = ")[0].strip('"') for a in assignments.split(", ")]
+            wheres.append(where)
+    return columns, wheres
+
+
+class BreadPartialEditTest(BreadTestCase):
+    def setUp(self):
+        super(BreadPartialEditTest, self).setUp()
+        self.set_urls(self.bread)
+        self.give_permission("change")
+        self.item = self.model_factory(name="amy", age=20)
+
+    def post(self, data):
+        request = self.request_factory.post("", data=data)
+        request.user = self.user
+        with CaptureQueriesContext(connection) as queries:
+            rsp = self.bread.get_edit_view()(request, pk=self.item.pk)
+        return rsp, queries
+
+    def test_only_changed_fields_written(self):
+        rsp, queries = self.post(
+            {"name": "ann", "age": 20, "other": self.item.other_id}
+        )
+        self.assertEqual(302, rsp.status_code)
+        self.assertEqual(["name"], columns_written(queries)[0])
+        self.item.refresh_from_db()
+        self.assertEqual(("ann", 20), (self.item.name, self.item.age))
+
+    def test_nothing_changed(self):
+        rsp, queries = self.post(
+            {"name": "amy", "age": 20, "other": self.item.other_id}
+        )
+        self.assertEqual(302, rsp.status_code)
+        self.assertEqual([], columns_written(queries)[0])
+
+    def test_fields_set_by_form_written(self):
+        class AgingForm(forms.ModelForm):
+            class Meta:
+                model = BreadTestModel
+                fields = ["name"]
+
+            def clean(self):
+                self.instance.age = 21
+                return super(AgingForm, self).clean()
+
+        class AgingEditView(EditView):
+            form_class = AgingForm
+
+        class AgingBread(self.BreadTestClass):
+            edit_view = AgingEditView
+
+        self.bread = AgingBread()
+        rsp, queries = self.post({"name": "ann"})
+        self.assertEqual(302, rsp.status_code)
+        self.assertEqual(["name", "age"], columns_written(queries)[0])
+        self.item.refresh_from_db()
+        self.assertEqual(("ann", 21), (self.item.name, self.item.age))
+
+    def test_save_all_fields(self):
+        class AllFieldsEditView(EditView):
+            save_changed_fields_only = False
+
+        class AllFieldsBread(self.BreadTestClass):
+            edit_view = AllFieldsEditView
+
+        self.bread = AllFieldsBread()
+        rsp, queries = self.post(
+            {"name": "ann", "age": 20, "other": self.item.other_id}
+        )
+        self.assertEqual(302, rsp.status_code)
+        self.assertEqual(["name", "age", "other_id"], columns_written(queries)[0])
+
+
+class VersionedEditView(EditView):
+    version_field = "version"
+
+
+class BreadVersionedEditTest(BreadTestCase):
+    def setUp(self):
+        super(BreadVersionedEditTest, self).setUp()
+        self.model = BreadVersionedTestModel
+        self.model_name = self.model._meta.model_name
+
+        class VersionedBread(Bread):
+            base_template = "bread/empty.html"
+            model = BreadVersionedTestModel
+            edit_view = VersionedEditView
+
+        self.bread = VersionedBread()
+        self.set_urls(self.bread)
+        self.give_permission("change")
+        self.item = BreadVersionedTestModelFactory(name="amy")
+
+    def post(self, data, **headers):
+        request = self.request_factory.post("", data=data, **headers)
+        request.user = self.user
+        with CaptureQueriesContext(connection) as queries:
+            rsp = self.bread.get_edit_view()(request, pk=self.item.pk)
+        return rsp, queries
+
+    def test_get(self):
+        request = self.request_factory.get("")
+        request.user = self.user
+        rsp = self.bread.get_edit_view()(request, pk=self.item.pk)
+        rsp.render()
+        self.assertNotIn("version", rsp.context_data["form"].fields)
+        self.assertIn(
+            '<input type="hidden" name="version" value="1">',
+            rsp.content.decode("utf-8"),
+        )
+
+    def test_save(self):
+        rsp, queries = self.post({"name": "ann", "version": 1})
+        self.assertEqual(302, rsp.status_code)
+        columns, wheres = columns_written(queries)
+        # The changed field, the auto_now field and the version
+        self.assertEqual(["name", "modified", "version"], columns)
+        self.assertIn('"version" = 1', wheres[0])
+        self.item.refresh_from_db()
+        self.assertEqual(("ann", 2), (self.item.name, self.item.version))
+
+    def test_save_bumps_model_version(self):
+        versions = get_model_versions([self.model])
+        rsp, __ = self.post({"name": "ann", "version": 1})
+        self.assertEqual(302, rsp.status_code)
+        self.assertNotEqual(versions, get_model_versions([self.model]))
+
+    def test_conflict(self):
+        self.model.objects.filter(pk=self.item.pk).update(name="bob", version=2)
+        rsp, queries = self.post({"name": "ann", "version": 1})
+        self.assertEqual(409, rsp.status_code)
+        self.assertEqual(
+            ["conflict"],
+            [e.code for e in rsp.context_data["form"].non_field_errors().as_data()],
+        )
+        rsp.render()
+        # Still the version the user started from, so they can't overwrite
+        # the other changes without reloading
+        self.assertIn('name="version" value="1"', rsp.content.decode("utf-8"))
+        self.item.refresh_from_db()
+        self.assertEqual(("bob", 2), (self.item.name, self.item.version))
+
+    def test_conflict_json(self):
+        self.model.objects.filter(pk=self.item.pk).update(version=5)
+        rsp, __ = self.post(
+            {"name": "ann", "version": 4}, HTTP_ACCEPT="application/json"
+        )
+        self.assertEqual(409, rsp.status_code)
+        data = json.loads(rsp.content)
+        self.assertEqual("conflict", data["errors"]["__all__"][0]["code"])
+        self.assertEqual("4", data["version"])
+
+    def test_missing_version(self):
+        rsp, __ = self.post({"name": "ann"})
+        self.assertEqual(400, rsp.status_code)
+        self.item.refresh_from_db()
+        self.assertEqual("amy", self.item.name)
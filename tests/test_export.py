@@ -0,0 +1,108 @@
+import csv
+import io
+import json
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from bread.bread import BrowseView, ExportView
+
+from .base import BreadTestCase
+from .factories import BreadTestModelFactory
+
+
+class BreadExportTest(BreadTestCase):
+    class BrowseClass(BrowseView):
+        columns = [
+            ("Name", "name"),
+            ("Text", "other__text"),
+            ("Roundabout Name", "get_name"),
+        ]
+        search_fields = ["name"]
+        paginate_by = 2
+
+    extra_bread_attributes = {"browse_view": BrowseClass, "views": "BREADX"}
+
+    def setUp(self):
+        super(BreadExportTest, self).setUp()
+        self.set_urls(self.bread)
+        self.give_permission("browse")
+        self.items = [BreadTestModelFactory(name="item%d" % i) for i in range(5)]
+
+    def export(self, query=""):
+        url = reverse(self.bread.get_url_name("export")) + query
+        request = self.request_factory.get(url)
+        request.user = self.user
+        return self.bread.get_export_view()(request)
+
+    def test_csv(self):
+        rsp = self.export("?o=-0")
+        self.assertEqual(200, rsp.status_code)
+        self.assertTrue(rsp.streaming)
+        self.assertEqual("text/csv; charset=utf-8", rsp["Content-Type"])
+        self.assertIn('filename="testmodels.csv"', rsp["Content-Disposition"])
+        content = b"".join(rsp.streaming_content).decode("utf-8")
+        rows = list(csv.reader(io.StringIO(content)))
+        self.assertEqual(["Name", "Text", "Roundabout Name"], rows[0])
+        # Sorted like the browse view, and not paginated
+        expected = [
+            [item.name, item.other.text, item.name]
+            for item in sorted(self.items, key=lambda item: item.name, reverse=True)
+        ]
+        self.assertEqual(expected, rows[1:])
+
+    def test_jsonl_with_search(self):
+        rsp = self.export("?format=jsonl&q=item3")
+        self.assertEqual(200, rsp.status_code)
+        lines = b"".join(rsp.streaming_content).decode("utf-8").splitlines()
+        item = self.items[3]
+        self.assertEqual(
+            [
+                {
+                    "Name": item.name,
+                    "Text": item.other.text,
+                    "Roundabout Name": item.name,
+                }
+            ],
+            [json.loads(line) for line in lines],
+        )
+
+    def test_iterates_in_chunks(self):
+        class SmallChunkExportView(ExportView):
+            chunk_size = 2
+
+        self.bread.export_view = SmallChunkExportView
+        rsp = self.export()
+        with CaptureQueriesContext(connection) as queries:
+            content = b"".join(rsp.streaming_content)
+        self.assertEqual(6, len(content.splitlines()))
+        # Related objects were selected along with the items
+        self.assertEqual(1, len(queries))
+
+    def test_bad_format(self):
+        rsp = self.export("?format=xls")
+        self.assertEqual(400, rsp.status_code)
+
+    def test_bad_sorting(self):
+        # A 400 before anything is streamed
+        rsp = self.export("?o=nine")
+        self.assertEqual(400, rsp.status_code)
+        self.assertFalse(rsp.streaming)
+
+    def test_browse_links_to_export(self):
+        url = reverse(self.bread.get_url_name("browse")) + "?q=item&page=2"
+        request = self.request_factory.get(url)
+        request.user = self.user
+        rsp = self.bread.get_browse_view()(request)
+        self.assertEqual(
+            reverse(self.bread.get_url_name("export")) + "?q=item",
+            rsp.context_data["export_url"],
+        )
+
+    def test_not_included_by_default(self):
+        self.bread.views = "BREAD"
+        self.assertNotIn(
+            self.bread.get_url_name("export"),
+            [pattern.name for pattern in self.bread.get_urls()],
+        )
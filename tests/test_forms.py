@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from django import forms
 from django.core.exceptions import ValidationError
 from django.urls import reverse
@@ -152,3 +154,37 @@ class BreadExcludeTest(BreadTestCase):
         self.assertFalse(form.is_bound)
         self.assertNotIn("id", form.initial)
         self.assertEqual(item.name, form.initial["name"])
+
+
+class BreadDefaultFormClassTest(BreadTestCase):
+    def setUp(self):
+        super(BreadDefaultFormClassTest, self).setUp()
+        self.give_permission("view")
+        self.item = self.model_factory()
+
+    def get_form_class(self, bread):
+        request = self.request_factory.get("")
+        request.user = self.user
+        rsp = bread.get_read_view()(request, pk=self.item.pk)
+        self.assertEqual(200, rsp.status_code)
+        return type(rsp.context_data["form"])
+
+    def test_made_once(self):
+        form_class = self.get_form_class(self.bread)
+        with patch("bread.bread.modelform_factory") as mock_factory:
+            self.assertIs(form_class, self.get_form_class(self.bread))
+            self.assertIs(form_class, self.get_form_class(self.BreadTestClass()))
+        mock_factory.assert_not_called()
+
+    def test_exclude(self):
+        form_class = self.get_form_class(self.bread)
+        self.bread.exclude = ["age"]
+        exclude_form_class = self.get_form_class(self.bread)
+        self.assertIsNot(form_class, exclude_form_class)
+        self.assertIn("age", form_class.base_fields)
+        self.assertNotIn("age", exclude_form_class.base_fields)
+
+    def test_cleared_when_settings_change(self):
+        form_class = self.get_form_class(self.bread)
+        with self.settings(USE_THOUSAND_SEPARATOR=True):
+            self.assertIsNot(form_class, self.get_form_class(self.bread))
@@ -0,0 +1,178 @@
+import json
+
+from django import forms
+from django.core.exceptions import PermissionDenied
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from bread.bread import AddView, Bread, ImportView
+from bread.cache import get_model_versions
+
+from .base import BreadTestCase
+from .models import BreadTestModel, BreadUniqueTestModel
+
+
+class ChunkedImportView(ImportView):
+    chunk_size = 4
+
+
+class BreadImportTest(BreadTestCase):
+    extra_bread_attributes = {"views": "BREADI", "import_view": ChunkedImportView}
+
+    def setUp(self):
+        super(BreadImportTest, self).setUp()
+        self.set_urls(self.bread)
+        self.url = reverse(self.bread.import_url_name())
+        self.give_permission("add")
+
+    def post(self, content, **headers):
+        upload = SimpleUploadedFile("data.csv", content.encode("utf-8"), "text/csv")
+        request = self.request_factory.post(self.url, {"file": upload}, **headers)
+        request.user = self.user
+        return self.bread.get_import_view()(request)
+
+    def make_csv(self, rows):
+        return "name,age\r\n" + "".join("%s,%s\r\n" % row for row in rows)
+
+    def test_import(self):
+        rows = [("name%d" % i, i) for i in range(10)]
+        content = self.make_csv(rows[:3] + [("bad", "old")] + rows[3:])
+        with CaptureQueriesContext(connection) as queries:
+            rsp = self.post(content, HTTP_ACCEPT="application/json")
+        self.assertEqual(200, rsp.status_code)
+        data = json.loads(rsp.content)
+        self.assertEqual(10, data["imported"])
+        self.assertEqual(1, data["error_count"])
+        self.assertEqual(5, data["errors"][0]["line"])
+        self.assertEqual(["age"], list(data["errors"][0]["errors"]))
+        self.assertEqual(
+            sorted(rows), sorted(self.model.objects.values_list("name", "age"))
+        )
+        # 10 records, 4 at a time
+        inserts = [q for q in queries if q["sql"].startswith("INSERT")]
+        self.assertEqual(3, len(inserts))
+        # The rest check permissions, and make savepoints for the chunks
+        other = [
+            q
+            for q in queries
+            if not q["sql"].startswith(("INSERT", "SAVEPOINT", "RELEASE"))
+        ]
+        self.assertEqual(2, len(other))
+
+    def test_bumps_model_version(self):
+        # So cached browse results and rows show the new records
+        versions = get_model_versions([self.model])
+        self.post(self.make_csv([("amy", 1)]))
+        self.assertNotEqual(versions, get_model_versions([self.model]))
+
+    def test_add_view_form(self):
+        class AdultForm(forms.ModelForm):
+            class Meta:
+                model = BreadTestModel
+                fields = ["name", "age"]
+
+            def clean_age(self):
+                if self.cleaned_data["age"] < 18:
+                    raise forms.ValidationError("Too young")
+                return self.cleaned_data["age"]
+
+        class AdultAddView(AddView):
+            form_class = AdultForm
+
+        self.bread.add_view = AdultAddView
+        rsp = self.post(
+            self.make_csv([("amy", 20), ("bob", 10)]), HTTP_ACCEPT="application/json"
+        )
+        data = json.loads(rsp.content)
+        self.assertEqual(1, data["imported"])
+        self.assertEqual(3, data["errors"][0]["line"])
+        self.assertEqual(["amy"], [obj.name for obj in self.model.objects.all()])
+
+    def test_max_errors(self):
+        self.bread.import_view.max_errors = 1
+        rsp = self.post(self.make_csv([("way too long a name", 1), ("ann", "")]))
+        self.assertEqual(2, rsp.context_data["error_count"])
+        self.assertEqual(1, len(rsp.context_data["import_errors"]))
+        self.assertEqual(0, rsp.context_data["imported"])
+
+    def test_html(self):
+        rsp = self.post(self.make_csv([("amy", 1), ("bob", "x")]))
+        rsp.render()
+        body = rsp.content.decode("utf-8")
+        self.assertIn("Imported 1 records.", body)
+        self.assertIn("Line 3:", body)
+        self.assertIn("age: Enter a whole number.", body)
+
+    def test_get(self):
+        request = self.request_factory.get(self.url)
+        request.user = self.user
+        rsp = self.bread.get_import_view()(request)
+        rsp.render()
+        self.assertIn("fields: name, age, other", rsp.content.decode("utf-8"))
+
+    def test_no_file(self):
+        request = self.request_factory.post(self.url)
+        request.user = self.user
+        self.assertEqual(400, self.bread.get_import_view()(request).status_code)
+
+    def test_not_utf8(self):
+        upload = SimpleUploadedFile("data.csv", "name,age\nJosé,1\n".encode("latin-1"))
+        request = self.request_factory.post(self.url, {"file": upload})
+        request.user = self.user
+        self.assertEqual(400, self.bread.get_import_view()(request).status_code)
+
+    def test_needs_add_permission(self):
+        self.user.user_permissions.clear()
+        with self.assertRaises(PermissionDenied):
+            self.post(self.make_csv([("amy", 1)]))
+
+    def test_not_in_views(self):
+        self.bread.views = "BREAD"
+        names = [pattern.name for pattern in self.bread.get_urls()]
+        self.assertNotIn(self.bread.import_url_name(include_namespace=False), names)
+
+    def test_browse_link(self):
+        self.give_permission("browse")
+        request = self.request_factory.get(reverse(self.bread.browse_url_name()))
+        request.user = self.user
+        rsp = self.bread.get_browse_view()(request)
+        rsp.render()
+        self.assertIn('<a href="%s">Import</a>' % self.url, rsp.content.decode("utf-8"))
+
+
+class BreadUniqueImportTest(BreadTestCase):
+    def setUp(self):
+        super(BreadUniqueImportTest, self).setUp()
+        self.model = BreadUniqueTestModel
+        self.model_name = self.model._meta.model_name
+
+        class UniqueBread(Bread):
+            base_template = "bread/empty.html"
+            model = BreadUniqueTestModel
+            views = "BREADI"
+
+        self.bread = UniqueBread()
+        self.set_urls(self.bread)
+        self.give_permission("add")
+
+    def test_integrity_error(self):
+        rows = ["c%d,name%d,2000" % (i, i) for i in range(5)]
+        # The same code twice in one chunk isn't caught by the form
+        rows.insert(3, "c1,other,2001")
+        content = "code,name,year\r\n" + "\r\n".join(rows) + "\r\n"
+        upload = SimpleUploadedFile("data.csv", content.encode("utf-8"))
+        request = self.request_factory.post("", {"file": upload})
+        request.user = self.user
+        rsp = self.bread.get_import_view()(request)
+        # Only the bad row isn't imported, and it's reported with its line
+        self.assertEqual(5, rsp.context_data["imported"])
+        self.assertEqual(1, rsp.context_data["error_count"])
+        error = rsp.context_data["import_errors"][0]
+        self.assertEqual(5, error["line"])
+        self.assertEqual("unique", error["errors"]["code"][0]["code"])
+        self.assertEqual(
+            ["c0", "c1", "c2", "c3", "c4"],
+            list(self.model.objects.values_list("code", flat=True)),
+        )
@@ -0,0 +1,160 @@
+from unittest import skipIf
+
+from django.core.cache import caches
+from django.test import override_settings
+from django.urls import clear_url_caches, reverse
+
+from bread.bread import AddView, BrowseView, DeleteView, LabelValueReadView
+from bread.deletion import DeletionJob
+
+from .base import BreadTestCase
+from .factories import BreadTestModelFactory
+
+try:
+    import jinja2
+except ImportError:  # pragma: no cover
+    jinja2 = None
+
+
+TEMPLATES = [
+    {
+        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "DIRS": ["bread/templates"],
+    },
+    {
+        "BACKEND": "django.template.backends.jinja2.Jinja2",
+        "NAME": "jinja2",
+        "APP_DIRS": True,
+        "OPTIONS": {"environment": "bread.jinja.environment"},
+    },
+]
+
+
+@skipIf(jinja2 is None, "Jinja2 is not installed")
+@override_settings(TEMPLATES=TEMPLATES)
+class BreadJinja2Test(BreadTestCase):
+    extra_bread_attributes = {"template_engine": "jinja2"}
+
+    def setUp(self):
+        super(BreadJinja2Test, self).setUp()
+        self.set_urls(self.bread)
+        self.item = BreadTestModelFactory(name="amy", other__text="AMY")
+
+    def get(self, view_name, **kwargs):
+        url = reverse(self.bread.get_url_name(view_name), kwargs=kwargs)
+        request = self.request_factory.get(url)
+        request.user = self.user
+        view = getattr(self.bread, "get_%s_view" % view_name)()
+        rsp = view(request, **kwargs)
+        self.assertEqual(200, rsp.status_code)
+        rsp.render()
+        template = rsp.resolve_template(rsp.template_name)
+        self.assertEqual("jinja2", template.backend.name)
+        return rsp.content.decode("utf-8")
+
+    def test_browse(self):
+        self.give_permission("browse")
+        self.give_permission("read")
+        self.give_permission("change")
+        self.bread.browse_view.paginate_by = 1
+        BreadTestModelFactory(name="bob")
+        body = self.get("browse")
+        self.assertIn('<a href="%s">AMY</a>' % self.bread.read_url(self.item.pk), body)
+        self.assertIn(self.bread.edit_url(self.item.pk), body)
+        self.assertIn("Showing page 1 of 2", body)
+
+    def test_browse_bulk_actions(self):
+        class BulkBrowseView(BrowseView):
+            bulk_actions = ["update"]
+            bulk_update_fields = ["age"]
+            columns = [("Name", "name")]
+
+        self.bread.browse_view = BulkBrowseView
+        self.give_permission("browse")
+        self.give_permission("change")
+        body = self.get("browse")
+        self.assertIn('name="csrfmiddlewaretoken"', body)
+        self.assertIn(
+            '<input type="checkbox" name="pk" value="%s">' % self.item.pk, body
+        )
+        self.assertIn('<input type="checkbox" name="field" value="age">', body)
+
+    def test_browse_row_cache(self):
+        class RowCacheBrowseView(BrowseView):
+            cache_rows = True
+            columns = [("Name", "name")]
+
+        caches["default"].clear()
+        self.bread.browse_view = RowCacheBrowseView
+        self.give_permission("browse")
+        self.assertIn("amy", self.get("browse"))
+        # Changes that don't send signals aren't noticed
+        self.model.objects.update(name="ann")
+        self.assertIn("amy", self.get("browse"))
+
+    def test_read(self):
+        self.give_permission("view")
+        self.give_permission("delete")
+        body = self.get("read", pk=self.item.pk)
+        self.assertIn("amy", body)
+        self.assertIn(self.bread.delete_url(self.item.pk), body)
+
+    def test_label_value_read(self):
+        class ReadView(LabelValueReadView):
+            fields = [("Name", "name"), ("Text", "other__text")]
+
+        self.bread.read_view = ReadView
+        self.give_permission("view")
+        body = self.get("read", pk=self.item.pk)
+        self.assertIn("<label>Name</label>: <span class='value'>amy</span>", body)
+
+    def test_edit(self):
+        self.give_permission("change")
+        body = self.get("edit", pk=self.item.pk)
+        self.assertIn('name="csrfmiddlewaretoken"', body)
+        self.assertIn('value="amy"', body)
+
+    def test_add_formset(self):
+        class FormsetAddView(AddView):
+            formset = True
+
+        self.bread.add_view = FormsetAddView
+        self.give_permission("add")
+        body = self.get("add")
+        self.assertIn('name="form-TOTAL_FORMS"', body)
+        self.assertIn('name="form-2-name"', body)
+        self.assertIn("<th>Name</th>", body)
+
+    def test_delete(self):
+        self.give_permission("delete")
+        body = self.get("delete", pk=self.item.pk)
+        self.assertIn("Really delete amy?", body)
+
+    def test_delete_progress(self):
+        class BackgroundDeleteView(DeleteView):
+            delete_in_background = True
+
+        self.bread.delete_view = BackgroundDeleteView
+        self.give_permission("delete")
+        self.item.other.model1 = self.item
+        self.item.other.save()
+        self.assertIn(
+            "<li>1 bread test model2s</li>", self.get("delete", pk=self.item.pk)
+        )
+        job = DeletionJob(self.model.objects.filter(pk=self.item.pk))
+        job.update_progress(status="running", deleted=1, total=2)
+        url = reverse(self.bread.get_url_name("delete"), kwargs={"pk": self.item.pk})
+        request = self.request_factory.get(url, {"job": job.id})
+        request.user = self.user
+        rsp = self.bread.get_delete_view()(request, pk=self.item.pk)
+        rsp.render()
+        self.assertIn("Deleted 1 of 2 records...", rsp.content.decode("utf-8"))
+
+    def test_import(self):
+        self.bread.views = "BREADI"
+        self.set_urls(self.bread)
+        clear_url_caches()
+        self.give_permission("add")
+        body = self.get("import")
+        self.assertIn('<input type="file" name="file"', body)
+        self.assertIn("fields: name, age, other", body)
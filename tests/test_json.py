@@ -0,0 +1,161 @@
+import json
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from bread.bread import BrowseView, LabelValueReadView
+
+from .base import BreadTestCase
+from .factories import BreadTestModelFactory
+
+
+class FieldsBrowseView(BrowseView):
+    columns = [("Name", "name"), ("Text", "other__text")]
+    paginate_by = 2
+
+
+class BreadJSONTest(BreadTestCase):
+    def setUp(self):
+        super(BreadJSONTest, self).setUp()
+        self.set_urls(self.bread)
+        self.items = [
+            BreadTestModelFactory(name=name, age=1, other__text=name.upper())
+            for name in ["amy", "bob", "cal"]
+        ]
+
+    def request(self, view_name, method="get", data=None, accept=None, **kwargs):
+        url = reverse(self.bread.get_url_name(view_name), kwargs=kwargs)
+        headers = {"HTTP_ACCEPT": accept} if accept else {}
+        request = getattr(self.request_factory, method)(url, data or {}, **headers)
+        request.user = self.user
+        view = getattr(self.bread, "get_%s_view" % view_name)()
+        return view(request, **kwargs)
+
+    def get_json(self, view_name, status=200, **kwargs):
+        rsp = self.request(view_name, **kwargs)
+        self.assertEqual(status, rsp.status_code)
+        self.assertEqual("application/json", rsp["Content-Type"])
+        self.assertIn("Accept", rsp["Vary"])
+        return json.loads(rsp.content)
+
+    def test_browse(self):
+        self.give_permission("browse")
+        data = self.get_json("browse", data={"format": "json"})
+        self.assertEqual(["Name", "Text", "Model1", "Roundabout Name"], data["columns"])
+        self.assertEqual([0, 1, 2], data["valid_sorting_columns"])
+        self.assertEqual(
+            {"pk": self.items[0].pk, "cells": ["amy", "AMY", None, "amy"]},
+            data["rows"][0],
+        )
+        self.assertEqual(3, len(data["rows"]))
+        self.assertNotIn("page", data)
+
+    def test_browse_values(self):
+        self.bread.browse_view = FieldsBrowseView
+        self.give_permission("browse")
+        with CaptureQueriesContext(connection) as queries:
+            data = self.get_json("browse", data={"format": "json", "o": "-0"})
+        self.assertEqual(
+            [
+                {"pk": self.items[2].pk, "cells": ["cal", "CAL"]},
+                {"pk": self.items[1].pk, "cells": ["bob", "BOB"]},
+            ],
+            data["rows"],
+        )
+        sql = [q["sql"] for q in queries if "tests_breadtestmodel" in q["sql"]][-1]
+        # Only the columns' fields were selected
+        self.assertNotIn('"tests_breadtestmodel"."age"', sql.split(" FROM ")[0])
+        self.assertEqual(1, data["page"]["number"])
+        self.assertEqual(2, data["page"]["num_pages"])
+        self.assertEqual(3, data["page"]["count"])
+        self.assertIn("page=2", data["page"]["last_url"])
+        self.assertIn("format=json", data["page"]["last_url"])
+        self.assertIsNone(data["page"]["previous_url"])
+
+    def test_accept_header(self):
+        self.give_permission("browse")
+        self.get_json("browse", accept="application/json")
+        rsp = self.request("browse", accept="text/html,application/json;q=0.9")
+        self.assertEqual("text/html; charset=utf-8", rsp["Content-Type"])
+        rsp = self.request("browse", accept="*/*")
+        self.assertEqual("text/html; charset=utf-8", rsp["Content-Type"])
+        rsp = self.request("browse", data={"format": "html"}, accept="application/json")
+        self.assertEqual("text/html; charset=utf-8", rsp["Content-Type"])
+
+    def test_read(self):
+        self.give_permission("view")
+        item = self.items[0]
+        data = self.get_json("read", accept="application/json", pk=item.pk)
+        self.assertEqual(item.pk, data["pk"])
+        fields = {field["name"]: field for field in data["fields"]}
+        self.assertEqual(
+            {"name": "name", "label": "Name", "value": "amy"}, fields["name"]
+        )
+        self.assertEqual(item.other.pk, fields["other"]["value"])
+        self.assertNotIn("errors", data)
+
+    def test_label_value_read(self):
+        class ReadView(LabelValueReadView):
+            fields = [("Name", "name"), ("Text", "other__text"), ("Answer", 42)]
+
+        self.bread.read_view = ReadView
+        self.give_permission("view")
+        item = self.items[0]
+        data = self.get_json("read", data={"format": "json"}, pk=item.pk)
+        self.assertEqual(
+            [
+                {"label": "Name", "value": "amy"},
+                {"label": "Text", "value": "other__text"},
+                {"label": "Answer", "value": "42"},
+            ],
+            data["fields"],
+        )
+
+    def test_edit_errors(self):
+        self.give_permission("change")
+        item = self.items[0]
+        data = self.get_json(
+            "edit",
+            status=400,
+            method="post",
+            data={"name": "this name is too long"},
+            accept="application/json",
+            pk=item.pk,
+        )
+        self.assertEqual(["age", "name"], sorted(data["errors"]))
+        self.assertEqual("max_length", data["errors"]["name"][0]["code"])
+
+    def test_edit(self):
+        self.give_permission("change")
+        item = self.items[0]
+        data = self.get_json(
+            "edit",
+            method="post",
+            data={"name": "ann", "age": 2},
+            accept="application/json",
+            pk=item.pk,
+        )
+        self.assertEqual({"pk": item.pk}, data)
+        item.refresh_from_db()
+        self.assertEqual("ann", item.name)
+
+    def test_add(self):
+        self.give_permission("add")
+        data = self.get_json(
+            "add",
+            status=201,
+            method="post",
+            data={"name": "dee", "age": 4},
+            accept="application/json",
+        )
+        self.assertEqual("dee", self.model.objects.get(pk=data["pk"]).name)
+
+    def test_delete(self):
+        self.give_permission("delete")
+        item = self.items[0]
+        data = self.get_json(
+            "delete", method="post", accept="application/json", pk=item.pk
+        )
+        self.assertEqual({"pk": item.pk}, data)
+        self.assertFalse(self.model.objects.filter(pk=item.pk).exists())
@@ -1,4 +1,9 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
 from django.http import Http404
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from bread.bread import BrowseView
@@ -98,3 +103,236 @@ class BreadPaginationTest(BreadTestCase):
         # We don't know what order the query parms will end up in
         expected_urls = [base_url + "?test=1&page=2", base_url + "?page=2&test=1"]
         self.assertIn(next_url, expected_urls)
+
+
+class BreadKeysetPaginationTest(BreadTestCase):
+    class BrowseTestView(BrowseView):
+        columns = [("Name", "name"), ("Age", "age")]
+        keyset_pagination = True
+        paginate_by = PAGE_SIZE
+
+    extra_bread_attributes = {"browse_view": BrowseTestView}
+
+    def setUp(self):
+        super(BreadKeysetPaginationTest, self).setUp()
+        # Some duplicate names and ages so the pk tiebreaker matters
+        for i in range(2 * PAGE_SIZE + 1):
+            self.model_factory(name="name%d" % (i % 3), age=i % 2)
+        self.set_urls(self.bread)
+        self.give_permission("browse")
+
+    def get_page(self, url):
+        request = self.request_factory.get(url)
+        request.user = self.user
+        rsp = self.bread.get_browse_view()(request)
+        self.assertEqual(200, rsp.status_code)
+        rsp.render()
+        return rsp.context_data
+
+    def test_walk_forward_and_back(self):
+        url = reverse(self.bread.get_url_name("browse")) + "?o=1,-0"
+        pages = []
+        while url:
+            context = self.get_page(url)
+            self.assertIsNone(context["paginator"])
+            pages.append(list(context["object_list"]))
+            url = context.get("next_url")
+        self.assertEqual([PAGE_SIZE, PAGE_SIZE, 1], [len(page) for page in pages])
+        expected = list(self.model.objects.order_by("age", "-name", "pk"))
+        self.assertEqual(expected, sum(pages, []))
+
+        # Now go back from the last page
+        url = context["previous_url"]
+        context = self.get_page(url)
+        self.assertEqual(pages[1], list(context["object_list"]))
+        self.assertIn("next_url", context)
+        self.assertEqual(
+            pages[0], list(self.get_page(context["previous_url"])["object_list"])
+        )
+
+    def test_first_page(self):
+        context = self.get_page(reverse(self.bread.get_url_name("browse")))
+        self.assertEqual(
+            list(self.model.objects.all()[:PAGE_SIZE]), list(context["object_list"])
+        )
+        self.assertNotIn("previous_url", context)
+        self.assertNotIn("first_url", context)
+        self.assertIn("next_url", context)
+
+    def test_query_count_does_not_depend_on_depth(self):
+        url = reverse(self.bread.get_url_name("browse"))
+        self.get_page(url)  # warm up
+        with CaptureQueriesContext(connection) as first_page_queries:
+            context = self.get_page(url)
+        third_page_url = self.get_page(context["next_url"])["next_url"]
+        with CaptureQueriesContext(connection) as next_page_queries:
+            self.get_page(third_page_url)
+        self.assertEqual(len(first_page_queries), len(next_page_queries))
+        self.assertNotIn("OFFSET", next_page_queries[-1]["sql"])
+
+    def test_cursor_for_other_ordering_starts_over(self):
+        url = reverse(self.bread.get_url_name("browse"))
+        next_url = self.get_page(url)["next_url"]
+        context = self.get_page(next_url + "&o=1")
+        self.assertEqual(
+            list(self.model.objects.order_by("age", "name", "-age", "pk")[:PAGE_SIZE]),
+            list(context["object_list"]),
+        )
+
+    def test_invalid_cursor(self):
+        url = reverse(self.bread.get_url_name("browse")) + "?cursor=nonsense"
+        request = self.request_factory.get(url)
+        request.user = self.user
+        rsp = self.bread.get_browse_view()(request)
+        self.assertEqual(400, rsp.status_code)
+
+
+class BreadKeysetPaginationNullTest(BreadTestCase):
+    class BrowseTestView(BrowseView):
+        columns = [("Name", "name"), ("Text", "other__text")]
+        keyset_pagination = True
+        paginate_by = 2
+
+    extra_bread_attributes = {"browse_view": BrowseTestView}
+
+    def setUp(self):
+        super(BreadKeysetPaginationNullTest, self).setUp()
+        for i in range(3):
+            self.model_factory(name="with%d" % i, other__text="text%d" % (i % 2))
+            self.model_factory(name="without%d" % i, other=None)
+        self.set_urls(self.bread)
+        self.give_permission("browse")
+
+    def walk(self, query):
+        url = reverse(self.bread.get_url_name("browse")) + query
+        pages = []
+        while url:
+            request = self.request_factory.get(url)
+            request.user = self.user
+            rsp = self.bread.get_browse_view()(request)
+            self.assertEqual(200, rsp.status_code)
+            pages.append(list(rsp.context_data["object_list"]))
+            url = rsp.context_data.get("next_url")
+        # And back again from the last page
+        url = rsp.context_data.get("previous_url")
+        for page in reversed(pages[:-1]):
+            request = self.request_factory.get(url)
+            request.user = self.user
+            rsp = self.bread.get_browse_view()(request)
+            self.assertEqual(page, list(rsp.context_data["object_list"]))
+            url = rsp.context_data.get("previous_url")
+        return sum(pages, [])
+
+    def test_nulls_last(self):
+        names = [obj.name for obj in self.walk("?o=1")]
+        # Every row, with those without text after those with it
+        self.assertEqual(6, len(names))
+        self.assertEqual(["with0", "with2", "with1"], names[:3])
+        self.assertEqual({"without0", "without1", "without2"}, set(names[3:]))
+
+    def test_nulls_first_descending(self):
+        names = [obj.name for obj in self.walk("?o=-1")]
+        self.assertEqual({"without0", "without1", "without2"}, set(names[:3]))
+        self.assertEqual(["with1", "with0", "with2"], names[3:])
+
+
+class BreadCountStrategyTestMixin(object):
+    def setUp(self):
+        super(BreadCountStrategyTestMixin, self).setUp()
+        cache.clear()
+        [self.model_factory() for __ in range(2 * PAGE_SIZE + 1)]
+        self.set_urls(self.bread)
+        self.give_permission("browse")
+
+    def get_page(self, query=""):
+        url = reverse(self.bread.get_url_name("browse")) + query
+        request = self.request_factory.get(url)
+        request.user = self.user
+        with CaptureQueriesContext(connection) as queries:
+            rsp = self.bread.get_browse_view()(request)
+            self.assertEqual(200, rsp.status_code)
+            rsp.render()
+        count_queries = [q for q in queries if "COUNT(" in q["sql"]]
+        return rsp, len(count_queries)
+
+
+class BreadNoCountPaginationTest(BreadCountStrategyTestMixin, BreadTestCase):
+    class BrowseTestView(BrowseView):
+        count_strategy = "none"
+        paginate_by = PAGE_SIZE
+
+    extra_bread_attributes = {"browse_view": BrowseTestView}
+
+    def test_pages(self):
+        ordered_items = list(self.model.objects.all())
+        rsp, num_counts = self.get_page()
+        self.assertEqual(0, num_counts)
+        context = rsp.context_data
+        self.assertEqual(ordered_items[:PAGE_SIZE], list(context["object_list"]))
+        self.assertIn("next_url", context)
+        self.assertNotIn("last_url", context)
+        self.assertIn("Showing page 1\n", rsp.content.decode("utf-8"))
+
+        rsp, num_counts = self.get_page("?page=3")
+        context = rsp.context_data
+        last_page_start = 2 * PAGE_SIZE
+        self.assertEqual(ordered_items[last_page_start:], list(context["object_list"]))
+        self.assertNotIn("next_url", context)
+        self.assertIn("previous_url", context)
+
+    def test_get_page_past_the_end(self):
+        url = reverse(self.bread.get_url_name("browse")) + "?page=4"
+        request = self.request_factory.get(url)
+        request.user = self.user
+        with self.assertRaises(Http404):
+            self.bread.get_browse_view()(request)
+
+
+class BreadCachedCountPaginationTest(BreadCountStrategyTestMixin, BreadTestCase):
+    class BrowseTestView(BrowseView):
+        columns = [("Name", "name")]
+        count_strategy = "cached"
+        paginate_by = PAGE_SIZE
+
+    extra_bread_attributes = {"browse_view": BrowseTestView}
+
+    def test_count_is_cached(self):
+        rsp, num_counts = self.get_page()
+        self.assertEqual(1, num_counts)
+        self.assertEqual(3, rsp.context_data["paginator"].num_pages)
+        rsp, num_counts = self.get_page("?page=2")
+        self.assertEqual(0, num_counts)
+        self.assertEqual(3, rsp.context_data["paginator"].num_pages)
+        self.assertIn("last_url", rsp.context_data)
+
+    def test_cached_per_query(self):
+        self.get_page()
+        rsp, num_counts = self.get_page("?o=-0")
+        self.assertEqual(1, num_counts)
+
+
+class BreadEstimatedCountPaginationTest(BreadCountStrategyTestMixin, BreadTestCase):
+    class BrowseTestView(BrowseView):
+        count_strategy = "estimated"
+        paginate_by = PAGE_SIZE
+
+    extra_bread_attributes = {"browse_view": BrowseTestView}
+
+    def test_falls_back_to_exact_count(self):
+        # SQLite can't estimate
+        rsp, num_counts = self.get_page()
+        self.assertEqual(1, num_counts)
+        self.assertFalse(rsp.context_data["count_is_estimate"])
+        self.assertEqual(3, rsp.context_data["paginator"].num_pages)
+        self.assertIn("Showing page 1 of 3", rsp.content.decode("utf-8"))
+
+    @patch("bread.pagination.estimate_count", return_value=7)
+    def test_estimate(self, mock_estimate_count):
+        rsp, num_counts = self.get_page("?page=2")
+        self.assertEqual(0, num_counts)
+        context = rsp.context_data
+        self.assertTrue(context["count_is_estimate"])
+        self.assertIn("Showing page 2 of about 2", rsp.content.decode("utf-8"))
+        # We still know there's another page, and can't know which is last
+        self.assertIn("next_url", context)
+        self.assertNotIn("last_url", context)
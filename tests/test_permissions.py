@@ -1,10 +1,17 @@
+from django.apps import apps
 from django.conf import settings
 from django.contrib.auth import REDIRECT_FIELD_NAME
-from django.contrib.auth.models import AnonymousUser
-from django.core.exceptions import PermissionDenied
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.models import AnonymousUser, Permission
+from django.core.exceptions import ImproperlyConfigured, PermissionDenied
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models.signals import post_migrate
 from django.test import override_settings
 from django.urls import reverse
 
+from bread.bread import BrowseView, clear_permission_cache
+from bread.permissions import BulkPermissionResolver, PermissionResolver
+
 from .base import BreadTestCase
 
 
@@ -93,3 +100,210 @@ class BreadDeletePermissionTest(BreadPermissionTestMixin, BreadTestCase):
     view_name = "read"
     expects_pk = True
     include_post = True
+
+
+class PermissionExistsTest(BreadTestCase):
+    def setUp(self):
+        super(PermissionExistsTest, self).setUp()
+        clear_permission_cache()
+        self.give_permission("browse")
+        self.view = BrowseView(bread=self.bread, model=self.model)
+
+    def tearDown(self):
+        super(PermissionExistsTest, self).tearDown()
+        clear_permission_cache()
+
+    def test_only_checked_once(self):
+        with self.assertNumQueries(1):
+            self.view.check_permission_exists()
+        with self.assertNumQueries(0):
+            self.view.check_permission_exists()
+            BrowseView(bread=self.bread, model=self.model).check_permission_exists()
+
+    def test_request_does_not_check_again(self):
+        self.view.check_permission_exists()
+        request = self.request_factory.get("")
+        request.user = self.user
+        # Load the user's permissions
+        self.user.has_perm("tests.browse_breadtestmodel")
+        with self.assertNumQueries(0):
+            rsp = self.bread.get_browse_view()(request)
+        self.assertEqual(200, rsp.status_code)
+
+    def test_missing_permission(self):
+        self.get_permission("browse").delete()
+        with self.assertRaises(ImproperlyConfigured):
+            self.view.check_permission_exists()
+
+    def test_cleared_after_migrating(self):
+        self.view.check_permission_exists()
+        Permission.objects.filter(codename="browse_breadtestmodel").delete()
+        post_migrate.send(
+            sender=apps.get_app_config("bread"),
+            app_config=apps.get_app_config("bread"),
+            verbosity=0,
+            interactive=False,
+            using=DEFAULT_DB_ALIAS,
+            apps=apps,
+            plan=[],
+        )
+        with self.assertRaises(ImproperlyConfigured):
+            self.view.check_permission_exists()
+
+
+class CountingBackend(ModelBackend):
+    calls = 0
+    perms_asked = []
+
+    def has_perm(self, user_obj, perm, obj=None):
+        CountingBackend.calls += 1
+        CountingBackend.perms_asked.append(perm)
+        return super(CountingBackend, self).has_perm(user_obj, perm, obj)
+
+    def get_all_permissions(self, user_obj, obj=None):
+        CountingBackend.calls += 1
+        return super(CountingBackend, self).get_all_permissions(user_obj, obj)
+
+
+class HasPermOnlyBackend(object):
+    """A backend like django-rules', which only implements has_perm()"""
+
+    def authenticate(self, request, **credentials):
+        return None
+
+    def has_perm(self, user_obj, perm, obj=None):
+        return perm == "tests.browse_breadtestmodel"
+
+
+@override_settings(AUTHENTICATION_BACKENDS=["tests.test_permissions.CountingBackend"])
+class PermissionResolverTest(BreadTestCase):
+    def setUp(self):
+        super(PermissionResolverTest, self).setUp()
+        self.give_permission("browse")
+        self.give_permission("read")
+        self.give_permission("view")
+        CountingBackend.calls = 0
+        CountingBackend.perms_asked = []
+        self.request = self.request_factory.get("")
+        self.request.user = self.user
+
+    def test_each_perm_asked_once_per_request(self):
+        rsp = self.bread.get_browse_view()(self.request)
+        self.assertEqual(200, rsp.status_code)
+        self.assertTrue(rsp.context_data["may_browse"])
+        self.assertTrue(rsp.context_data["may_read"])
+        self.assertFalse(rsp.context_data["may_edit"])
+        self.assertFalse(rsp.context_data["may_add"])
+        self.assertFalse(rsp.context_data["may_delete"])
+        asked = CountingBackend.perms_asked
+        self.assertIn("tests.browse_breadtestmodel", asked)
+        self.assertEqual(len(set(asked)), len(asked))
+        resolver = PermissionResolver.for_request(self.request)
+        self.assertEqual(len(asked), resolver.lookup_count)
+
+        # Other views for the same request only ask about what's new
+        item = self.model_factory()
+        rsp = self.bread.get_read_view()(self.request, pk=item.pk)
+        self.assertEqual(200, rsp.status_code)
+        self.assertIn("tests.view_breadtestmodel", asked)
+        self.assertEqual(len(set(asked)), len(asked))
+
+    def test_superuser(self):
+        self.user.is_superuser = True
+        rsp = self.bread.get_browse_view()(self.request)
+        self.assertEqual(200, rsp.status_code)
+        self.assertTrue(rsp.context_data["may_delete"])
+        self.assertEqual(0, CountingBackend.calls)
+
+    def test_user_without_superuser_flag(self):
+        # Custom users don't need PermissionsMixin's attributes
+        class MinimalUser(object):
+            is_active = True
+
+            def has_perm(self, perm, obj=None):
+                return perm == "tests.browse_breadtestmodel"
+
+        resolver = PermissionResolver(MinimalUser())
+        self.assertEqual(
+            {"tests.browse_breadtestmodel": True, "tests.add_breadtestmodel": False},
+            resolver.has_perms(
+                ["tests.browse_breadtestmodel", "tests.add_breadtestmodel"]
+            ),
+        )
+
+    def test_object_permissions(self):
+        item = self.model_factory()
+        resolver = PermissionResolver.for_request(self.request)
+        self.assertEqual(
+            {"tests.browse_breadtestmodel": False},
+            # ModelBackend doesn't do object permissions
+            resolver.has_perms(["tests.browse_breadtestmodel"], obj=item),
+        )
+        resolver.has_perm("tests.browse_breadtestmodel", obj=item)
+        self.assertEqual(1, resolver.lookup_count)
+        self.assertTrue(resolver.has_perm("tests.browse_breadtestmodel"))
+        self.assertEqual(2, resolver.lookup_count)
+
+    @override_settings(
+        AUTHENTICATION_BACKENDS=["tests.test_permissions.HasPermOnlyBackend"]
+    )
+    def test_has_perm_only_backend(self):
+        rsp = self.bread.get_browse_view()(self.request)
+        self.assertEqual(200, rsp.status_code)
+        self.assertTrue(rsp.context_data["may_browse"])
+        self.assertFalse(rsp.context_data["may_read"])
+
+
+@override_settings(AUTHENTICATION_BACKENDS=["tests.test_permissions.CountingBackend"])
+class BulkPermissionResolverTest(BreadTestCase):
+    extra_bread_attributes = {"permission_resolver_class": BulkPermissionResolver}
+
+    def setUp(self):
+        super(BulkPermissionResolverTest, self).setUp()
+        self.give_permission("browse")
+        self.give_permission("read")
+        self.give_permission("view")
+        CountingBackend.calls = 0
+        self.request = self.request_factory.get("")
+        self.request.user = self.user
+
+    def test_one_lookup_per_request(self):
+        rsp = self.bread.get_browse_view()(self.request)
+        self.assertEqual(200, rsp.status_code)
+        self.assertTrue(rsp.context_data["may_browse"])
+        self.assertTrue(rsp.context_data["may_read"])
+        self.assertFalse(rsp.context_data["may_edit"])
+        self.assertFalse(rsp.context_data["may_add"])
+        self.assertFalse(rsp.context_data["may_delete"])
+        self.assertEqual(1, CountingBackend.calls)
+        resolver = BulkPermissionResolver.for_request(self.request)
+        self.assertEqual(1, resolver.lookup_count)
+
+        # Other views for the same request don't ask again
+        item = self.model_factory()
+        rsp = self.bread.get_read_view()(self.request, pk=item.pk)
+        self.assertEqual(200, rsp.status_code)
+        self.assertEqual(1, CountingBackend.calls)
+
+    def test_object_permissions(self):
+        item = self.model_factory()
+        resolver = BulkPermissionResolver.for_request(self.request)
+        self.assertEqual(
+            {"tests.browse_breadtestmodel": False},
+            # ModelBackend doesn't do object permissions
+            resolver.has_perms(["tests.browse_breadtestmodel"], obj=item),
+        )
+        resolver.has_perm("tests.read_breadtestmodel", obj=item)
+        self.assertEqual(1, resolver.lookup_count)
+
+    def test_custom_resolver(self):
+        class BrowseAndDeleteResolver(BulkPermissionResolver):
+            def lookup_permissions(self, obj=None):
+                return {"tests.browse_breadtestmodel", "tests.delete_breadtestmodel"}
+
+        self.bread.permission_resolver_class = BrowseAndDeleteResolver
+        rsp = self.bread.get_browse_view()(self.request)
+        self.assertEqual(200, rsp.status_code)
+        self.assertFalse(rsp.context_data["may_read"])
+        self.assertTrue(rsp.context_data["may_delete"])
+        self.assertEqual(0, CountingBackend.calls)
@@ -1,3 +1,6 @@
+from datetime import timedelta
+from unittest.mock import patch
+
 from django import forms
 from django.http import Http404
 from django.urls import reverse
@@ -5,8 +8,8 @@ from django.urls import reverse
 from bread.bread import Bread, LabelValueReadView, ReadView
 
 from .base import BreadTestCase
-from .factories import BreadLabelValueTestModelFactory
-from .models import BreadLabelValueTestModel, BreadTestModel
+from .factories import BreadLabelValueTestModelFactory, BreadVersionedTestModelFactory
+from .models import BreadLabelValueTestModel, BreadTestModel, BreadVersionedTestModel
 
 
 class BreadReadTest(BreadTestCase):
@@ -144,3 +147,78 @@ class BreadLabelValueReadTest(BreadTestCase):
         # Call the view function to invoke dispatch so we can get to the view itself
         view_function(None, None, None)
         self.assertEqual(DummyForm, glob["view_object"].form_class)
+
+
+class ConditionalReadView(ReadView):
+    etag_field = "version"
+    last_modified_field = "modified"
+
+
+class BreadConditionalReadTest(BreadTestCase):
+    def setUp(self):
+        super(BreadConditionalReadTest, self).setUp()
+        self.model = BreadVersionedTestModel
+        self.model_name = self.model._meta.model_name
+
+        class ConditionalBread(Bread):
+            base_template = "bread/empty.html"
+            model = BreadVersionedTestModel
+            read_view = ConditionalReadView
+
+        self.bread = ConditionalBread()
+        self.set_urls(self.bread)
+        self.give_permission("view")
+        self.item = BreadVersionedTestModelFactory(name="Amy")
+
+    def get(self, **extra):
+        request = self.request_factory.get("", **extra)
+        request.user = self.user
+        rsp = self.bread.get_read_view()(request, pk=self.item.pk)
+        if hasattr(rsp, "render"):
+            rsp.render()
+        return rsp
+
+    def test_etag(self):
+        rsp = self.get()
+        self.assertEqual(200, rsp.status_code)
+        etag = rsp.headers["ETag"]
+        rsp = self.get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(304, rsp.status_code)
+        self.assertEqual(b"", rsp.content)
+
+        self.item.version += 1
+        self.item.save()
+        rsp = self.get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(200, rsp.status_code)
+        self.assertNotEqual(etag, rsp.headers["ETag"])
+
+    def test_last_modified(self):
+        rsp = self.get()
+        last_modified = rsp.headers["Last-Modified"]
+        self.assertEqual(
+            304, self.get(HTTP_IF_MODIFIED_SINCE=last_modified).status_code
+        )
+        BreadVersionedTestModel.objects.filter(pk=self.item.pk).update(
+            modified=self.item.modified + timedelta(seconds=1)
+        )
+        self.assertEqual(
+            200, self.get(HTTP_IF_MODIFIED_SINCE=last_modified).status_code
+        )
+
+    def test_not_rendered(self):
+        etag = self.get().headers["ETag"]
+        with patch.object(ConditionalReadView, "get_context_data") as mock_context:
+            self.assertEqual(304, self.get(HTTP_IF_NONE_MATCH=etag).status_code)
+        mock_context.assert_not_called()
+
+    def test_etag_depends_on_user(self):
+        etag = self.get().headers["ETag"]
+        self.user = type(self.user).objects.create_user(username="jim")
+        self.user.user_permissions.add(self.get_permission("view"))
+        self.assertEqual(200, self.get(HTTP_IF_NONE_MATCH=etag).status_code)
+
+    def test_no_fields(self):
+        self.bread.read_view = ReadView
+        rsp = self.get()
+        self.assertEqual(200, rsp.status_code)
+        self.assertFalse(rsp.has_header("ETag"))
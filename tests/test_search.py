@@ -1,8 +1,15 @@
 # coding: utf-8
+from unittest import skipUnless
+from unittest.mock import patch
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 from bread.bread import Bread, BrowseView
+from bread.search import SQLiteFTS5SearchBackend
 from tests.base import BreadTestCase
-from tests.factories import BreadTestModelFactory
-from tests.models import BreadTestModel
+from tests.factories import BreadTestModel2Factory, BreadTestModelFactory
+from tests.models import BreadTestModel, BreadTestModel2
 
 
 class BrowseSearchView(BrowseView):
@@ -79,6 +86,13 @@ class BreadSearchTestCase(BreadTestCase):
         obj_ids = [obj.id for obj in objs]
         self.assertEqual([self.joe.id], obj_ids)
 
+    def test_lookups_worked_out_once(self):
+        # Creating the Bread has already worked out the search lookups
+        with patch("bread.search.lookup_spawns_duplicates") as mock_spawns:
+            objs = self.get_search_results(q="Smith")
+        self.assertEqual([self.joe], list(objs))
+        mock_spawns.assert_not_called()
+
     def test_nonascii_search(self):
         # This was failing if we were also paginating
         BreadTestModelFactory(name="قمر")
@@ -88,3 +102,154 @@ class BreadSearchTestCase(BreadTestCase):
             self.get_search_results(q="قمر")
         finally:
             self.bread.browse_view.paginate_by = None
+
+
+def setUpModule():
+    # SQLite can't create a virtual table inside the transaction of a TestCase
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "CREATE VIRTUAL TABLE tests_breadtestmodel_fts USING fts5(name, text)"
+        )
+
+
+def tearDownModule():
+    with connection.cursor() as cursor:
+        cursor.execute("DROP TABLE tests_breadtestmodel_fts")
+
+
+class BrowseFTS5SearchView(BrowseView):
+    columns = [("Name", "name")]
+    search_fields = ["name", "other__text"]
+    search_backend = SQLiteFTS5SearchBackend(table="tests_breadtestmodel_fts")
+
+
+class BreadFTS5SearchView(BreadSearchView):
+    browse_view = BrowseFTS5SearchView
+
+
+class BreadFTS5SearchTestCase(BreadTestCase):
+    def setUp(self):
+        super(BreadFTS5SearchTestCase, self).setUp()
+        self.bread = BreadFTS5SearchView()
+        self.give_permission("browse")
+        self.joe = BreadTestModelFactory(name="Joe", other__text="Smith")
+        self.jim = BreadTestModelFactory(name="Jim", other__text="Brown")
+        self.jon = BreadTestModelFactory(name="Jonathan Joe", other__text="Smith")
+        with connection.cursor() as cursor:
+            # The virtual table isn't emptied when each test's transaction
+            # is rolled back, so start from scratch
+            cursor.execute("DELETE FROM tests_breadtestmodel_fts")
+            for obj in BreadTestModel.objects.all():
+                cursor.execute(
+                    "INSERT INTO tests_breadtestmodel_fts(rowid, name, text) "
+                    "VALUES (%s, %s, %s)",
+                    [obj.pk, obj.name, obj.other.text],
+                )
+
+    def get_search_results(self, **data):
+        request = self.request_factory.get("", data=data)
+        request.user = self.user
+        rsp = self.bread.get_browse_view()(request)
+        self.assertEqual(200, rsp.status_code)
+        return list(rsp.context_data["object_list"])
+
+    def test_matches_words(self):
+        self.assertEqual([], self.get_search_results(q="i"))
+        self.assertEqual([self.jim], self.get_search_results(q="Brown jim"))
+
+    def test_prefix_and_ranking(self):
+        # Jonathan Joe matches 'jo*' twice, so comes first
+        self.assertEqual([self.jon, self.joe], self.get_search_results(q="jo"))
+
+    def test_user_sort_overrides_rank(self):
+        self.assertEqual([self.joe, self.jon], self.get_search_results(q="jo", o="0"))
+
+    def test_query_syntax_is_not_interpreted(self):
+        self.assertEqual([], self.get_search_results(q='Joe" OR "Jim'))
+
+    def test_limit(self):
+        class LimitedSearchView(BrowseFTS5SearchView):
+            search_backend = SQLiteFTS5SearchBackend(
+                table="tests_breadtestmodel_fts", limit=1
+            )
+
+        self.bread.browse_view = LimitedSearchView
+        self.assertEqual([self.jon], self.get_search_results(q="jo"))
+
+
+class BrowseExistsSearchView(BrowseView):
+    columns = [("Text", "text")]
+    search_fields = ["text", "breadtestmodel__name"]
+    search_use_exists = True
+
+
+class BrowseDistinctSearchView(BrowseExistsSearchView):
+    search_use_exists = False
+
+
+class BreadExistsSearchView(Bread):
+    base_template = "bread/empty.html"
+    browse_view = BrowseExistsSearchView
+    model = BreadTestModel2
+    views = "B"
+
+
+class BreadExistsSearchTestCase(BreadTestCase):
+    def setUp(self):
+        super(BreadExistsSearchTestCase, self).setUp()
+        self.model = BreadTestModel2
+        self.model_name = self.model._meta.model_name
+        self.bread = BreadExistsSearchView()
+        self.give_permission("browse")
+        self.smith = BreadTestModel2Factory(text="Smith")
+        self.brown = BreadTestModel2Factory(text="Brown")
+        # Two records of the same BreadTestModel2 match 'jo'
+        BreadTestModelFactory(name="Joe", other=self.smith)
+        BreadTestModelFactory(name="John", other=self.smith)
+        BreadTestModelFactory(name="Jim", other=self.brown)
+
+    def get_search_response(self, browse_view, q):
+        self.bread.browse_view = browse_view
+        request = self.request_factory.get("", data={"q": q})
+        request.user = self.user
+        rsp = self.bread.get_browse_view()(request)
+        self.assertEqual(200, rsp.status_code)
+        return rsp
+
+    def test_results_match_distinct_search(self):
+        for q in ["jo", "smith", "jo smith", "jim", "brown jo", "nobody"]:
+            with self.subTest(q=q):
+                exists = self.get_search_response(BrowseExistsSearchView, q)
+                distinct = self.get_search_response(BrowseDistinctSearchView, q)
+                self.assertEqual(
+                    list(distinct.context_data["object_list"]),
+                    list(exists.context_data["object_list"]),
+                )
+        rsp = self.get_search_response(BrowseExistsSearchView, "jo")
+        self.assertEqual([self.smith], list(rsp.context_data["object_list"]))
+
+    def test_no_distinct(self):
+        self.get_search_response(BrowseExistsSearchView, "jo").render()  # warm up
+        with CaptureQueriesContext(connection) as queries:
+            self.get_search_response(BrowseExistsSearchView, "jo").render()
+        sql = [
+            query["sql"]
+            for query in queries
+            if 'FROM "tests_breadtestmodel2"' in query["sql"]
+        ]
+        self.assertEqual(1, len(sql))
+        self.assertNotIn("DISTINCT", sql[0])
+        self.assertIn("EXISTS", sql[0])
+
+    @skipUnless(connection.vendor == "sqlite", "Checks SQLite query plans")
+    def test_explain(self):
+        rsp = self.get_search_response(BrowseDistinctSearchView, "jo")
+        plan = rsp.context_data["object_list"].explain()
+        self.assertIn("LEFT-JOIN", plan)
+
+        # The related table is only searched in a subquery, not joined
+        rsp = self.get_search_response(BrowseExistsSearchView, "jo")
+        plan = rsp.context_data["object_list"].explain()
+        self.assertNotIn("JOIN", plan)
+        self.assertNotIn("DISTINCT", plan)
+        self.assertIn("CORRELATED SCALAR SUBQUERY", plan)
@@ -1,3 +1,11 @@
+from unittest.mock import patch
+
+from django.conf.urls.i18n import i18n_patterns
+from django.template import Context, Template
+from django.test import override_settings
+from django.urls import include, path, reverse, set_script_prefix
+from django.utils import translation
+
 from .base import BreadTestCase
 
 
@@ -169,3 +177,85 @@ class BreadURLsTest(BreadTestCase):
             0
         ].pattern
         self.assertEqual("<int:pk>/edit/", str(edit_pattern))
+
+
+class BreadGetURLTest(BreadTestCase):
+    def setUp(self):
+        super(BreadGetURLTest, self).setUp()
+        self.set_urls(self.bread)
+
+    def test_same_as_reverse(self):
+        bread = self.bread
+        self.assertEqual(reverse(bread.browse_url_name()), bread.get_url("browse"))
+        self.assertEqual(reverse(bread.add_url_name()), bread.get_url("add"))
+        for pk in [1, 23]:
+            self.assertEqual(
+                reverse(bread.read_url_name(), args=[pk]), bread.read_url(pk)
+            )
+            self.assertEqual(
+                reverse(bread.edit_url_name(), args=[pk]), bread.edit_url(pk)
+            )
+            self.assertEqual(
+                reverse(bread.delete_url_name(), args=[pk]), bread.delete_url(pk)
+            )
+
+    def test_only_reversed_once(self):
+        self.bread.read_url(1)
+        with patch("bread.bread.reverse") as mock_reverse:
+            self.assertEqual("/testmodels/2/", self.bread.read_url(2))
+        mock_reverse.assert_not_called()
+
+    def test_script_prefix(self):
+        self.bread.read_url(1)
+        set_script_prefix("/prefix/")
+        self.addCleanup(set_script_prefix, "/")
+        self.assertEqual("/prefix/testmodels/2/", self.bread.read_url(2))
+
+    def test_template_tag(self):
+        template = Template('{% load bread_tags %}{% bread_url "edit" pk %}')
+        self.assertEqual(
+            "/testmodels/3/edit/",
+            template.render(Context({"bread": self.bread, "pk": 3})),
+        )
+
+
+class CustomURLConf(object):
+    urlpatterns = []
+
+
+class BreadGetURLCustomURLConfTest(BreadTestCase):
+    def test_language_prefix(self):
+        CustomURLConf.urlpatterns = i18n_patterns(*self.bread.get_urls())
+        with override_settings(ROOT_URLCONF=CustomURLConf):
+            with translation.override("en"):
+                self.assertEqual("/en/testmodels/4/", self.bread.read_url(4))
+            with translation.override("fr"):
+                self.assertEqual("/fr/testmodels/4/", self.bread.read_url(4))
+
+    def test_non_integer_pk(self):
+        CustomURLConf.urlpatterns = [
+            path(
+                "testmodels/<uuid:pk>/",
+                self.bread.get_read_view(),
+                name=self.bread.read_url_name(),
+            )
+        ]
+        pk = "4b4e2a0c-8f5e-4d47-9d3c-2f1b6a7c8e90"
+        with override_settings(ROOT_URLCONF=CustomURLConf):
+            self.assertEqual("/testmodels/%s/" % pk, self.bread.read_url(pk))
+
+
+class NamespacedURLConf(object):
+    urlpatterns = []
+
+
+class BreadGetURLNamespaceTest(BreadTestCase):
+    url_namespace = "testns"
+
+    def test_namespace_and_include(self):
+        NamespacedURLConf.urlpatterns = [
+            path("app/", include((self.bread.get_urls(), "testns"), namespace="testns"))
+        ]
+        with override_settings(ROOT_URLCONF=NamespacedURLConf):
+            self.assertEqual("/app/testmodels/4/", self.bread.read_url(4))
+            self.assertEqual("/app/testmodels/", self.bread.get_url("browse"))
@@ -1,8 +1,14 @@
 from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.test import TestCase
 
+from bread.templatetags.bread_tags import getter
 from bread.utils import (
+    Accessor,
+    get_accessor,
     get_model_field,
+    get_only_fields,
+    get_related_lookups,
+    get_related_models,
     get_verbose_name,
     has_required_args,
     validate_fieldspec,
@@ -108,6 +114,55 @@ class GetModelFieldTestCase(TestCase):
         self.assertEqual(obj2.text, get_model_field(obj3, "model2__text"))
 
 
+class AccessorTestCase(TestCase):
+    def setUp(self):
+        self.label_model = BreadLabelValueTestModel(name="label")
+        self.other = BreadTestModel2(text="other", label_model=self.label_model)
+        self.obj = BreadTestModel(name="foo", age=3, other=self.other)
+
+    def test_same_values_as_get_model_field(self):
+        for spec in [
+            "name",
+            "get_name",
+            "__str__",
+            "other__text",
+            "other__get_text",
+            "other__label_model__name_reversed",
+        ]:
+            self.assertEqual(
+                get_model_field(self.obj, spec), Accessor(spec)(self.obj), spec
+            )
+
+    def test_with_model(self):
+        accessor = Accessor("other__label_model__name_reversed", BreadTestModel)
+        self.assertEqual(
+            [("other", False), ("label_model", False), ("name_reversed", True)],
+            accessor.steps,
+        )
+        self.assertEqual("lebal", accessor(self.obj))
+
+    def test_none_along_the_way(self):
+        self.obj.other = None
+        self.assertIsNone(Accessor("other__label_model__name")(self.obj))
+        self.assertIsNone(Accessor("name")(None))
+
+    def test_no_such_attribute(self):
+        with self.assertRaises(AttributeError):
+            Accessor("other__nonesuch")(self.obj)
+
+    def test_getter_bad_spec(self):
+        # Logged, like other errors getting the value
+        for spec in [5, ["name"]]:
+            with self.assertLogs("bread.templatetags.bread_tags", "ERROR"):
+                self.assertIsNone(getter(self.obj, spec))
+
+    def test_compiled_once(self):
+        self.assertIs(get_accessor("other__text"), get_accessor("other__text"))
+        self.assertIsNot(
+            get_accessor("other__text"), get_accessor("other__text", BreadTestModel)
+        )
+
+
 class ValidateFieldspecTestCase(TestCase):
     def test_simple_field(self):
         validate_fieldspec(BreadTestModel, "name")
@@ -143,6 +198,77 @@ class ValidateFieldspecTestCase(TestCase):
         validate_fieldspec(BreadLabelValueTestModel, "model2__text")
 
 
+class GetRelatedLookupsTestCase(TestCase):
+    def test_simple_fields(self):
+        self.assertEqual(
+            ([], []), get_related_lookups(BreadTestModel, ["name", "get_name"])
+        )
+
+    def test_forward_foreign_key(self):
+        self.assertEqual(
+            (["other"], []),
+            get_related_lookups(BreadTestModel, ["other", "other__text"]),
+        )
+
+    def test_nested_and_method_on_other(self):
+        self.assertEqual(
+            (["other__label_model", "other"], []),
+            get_related_lookups(
+                BreadTestModel, ["other__label_model__name", "other__get_text"]
+            ),
+        )
+
+    def test_reverse_one_to_one_rel(self):
+        self.assertEqual(
+            (["model2"], []),
+            get_related_lookups(BreadLabelValueTestModel, ["model2__text"]),
+        )
+
+    def test_reverse_foreign_key(self):
+        self.assertEqual(
+            ([], ["breadtestmodel_set"]),
+            get_related_lookups(BreadTestModel2, ["breadtestmodel"]),
+        )
+
+
+class GetOnlyFieldsTestCase(TestCase):
+    def test_simple_fields(self):
+        self.assertEqual(
+            ["name", "age"], get_only_fields(BreadTestModel, ["name", "age"])
+        )
+
+    def test_field_on_other(self):
+        self.assertEqual(
+            ["other__text"], get_only_fields(BreadTestModel, ["other__text"])
+        )
+
+    def test_other_itself(self):
+        self.assertEqual(
+            ["other__id", "other__text", "other__label_model", "other__model1"],
+            get_only_fields(BreadTestModel, ["other"]),
+        )
+
+    def test_method_on_other(self):
+        self.assertEqual(
+            ["other__id", "other__text", "other__label_model", "other__model1"],
+            get_only_fields(BreadTestModel, ["other__get_text"]),
+        )
+
+    def test_reverse_one_to_one_rel(self):
+        self.assertEqual(
+            ["model2__label_model", "model2__text"],
+            get_only_fields(BreadLabelValueTestModel, ["model2__text"]),
+        )
+
+    def test_reverse_foreign_key(self):
+        self.assertEqual(
+            ["text"], get_only_fields(BreadTestModel2, ["text", "breadtestmodel"])
+        )
+
+    def test_method(self):
+        self.assertIsNone(get_only_fields(BreadTestModel, ["name", "get_name"]))
+
+
 class GetVerboseNameTest(TestCase):
     """Exercise get_verbose_name()"""
 
@@ -186,3 +312,29 @@ class GetVerboseNameTest(TestCase):
         ):
             with self.assertRaises(FieldDoesNotExist):
                 get_verbose_name(BreadLabelValueTestModel, field_name)
+
+
+class GetRelatedModelsTestCase(TestCase):
+    def test_simple_fields(self):
+        self.assertEqual([], get_related_models(BreadTestModel, ["name", "get_name"]))
+
+    def test_related_fields(self):
+        self.assertEqual(
+            [BreadTestModel2, BreadLabelValueTestModel],
+            get_related_models(
+                BreadTestModel,
+                ["other__text", "other__label_model__name", "other__get_text"],
+            ),
+        )
+
+    def test_reverse_relations(self):
+        self.assertEqual(
+            [BreadTestModel],
+            get_related_models(BreadTestModel2, ["breadtestmodel__name", "model1"]),
+        )
+
+    def test_search_lookup(self):
+        self.assertEqual(
+            [BreadTestModel2],
+            get_related_models(BreadTestModel, ["other__text__icontains"]),
+        )